@@ -0,0 +1,84 @@
+"""Benchmark of address.collapse(), queue of integer networks vs legacy list scanning.
+
+The legacy collapse_() scans the list for each network (quadratic),
+so legacy is measured on the first LEGACY_COUNT prefixes.
+
+Usage:
+    python -m benchmarks.bench_collapse [count]
+"""
+
+import random
+import sys
+import time
+from ipaddress import IPv4Network
+
+from cisco_acl import Address
+from cisco_acl import address
+from cisco_acl.types_ import LIpNet
+
+COUNT = 100_000
+LEGACY_COUNT = 2_000
+
+
+def collapse_legacy(addresses: list) -> list:
+    """Legacy address_base.collapse_(), scans the list of networks for each network."""
+    if not addresses:
+        return []
+    collapsed: LIpNet = []
+    ipnets: LIpNet = [o for a in addresses for o in a.ipnets()]
+    while ipnets:
+        ipnet = ipnets.pop()
+        if [o for o in ipnets if ipnet.subnet_of(o)]:
+            continue
+        supernet = ipnet.supernet()
+        subnets = set(supernet.subnets())
+        if subnets.issubset({*ipnets, ipnet}):
+            if supernet not in ipnets:
+                ipnets.insert(0, supernet)
+            continue
+        collapsed.append(ipnet)
+
+    addresses_ = []
+    for ipnet_ in collapsed:
+        addr_o = addresses[0].copy()
+        addr_o.note = None
+        addr_o.prefix = str(ipnet_)
+        addresses_.append(addr_o)
+    return sorted(addresses_)
+
+
+def generate_prefixes(count: int, seed: int = 0) -> list:
+    """Return random prefixes in 10.0.0.0/8, many of them are adjacent or overlapped."""
+    rand = random.Random(seed)
+    prefixes = []
+    for _ in range(count):
+        prefixlen = rand.choice([20, 24, 26, 28, 30, 31, 32, 32, 32])
+        network = 0x0A000000 | rand.getrandbits(24)
+        prefixes.append(str(IPv4Network((network, prefixlen), strict=False)))
+    return prefixes
+
+
+def measure(addresses: list, function) -> tuple:
+    """Return seconds and lines of the collapsed addresses."""
+    start = time.perf_counter()
+    collapsed = function(addresses)
+    return time.perf_counter() - start, [o.line for o in collapsed]
+
+
+def main(count: int = COUNT) -> None:
+    """Print seconds of collapse() of `count` random prefixes."""
+    addresses = [Address(s, platform="nxos") for s in generate_prefixes(count)]
+    addresses_legacy = addresses[:LEGACY_COUNT]
+    legacy_t, lines_legacy = measure(addresses_legacy, collapse_legacy)
+    seconds, lines = measure(addresses_legacy, address.collapse)
+    assert lines == lines_legacy, "different collapse() results"
+    print(f"prefixes: {len(addresses_legacy)}")
+    print(f"collapse() legacy: {legacy_t:.2f}s, queue: {seconds:.2f}s")
+
+    seconds, lines = measure(addresses, address.collapse)
+    print(f"prefixes: {len(addresses)}, collapsed: {len(lines)}")
+    print(f"collapse() queue: {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
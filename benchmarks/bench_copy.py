@@ -0,0 +1,72 @@
+"""Benchmark of Acl.copy() and Acl.delete_shadow(), structural copy vs data() re-parsing.
+
+The legacy copy() expands port ranges to lists in data() ("gt 1023" -> 64512 items),
+it runs out of memory on 10k ACEs, so legacy is measured on the first LEGACY_COUNT lines.
+
+Usage:
+    python -m benchmarks.bench_copy [count]
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from benchmarks.bench_parsers import generate_lines
+from cisco_acl import Acl
+from cisco_acl.base import Base
+
+COUNT = 10_000
+LEGACY_COUNT = 1_000
+
+
+def copy_legacy(self):
+    """Legacy Base.copy(), converts the object to data() and parses it again."""
+    kwargs = self.data()
+    return self.__class__(**kwargs)
+
+
+@contextmanager
+def legacy_copy() -> Iterator[None]:
+    """Context manager, Base.copy() is replaced by the legacy implementation."""
+    copy_ = Base.copy
+    Base.copy = copy_legacy  # type: ignore
+    try:
+        yield
+    finally:
+        Base.copy = copy_  # type: ignore
+
+
+def measure(lines: list) -> tuple:
+    """Return seconds of copy(), seconds of delete_shadow() and lines of the result."""
+    acl = Acl("ip access-list extended NAME", items=lines)
+    start = time.perf_counter()
+    acl.copy()
+    copy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    acl.delete_shadow()
+    shadow_time = time.perf_counter() - start
+    return copy_time, shadow_time, acl.line
+
+
+def main(count: int = COUNT) -> None:
+    """Print seconds of copy() and delete_shadow() of the ACL with `count` ACEs."""
+    lines = [s for s in generate_lines(count) if " addrgroup " not in s]
+    lines_legacy = lines[:LEGACY_COUNT]
+    with legacy_copy():
+        copy_legacy_t, shadow_legacy_t, line_legacy = measure(lines_legacy)
+    copy_t, shadow_t, line = measure(lines_legacy)
+    assert line == line_legacy, "different delete_shadow() results"
+    print(f"aces: {len(lines_legacy)}")
+    print(f"copy() legacy: {copy_legacy_t:.2f}s, structural: {copy_t:.2f}s")
+    print(f"delete_shadow() legacy: {shadow_legacy_t:.2f}s, structural: {shadow_t:.2f}s")
+
+    copy_t, shadow_t, _ = measure(lines)
+    print(f"aces: {len(lines)}")
+    print(f"copy() structural: {copy_t:.2f}s")
+    print(f"delete_shadow() structural: {shadow_t:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
@@ -0,0 +1,51 @@
+"""Benchmark of interning, construction time and memory of ACEs with and without interning.
+
+Usage:
+    python -m benchmarks.bench_interning [count]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_parsers import generate_lines
+from cisco_acl import Ace, cache
+from cisco_acl.types_ import LStr
+
+COUNT = 20_000
+
+
+def measure(lines: LStr) -> tuple:
+    """Return seconds and bytes per ACE to create ACEs."""
+    gc.collect()
+    start = time.perf_counter()
+    aces = [Ace(s) for s in lines]
+    seconds = time.perf_counter() - start
+    del aces
+    cache.clear_interning()
+
+    gc.collect()
+    tracemalloc.start()
+    aces = [Ace(s) for s in lines]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del aces
+    return seconds, size / len(lines)
+
+
+def main(count: int = COUNT) -> None:
+    """Print construction time and bytes per ACE, interning disabled and enabled."""
+    lines = [s for s in generate_lines(count) if " addrgroup " not in s]
+    seconds, size = measure(lines)
+    print(f"aces: {len(lines)}")
+    print(f"interning disabled: {seconds:.2f} sec, {size:,.0f} bytes/ACE")
+    with cache.interning(maxsize=count):
+        seconds, size = measure(lines)
+        stats = cache.interning_stats()
+    print(f"interning enabled:  {seconds:.2f} sec, {size:,.0f} bytes/ACE")
+    print(f"interning stats: {stats}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
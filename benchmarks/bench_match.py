@@ -0,0 +1,113 @@
+"""Benchmark of Acl.match(), compile time and lookup time of the decision tree.
+AclTable.match_batch() is measured on the first BATCH_COUNT lines if NumPy is installed.
+
+Usage:
+    python -m benchmarks.bench_match [count]
+"""
+
+import random
+import sys
+import time
+
+from cisco_acl import Acl, AclTable, acl_table
+
+COUNT = 50_000
+PACKETS = 10_000
+BATCH_COUNT = 1_000
+BATCH_PACKETS = 1_000_000
+
+
+def _address(rand: random.Random) -> str:
+    """Return random host, prefix or "any"."""
+    value = rand.random()
+    if value < 0.1:
+        return "any"
+    net = rand.choice([0x0A000000, 0xAC100000, 0xC0A80000]) | rand.getrandbits(16) << 8
+    if value < 0.5:
+        net |= rand.randrange(256)
+        prefixlen = 32
+    else:
+        prefixlen = rand.choice([16, 20, 24, 26, 28, 30])
+        net &= (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+    octets = ".".join(str(net >> i & 255) for i in (24, 16, 8, 0))
+    return f"host {octets}" if prefixlen == 32 else f"{octets}/{prefixlen}"
+
+
+def generate_lines(count: int, seed: int = 0) -> list:
+    """Return random ACE lines of a firewall-like ACL, the last line is "deny ip any any"."""
+    rand = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        protocol = rand.choice(["tcp", "tcp", "udp", "ip", "icmp"])
+        port = ""
+        if protocol in ["tcp", "udp"]:
+            port = rand.choice([f"eq {rand.randrange(1, 65535)}",
+                                f"eq {rand.choice([22, 53, 80, 443])}",
+                                f"range {rand.randrange(1, 1000)} {rand.randrange(1000, 65535)}",
+                                "gt 1023"])
+        srcaddr, dstaddr = _address(rand), _address(rand)
+        if srcaddr == dstaddr == "any":
+            dstaddr = "host 10.1.1.1"
+        action = rand.choice(["permit", "permit", "deny"])
+        lines.append(" ".join(s for s in [action, protocol, srcaddr, dstaddr, port] if s))
+    lines.append("deny ip any any")
+    return lines
+
+
+def generate_packets(count: int, seed: int = 1) -> list:
+    """Return random packets (src, dst, protocol, sport, dport)."""
+    rand = random.Random(seed)
+    packets = []
+    for _ in range(count):
+        src = rand.choice([rand.getrandbits(32), 0x0A000000 | rand.getrandbits(24)])
+        dst = 0x0A000000 | rand.getrandbits(24)
+        dport = rand.choice([22, 80, 443, rand.randrange(65536)])
+        packets.append((src, dst, rand.choice([1, 6, 17]), rand.randrange(65536), dport))
+    return packets
+
+
+def main(count: int = COUNT) -> None:
+    """Print compile time and average lookup time of the ACL with `count` ACEs."""
+    acl = Acl("ip access-list NAME", platform="nxos", items=generate_lines(count))
+    packets = generate_packets(PACKETS)
+
+    start = time.perf_counter()
+    acl.match(*packets[0])
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for packet in packets:
+        acl.match(*packet)
+    lookup_time = (time.perf_counter() - start) / len(packets)
+
+    print(f"aces: {len(acl.items)}")
+    print(f"compile: {compile_time:.2f}s")
+    print(f"lookup: {lookup_time * 1e6:.1f}us")
+    if acl_table.np is not None:
+        main_batch()
+
+
+def main_batch(count: int = BATCH_COUNT) -> None:
+    """Print flows per second of AclTable.match_batch() of the ACL with `count` ACEs."""
+    np = acl_table.np
+    lines = generate_lines(count)
+    acl = Acl("ip access-list NAME", platform="nxos", items=lines)
+    table = AclTable(acl)
+    packets = generate_packets(PACKETS)
+    columns = [np.array(s) for s in zip(*packets)]
+    repeat = BATCH_PACKETS // PACKETS
+    columns = [np.tile(a, repeat) for a in columns]
+
+    start = time.perf_counter()
+    table.match_batch(*columns)
+    batch_time = time.perf_counter() - start
+
+    items = acl.items
+    for idx, packet in zip(table.match_batch(*columns)[:1000].tolist(), packets):
+        assert items[idx] is acl.match(*packet), f"{packet=}"
+    print(f"batch aces: {len(acl.items)}, flows: {len(columns[0])}")
+    print(f"match_batch: {batch_time:.2f}s, {len(columns[0]) / batch_time:,.0f} flows/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
@@ -0,0 +1,49 @@
+"""Benchmark of memory usage, bytes per ACE and count of objects with __dict__.
+
+Usage:
+    python -m benchmarks.bench_memory [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.bench_parsers import generate_lines
+from cisco_acl import Acl
+
+COUNT = 10_000
+
+
+def count_dicts(acl: Acl) -> int:
+    """Return count of cisco_acl objects with __dict__ referenced by the ACL."""
+    count = 0
+    seen = set()
+    stack = [acl]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if hasattr(obj, "__dict__"):
+            count += 1
+        for child in gc.get_referents(obj):
+            if type(child).__module__.startswith("cisco_acl") or isinstance(child, (list, dict)):
+                stack.append(child)
+    return count
+
+
+def main(count: int = COUNT) -> None:
+    """Print bytes per ACE of the ACL with `count` ACEs."""
+    lines = [s for s in generate_lines(count) if " addrgroup " not in s]
+    gc.collect()
+    tracemalloc.start()
+    acl = Acl("ip access-list extended NAME", items=lines)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"aces: {len(lines)}")
+    print(f"memory: {size / len(lines):,.0f} bytes/ACE")
+    print(f"objects with __dict__: {count_dicts(acl):,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
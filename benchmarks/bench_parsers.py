@@ -0,0 +1,125 @@
+"""Benchmark of ACE line parsers, lines per second before and after the tokenizer.
+
+Usage:
+    python -m benchmarks.bench_parsers [count]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List
+
+from cisco_acl import helpers as h
+from cisco_acl import parsers
+from cisco_acl.port_name import all_known_names
+from cisco_acl.types_ import DStr, LStr
+
+COUNT = 100_000
+
+
+# =============================== legacy =============================
+
+
+def legacy_parse_ace_extended(line: str) -> DStr:
+    """Parse extended ACE line, regex is built on each call (before the tokenizer)."""
+    space = r"(?: )"
+    text = r"\S+"
+    addr = "|".join(
+        [
+            "any",
+            f"host {h.OCTETS}",
+            f"(?:object-group|addrgroup) {text}",
+            h.OCTETS + r"/\d+",
+            f"{h.OCTETS} {h.OCTETS}",
+        ]
+    )
+    regex = (
+        rf"^(\d+)?{space}?(permit|deny)({space}{text})?{space}({addr})( .+)?{space}({addr})( .+)?"
+    )
+    _items = h.re_find_t(regex, line)
+    if not _items:
+        return {}
+    items = [s.strip() for s in _items]
+    result = legacy_parse_dstport_option(items[-1])
+    return dict(
+        sequence=items[0],
+        action=items[1],
+        protocol=items[2],
+        srcaddr=items[3],
+        srcport=items[4],
+        dstaddr=items[5],
+        dstport=result["dstport"],
+        option=result["option"],
+    )
+
+
+def legacy_parse_dstport_option(line: str) -> DStr:
+    """Split destination-ports and options, known names are sorted on each call."""
+    dstports: LStr = []
+    options: LStr = []
+    known_names = all_known_names()
+    if items := line.split():
+        operator = items[0]
+        if operator in h.OPERATORS:
+            dstports.append(operator)
+            items = items[1:]
+            for id_, item in enumerate(items):
+                if item.isdigit() or item in known_names:
+                    dstports.append(item)
+                    continue
+                options = items[id_:]
+                break
+        else:
+            options.extend(items)
+    return dict(dstport=" ".join(dstports), option=" ".join(options))
+
+
+# ============================== helpers =============================
+
+
+def generate_lines(count: int, seed: int = 0) -> LStr:
+    """Return normalized extended ACE lines."""
+    rand = random.Random(seed)
+    addrs = ["any", "host 10.0.0.1", "10.0.0.0 0.0.0.255", "10.0.0.0 0.0.3.255",
+             "object-group NAME", "addrgroup NAME", "10.0.0.0/24"]
+    ports = ["", "eq 1", "eq 80 443", "range 1 1024", "gt 1023", "lt 1024", "neq 179"]
+    options = ["", "", "log", "established log", "ack"]
+    lines = []
+    for idx in range(count):
+        protocol = rand.choice(["ip", "tcp", "udp", "icmp", "6"])
+        srcport = dstport = ""
+        if protocol in ["tcp", "udp", "6"]:
+            srcport = rand.choice(ports)
+            dstport = rand.choice(ports)
+        words = [str((idx + 1) * 10), rand.choice(["permit", "deny"]), protocol,
+                 rand.choice(addrs), srcport, rand.choice(addrs), dstport, rand.choice(options)]
+        lines.append(" ".join(s for s in words if s))
+    return lines
+
+
+def measure(func: Callable, lines: List[str]) -> float:
+    """Return lines per second."""
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main(count: int = COUNT) -> None:
+    """Print lines per second of the legacy and the current parser."""
+    lines = generate_lines(count)
+    for line in lines:
+        legacy = legacy_parse_ace_extended(line)
+        current = parsers.parse_ace_extended(line)
+        assert legacy == current, f"{line=} {legacy=} {current=}"
+
+    before = measure(legacy_parse_ace_extended, lines)
+    after = measure(parsers.parse_ace_extended, lines)
+    print(f"lines: {count}")
+    print(f"before: {before:,.0f} lines/sec")
+    print(f"after:  {after:,.0f} lines/sec")
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
@@ -0,0 +1,80 @@
+"""Compare two JSON results of benchmarks/run.py.
+
+Prints time and peak memory of each case in the base and new results and the change in percent.
+Exit code is 1 if any case is slower (or uses more memory) than the base by more
+than `threshold`.
+
+Usage:
+    python -m benchmarks.compare base.json new.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, List
+
+from cisco_acl.types_ import DAny
+
+
+def load(path: str) -> DAny:
+    """Load results of benchmarks/run.py."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(base: DAny, new: DAny, threshold: float = 0.1) -> List[str]:
+    """Print the table of changes, return names of regressed cases.
+
+    :param base: Base results.
+    :param new: New results.
+    :param threshold: Allowed relative increase of time and peak memory, 0.1 - 10%.
+    :return: Regressions: "case.seconds", "case.peak_kib".
+    """
+    if base["meta"]["params"] != new["meta"]["params"]:
+        print("WARNING: results of different benchmark parameters", file=sys.stderr)
+
+    regressions: List[str] = []
+    print(f"{'case':<20} {'base s':>10} {'new s':>10} {'time':>8} "
+          f"{'base KiB':>11} {'new KiB':>11} {'memory':>8}")
+    for name, base_d in base["results"].items():
+        new_d = new["results"].get(name)
+        if new_d is None:
+            print(f"{name:<20} {'absent in new results':>30}")
+            continue
+        cells = [f"{name:<20}"]
+        for key, width in [("seconds", 10), ("peak_kib", 11)]:
+            change = _change(base_d[key], new_d[key])
+            mark = ""
+            if change > threshold:
+                regressions.append(f"{name}.{key}")
+                mark = "!"
+            cells.extend([f"{base_d[key]:>{width}}", f"{new_d[key]:>{width}}",
+                          f"{change:>+7.1%}{mark}"])
+        print(" ".join(cells))
+    return regressions
+
+
+def _change(base: float, new: float) -> float:
+    """Relative change of the value."""
+    if not base:
+        return 0.0
+    return (new - base) / base
+
+
+def main(argv: Any = None) -> None:
+    """Parse command line arguments, exit code 1 on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("base", help="base results JSON")
+    parser.add_argument("new", help="new results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative increase, default 0.1 (10%%)")
+    args = parser.parse_args(argv)
+
+    regressions = compare(load(args.base), load(args.new), threshold=args.threshold)
+    if regressions:
+        print(f"regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
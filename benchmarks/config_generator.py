@@ -0,0 +1,165 @@
+"""Deterministic generator of synthetic Cisco IOS and NX-OS configs for benchmarks.
+
+The same parameters and seed always generate the same config. Each ACL is applied to its own
+interface, every `remark_step` ACEs start with "remark === " (for group_by="=== ").
+
+Usage:
+    python -m benchmarks.config_generator [platform] [acls] [aces] > config.txt
+"""
+
+import random
+import sys
+from typing import Dict, List, Optional
+
+from cisco_acl.helpers import IOS
+
+NXOS = "nxos"
+PORT_MIX: Dict[str, float] = {"eq": 0.55, "range": 0.2, "gt": 0.1, "lt": 0.05, "neq": 0.1}
+PORTS = (22, 25, 53, 80, 123, 179, 443, 3389, 8080)
+PROTOCOLS = ("tcp", "tcp", "udp", "ip", "icmp")
+
+
+def generate_config(
+    platform: str = IOS,
+    acls: int = 10,
+    aces: int = 100,
+    addrgroups: int = 10,
+    addrgroup_size: int = 10,
+    addrgroup_share: float = 0.1,
+    nc_share: float = 0.05,
+    port_mix: Optional[Dict[str, float]] = None,
+    remark_step: int = 10,
+    seed: int = 0,
+) -> str:
+    """Return "show running-config" text with object-groups, ACLs and interfaces.
+
+    :param platform: Platform: "ios", "nxos".
+    :param acls: Count of ACLs.
+    :param aces: Count of ACEs in each ACL, without remarks.
+    :param addrgroups: Count of object-groups.
+    :param addrgroup_size: Count of addresses in each object-group.
+    :param addrgroup_share: Share of ACE addresses that refer to object-groups.
+    :param nc_share: Share of ACE addresses with non-contiguous wildcard.
+    :param port_mix: Weights of TCP/UDP port operators: "eq", "neq", "lt", "gt", "range".
+    :param remark_step: Remark before each `remark_step` ACEs, 0 - without remarks.
+    :param seed: Seed of the random generator.
+    :return: Config text.
+    """
+    if platform not in (IOS, NXOS):
+        raise ValueError(f"{platform=} expected {IOS!r} or {NXOS!r}")
+    rand = random.Random(seed)
+    mix = port_mix or PORT_MIX
+    lines: List[str] = ["hostname HOSTNAME", "!"]
+
+    names = [f"AG{i}" for i in range(1, addrgroups + 1)]
+    for name in names:
+        if platform == IOS:
+            lines.append(f"object-group network {name}")
+        else:
+            lines.append(f"object-group ip address {name}")
+        for idx in range(1, addrgroup_size + 1):
+            item = _addrgroup_item(rand, platform)
+            if platform == NXOS:
+                item = f"{idx * 10} {item}"
+            lines.append(f"  {item}")
+        lines.append("!")
+
+    for idx in range(1, acls + 1):
+        if platform == IOS:
+            lines.append(f"ip access-list extended ACL{idx}")
+        else:
+            lines.append(f"ip access-list ACL{idx}")
+        sequence = 0
+        for ace_idx in range(aces):
+            if remark_step and not ace_idx % remark_step:
+                sequence += 10
+                lines.append(f"  {sequence} remark === RULE{ace_idx // remark_step + 1}")
+            sequence += 10
+            ace = _ace(rand, platform, names, addrgroup_share, nc_share, mix)
+            lines.append(f"  {sequence} {ace}")
+        lines.append("!")
+
+    for idx in range(1, acls + 1):
+        direction = "in" if idx % 2 else "out"
+        lines.extend([f"interface Ethernet1/{idx}", f"  ip access-group ACL{idx} {direction}", "!"])
+    return "\n".join(lines) + "\n"
+
+
+# ============================= helpers ==============================
+
+
+def _ace(rand: random.Random, platform: str, names: List[str], addrgroup_share: float,
+         nc_share: float, mix: Dict[str, float]) -> str:
+    """Return ACE line without sequence number."""
+    action = "deny" if rand.random() < 0.1 else "permit"
+    protocol = rand.choice(PROTOCOLS)
+    items = [action, protocol]
+    for _ in ("src", "dst"):
+        if names and rand.random() < addrgroup_share:
+            keyword = "object-group" if platform == IOS else "addrgroup"
+            items.append(f"{keyword} {rand.choice(names)}")
+        else:
+            items.append(_address(rand, platform, nc_share=nc_share))
+        if protocol in ("tcp", "udp") and rand.random() < 0.5:
+            items.append(_port(rand, platform, mix))
+    if rand.random() < 0.05:
+        items.append("log")
+    return " ".join(items)
+
+
+def _address(rand: random.Random, platform: str, nc_share: float) -> str:
+    """Return "any", host, prefix or non-contiguous wildcard address."""
+    net = 0x0A000000 | rand.getrandbits(16) << 8
+    value = rand.random()
+    if value < nc_share:
+        return f"{_ip(net & 0xFFFF00FF)} 0.0.{rand.choice([3, 15, 255])}.0"
+    if value < 0.1 + nc_share:
+        return "any"
+    if value < 0.5:
+        net |= rand.randrange(256)
+        return f"host {_ip(net)}" if platform == IOS else f"{_ip(net)}/32"
+    prefixlen = rand.choice([16, 20, 24, 26, 28, 30])
+    net &= (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+    if platform == NXOS:
+        return f"{_ip(net)}/{prefixlen}"
+    return f"{_ip(net)} {_ip((1 << (32 - prefixlen)) - 1)}"
+
+
+def _addrgroup_item(rand: random.Random, platform: str) -> str:
+    """Return host or prefix item of the object-group, IOS prefix has a subnet mask."""
+    prefixlen = rand.choice([32, 32, 24, 28, 30])
+    net = (0x0A000000 | rand.getrandbits(24)) & (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+    if platform == NXOS:
+        return f"{_ip(net)}/{prefixlen}"
+    if prefixlen == 32:
+        return f"host {_ip(net)}"
+    return f"{_ip(net)} {_ip(0xFFFFFFFF << (32 - prefixlen) & 0xFFFFFFFF)}"
+
+
+def _ip(value: int) -> str:
+    """Return IPv4 address from integer."""
+    return ".".join(str(value >> i & 255) for i in (24, 16, 8, 0))
+
+
+def _port(rand: random.Random, platform: str, mix: Dict[str, float]) -> str:
+    """Return TCP/UDP port with the operator chosen by `mix` weights, NX-OS "eq" has 1 port."""
+    operator = rand.choices(list(mix), weights=list(mix.values()))[0]
+    if operator == "range":
+        port = rand.randrange(1, 60000)
+        return f"range {port} {port + rand.randrange(1, 5000)}"
+    if operator == "gt":
+        return f"gt {rand.choice([1023, 49151])}"
+    if operator == "lt":
+        return f"lt {rand.choice([1024, 49152])}"
+    count = rand.choice([1, 1, 2, 3]) if platform == IOS else 1
+    ports = sorted(rand.sample(PORTS, count))
+    return " ".join([operator, *[str(i) for i in ports]])
+
+
+if __name__ == "__main__":
+    ARGS = sys.argv[1:]
+    print(generate_config(
+        platform=ARGS[0] if ARGS else IOS,
+        acls=int(ARGS[1]) if len(ARGS) > 1 else 10,
+        aces=int(ARGS[2]) if len(ARGS) > 2 else 100,
+    ), end="")
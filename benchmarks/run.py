@@ -0,0 +1,170 @@
+"""Benchmark suite, parsing functions and Acl methods on a synthetic config.
+
+Each case is timed `repeat` times (the best time is reported), peak memory is measured
+in a separate run with tracemalloc. Results are printed as JSON, compare them between runs
+by benchmarks/compare.py. Acl methods are measured on ungrouped ACLs, methods that change
+ACLs get fresh copies before each run.
+
+Usage:
+    python -m benchmarks.run [--platform ios] [--acls 10] [--aces 200] [--repeat 3] [-o FILE]
+    python -m benchmarks.compare base.json new.json
+"""
+
+import argparse
+import json
+import platform as platform_
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple
+
+import cisco_acl
+from benchmarks.config_generator import IOS, NXOS, generate_config
+from cisco_acl import Acl
+from cisco_acl.types_ import DAny
+
+SCHEMA = 1
+
+
+class Case(NamedTuple):
+    """Benchmark case.
+
+    :param name: Name of the case in the results.
+    :param setup: Return argument of `func`, not timed.
+    :param func: Timed function.
+    :param items: Count of processed items (ACEs, addresses) for throughput.
+    """
+
+    name: str
+    setup: Callable[[], Any]
+    func: Callable[[Any], Any]
+    items: int
+
+
+def cases(config: str, platform: str) -> List[Case]:
+    """Return benchmark cases of the config."""
+    acls_: List[Acl] = cisco_acl.acls(config, platform=platform)
+    count = sum(len(o.items) for o in acls_)
+    addr_count = sum(len(o.items) for o in cisco_acl.addrgroups(config, platform=platform))
+    other = NXOS if platform == IOS else IOS
+
+    def copies() -> List[Acl]:
+        return [o.copy() for o in acls_]
+
+    def convert(items: List[Acl]) -> None:
+        for acl_o in items:
+            acl_o.platform = other
+
+    return [
+        Case("acls", lambda: config, lambda s: cisco_acl.acls(s, platform=platform), count),
+        Case("acls_group_by", lambda: config,
+             lambda s: cisco_acl.acls(s, platform=platform, group_by="=== "), count),
+        Case("aces", lambda: config, lambda s: cisco_acl.aces(s, platform=platform), count),
+        Case("addrgroups", lambda: config,
+             lambda s: cisco_acl.addrgroups(s, platform=platform), addr_count),
+        Case("shading", lambda: acls_, lambda l_: [o.shading() for o in l_], count),
+        Case("delete_shadow", copies, lambda l_: [o.delete_shadow() for o in l_], count),
+        Case("ungroup_ports", copies, lambda l_: [o.ungroup_ports() for o in l_], count),
+        Case("resequence", copies, lambda l_: [o.resequence() for o in l_], count),
+        Case("copy", lambda: acls_, lambda l_: [o.copy() for o in l_], count),
+        Case(f"platform_{other}", copies, convert, count),
+        Case("tcam_count", lambda: acls_, lambda l_: [o.tcam_count() for o in l_], count),
+    ]
+
+
+def measure(case: Case, repeat: int) -> DAny:
+    """Return the best time, throughput and peak memory of the case."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        arg = case.setup()
+        start = time.perf_counter()
+        case.func(arg)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    arg = case.setup()
+    tracemalloc.start()
+    try:
+        case.func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return dict(
+        seconds=round(seconds, 6),
+        items=case.items,
+        per_second=round(case.items / seconds, 1) if seconds else 0.0,
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def run(params: DAny, repeat: int = 3, names: Any = None) -> DAny:
+    """Run benchmark cases on the generated config.
+
+    :param params: Parameters of generate_config().
+    :param repeat: Count of timed runs of each case.
+    :param names: Names of the cases to run, default all.
+    :return: Results with metadata.
+    """
+    config = generate_config(**params)
+    results: Dict[str, DAny] = {}
+    for case in cases(config, platform=params["platform"]):
+        if names and case.name not in names:
+            continue
+        results[case.name] = measure(case, repeat)
+        print(f"{case.name}: {results[case.name]['seconds']:.3f}s", file=sys.stderr)
+    return dict(
+        schema=SCHEMA,
+        meta=dict(
+            date=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            python=platform_.python_version(),
+            implementation=platform_.python_implementation(),
+            machine=platform_.machine(),
+            params=params,
+            repeat=repeat,
+            config_lines=config.count("\n"),
+        ),
+        results=results,
+    )
+
+
+def main(argv: Any = None) -> None:
+    """Parse command line arguments, print or write results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--platform", choices=[IOS, NXOS], default=IOS)
+    parser.add_argument("--acls", type=int, default=10, help="count of ACLs")
+    parser.add_argument("--aces", type=int, default=200, help="count of ACEs in ACL")
+    parser.add_argument("--addrgroups", type=int, default=20, help="count of object-groups")
+    parser.add_argument("--addrgroup-size", type=int, default=20, help="addresses in group")
+    parser.add_argument("--addrgroup-share", type=float, default=0.1,
+                        help="share of ACE addresses with object-group")
+    parser.add_argument("--nc-share", type=float, default=0.05,
+                        help="share of ACE addresses with non-contiguous wildcard")
+    parser.add_argument("--port-mix", type=json.loads, default=None,
+                        help='weights of port operators, JSON: {"eq": 1, "range": 1}')
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each case")
+    parser.add_argument("--case", action="append", dest="names", help="run only this case")
+    parser.add_argument("-o", "--output", help="write JSON to the file, default stdout")
+    args = parser.parse_args(argv)
+
+    params = dict(
+        platform=args.platform,
+        acls=args.acls,
+        aces=args.aces,
+        addrgroups=args.addrgroups,
+        addrgroup_size=args.addrgroup_size,
+        addrgroup_share=args.addrgroup_share,
+        nc_share=args.nc_share,
+        port_mix=args.port_mix,
+        seed=args.seed,
+    )
+    text = json.dumps(run(params, repeat=args.repeat, names=args.names), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
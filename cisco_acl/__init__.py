@@ -3,27 +3,46 @@
 from cisco_acl.ace import Ace
 from cisco_acl.ace_group import AceGroup
 from cisco_acl.acl import Acl
+from cisco_acl.acl_table import AclTable
 from cisco_acl.addr_group import AddrGroup
 from cisco_acl.address import Address
 from cisco_acl.address_ag import AddressAg
 from cisco_acl.config_parser import ConfigParser
-from cisco_acl.functions import aces, acls, addrgroups, range_ports, range_protocols
+from cisco_acl.functions import (
+    DeviceAcls,
+    aces,
+    acls,
+    acls_many,
+    addrgroups,
+    range_ports,
+    range_protocols,
+)
+from cisco_acl.lazy_ace import LazyAce
 from cisco_acl.option import Option
+from cisco_acl.parse_cache import ParseCache
 from cisco_acl.port import Port
 from cisco_acl.port_name import PortName
 from cisco_acl.protocol import Protocol
 from cisco_acl.remark import Remark
+from cisco_acl.session import AclSession
+from cisco_acl.stats import ParseStats
 from cisco_acl.wildcard import Wildcard
 
 __all__ = [
     "Ace",
     "AceGroup",
     "Acl",
+    "AclSession",
+    "AclTable",
     "AddrGroup",
     "Address",
     "AddressAg",
     "ConfigParser",
+    "DeviceAcls",
+    "LazyAce",
     "Option",
+    "ParseCache",
+    "ParseStats",
     "Port",
     "PortName",
     "Protocol",
@@ -31,6 +50,7 @@ __all__ = [
     "Wildcard",
     "aces",
     "acls",
+    "acls_many",
     "addrgroups",
     "range_ports",
     "range_protocols",
@@ -5,12 +5,13 @@ from __future__ import annotations
 from functools import total_ordering
 from typing import List
 
-from cisco_acl import parsers, helpers as h
+from cisco_acl import cache, parsers, helpers as h, wildcard as wc
 from cisco_acl.ace_base import AceBase
 from cisco_acl.address import Address
 from cisco_acl.option import Option
 from cisco_acl.port import Port
 from cisco_acl.protocol import Protocol
+from cisco_acl.stats import timed
 from cisco_acl.types_ import DAny, OBool, DStr, OLStr
 
 
@@ -18,6 +19,8 @@ from cisco_acl.types_ import DAny, OBool, DStr, OLStr
 class Ace(AceBase):
     """ACE - Access Control Entry."""
 
+    __slots__ = ("_action", "_protocol", "_srcaddr", "_srcport", "_dstaddr", "_dstport", "_option")
+
     def __init__(self, line: str, **kwargs):
         """Init Ace.
 
@@ -62,12 +65,12 @@ class Ace(AceBase):
             ace.option -> Option("log")
         """
         self._action = ""
-        self._protocol = Protocol()
-        self._srcaddr = Address("any")
-        self._srcport = Port()
-        self._dstaddr = Address("any")
-        self._dstport = Port()
-        self._option = Option()
+        self._protocol = cache.intern(Protocol, "")
+        self._srcaddr = cache.intern(Address, "any")
+        self._srcport = cache.intern(Port, "")
+        self._dstaddr = cache.intern(Address, "any")
+        self._dstport = cache.intern(Port, "")
+        self._option = cache.intern(Option, "")
         super().__init__(**kwargs)  # platform, note, protocol_nr, port_nr, max_ncwb
         if srcaddr := kwargs.get("srcaddr") or {}:
             self._srcaddr = Address(**srcaddr)
@@ -200,26 +203,16 @@ class Ace(AceBase):
 
         self._sequence = h.init_int(ace_d["sequence"])
         self._action = h.init_ace_action(ace_d["action"])
-        self._srcaddr = Address(
-            ace_d["srcaddr"],
-            platform=self._platform,
-            version=self.version,
-            items=self._srcaddr.items,
-            max_ncwb=self.max_ncwb,
-        )
-        self._dstaddr = Address(
-            ace_d["dstaddr"],
-            platform=self._platform,
-            version=self.version,
-            items=self._dstaddr.items,
-            max_ncwb=self.max_ncwb,
-        )
-        protocol_o = Protocol(
-            line=ace_d["protocol"],
+        self._srcaddr = self._init_address(ace_d["srcaddr"], self._srcaddr)
+        self._dstaddr = self._init_address(ace_d["dstaddr"], self._dstaddr)
+        protocol_o = cache.intern(
+            Protocol,
+            ace_d["protocol"],
             platform=self._platform,
             version=self.version,
             port_nr=self._port_nr,
             protocol_nr=self._protocol_nr,
+            has_port=bool(ace_d["srcport"] or ace_d["dstport"]),
         )
         kwargs_port = dict(
             platform=self._platform,
@@ -227,11 +220,12 @@ class Ace(AceBase):
             protocol=protocol_o.name,
             port_nr=self._port_nr,
         )
-        self._srcport = Port(ace_d["srcport"], **kwargs_port)
-        self._dstport = Port(ace_d["dstport"], **kwargs_port)
-        protocol_o.has_port = bool(self._srcport.line or self._dstport.line)
+        self._srcport = cache.intern(Port, ace_d["srcport"], **kwargs_port)
+        self._dstport = cache.intern(Port, ace_d["dstport"], **kwargs_port)
         self._protocol = protocol_o
-        self._option = Option(ace_d["option"], platform=self._platform, version=self.version)
+        self._option = cache.intern(
+            Option, ace_d["option"], platform=self._platform, version=self.version
+        )
 
     @property
     def option(self) -> Option:
@@ -256,6 +250,7 @@ class Ace(AceBase):
         :param platform: Platform: "asa", "ios", "nxos". Default "ios".
         """
         self._platform = h.init_platform(platform=platform)
+        self._unshare()
         self._protocol.platform = self._platform
         self._srcaddr.platform = self._platform
         self._srcport.platform = self._platform
@@ -264,7 +259,7 @@ class Ace(AceBase):
         self._option.platform = self._platform
         data = self.data(uuid=True)
         obj = Ace(**data)
-        self.__dict__.update(obj.__dict__)
+        self._copy_slots(obj)
 
     @property
     def protocol(self) -> Protocol:
@@ -319,6 +314,7 @@ class Ace(AceBase):
             if self._srcaddr.addrgroup:
                 addrgroup = self._srcaddr.addrgroup
                 raise ValueError(f"mutually exclusive: type={type_!r}, {addrgroup=}")
+            self._unshare()
             self._protocol.line = "ip"
             self._srcport.line = ""
             self._dstaddr.line = "any"
@@ -327,7 +323,7 @@ class Ace(AceBase):
         self._type = type_
         data = self.data(uuid=True)
         obj = Ace(**data)
-        self.__dict__.update(obj.__dict__)
+        self._copy_slots(obj)
 
     # =========================== method =============================
 
@@ -481,6 +477,7 @@ class Ace(AceBase):
         if self.srcport.operator in ["eq", "neq"]:
             for item in self.srcport.items:
                 ace_o = self.copy()
+                ace_o._srcport = ace_o.srcport.copy()  # interned Port is shared
                 ace_o.srcport.items = [item]
                 _aces.append(ace_o)
         else:
@@ -491,6 +488,7 @@ class Ace(AceBase):
             if ace_o_.dstport.operator in ["eq", "neq"]:
                 for item in ace_o_.dstport.items:
                     ace_o = ace_o_.copy()
+                    ace_o._dstport = ace_o.dstport.copy()  # interned Port is shared
                     ace_o.dstport.items = [item]
                     aces.append(ace_o)
             else:
@@ -501,6 +499,30 @@ class Ace(AceBase):
 
     # =========================== helper =============================
 
+    @timed("address")
+    def _init_address(self, line: str, address: Address) -> Address:
+        """Init source or destination Address, address groups are not interned.
+
+        :param line: Address line.
+        :param address: Current Address object, items of address group are kept.
+        :return: Address object.
+        """
+        kwargs = dict(platform=self._platform, version=self.version, max_ncwb=self.max_ncwb)
+        if line.split(" ", 1)[0] in parsers.ADDRGROUPS:
+            return Address(line, items=address.items, **kwargs)
+        return cache.intern(Address, line, **kwargs)
+
+    def _unshare(self) -> None:
+        """Replace objects by copies before changing them, interned objects are shared."""
+        self._protocol = self._protocol.copy()
+        if self._srcaddr.type != "addrgroup":
+            self._srcaddr = self._srcaddr.copy()
+        self._srcport = self._srcport.copy()
+        if self._dstaddr.type != "addrgroup":
+            self._dstaddr = self._dstaddr.copy()
+        self._dstport = self._dstport.copy()
+        self._option = self._option.copy()
+
     @staticmethod
     def _check_parsed_elements(line: str, data: DStr) -> bool:
         """Check parsed ACE elements.
@@ -535,10 +557,9 @@ class Ace(AceBase):
                 if not (self.srcaddr.ipnet and other.srcaddr.ipnet):
                     return False
 
-        tops = other.srcaddr.ipnets()
-        bottoms = self._srcaddr.ipnets()
-        is_subnet = h.subnet_of(tops=tops, bottoms=bottoms)
-        return is_subnet
+        tops = other.srcaddr.wildcard_ints()
+        bottoms = self._srcaddr.wildcard_ints()
+        return wc.subnet_of(tops=tops, bottoms=bottoms)
 
     # noinspection DuplicatedCode
     def _shadow_of__dstaddr(self, other: Ace, skip: OLStr = None) -> bool:
@@ -556,9 +577,9 @@ class Ace(AceBase):
                 if not (self.dstaddr.ipnet and other.dstaddr.ipnet):
                     return False
 
-        tops = other.dstaddr.ipnets()
-        bottoms = self._dstaddr.ipnets()
-        return h.subnet_of(tops=tops, bottoms=bottoms)
+        tops = other.dstaddr.wildcard_ints()
+        bottoms = self._dstaddr.wildcard_ints()
+        return wc.subnet_of(tops=tops, bottoms=bottoms)
 
     def _shadow_of__protocol(self, other: Ace) -> bool:
         """Return True if self.protocol is in the shadow of the  other.protocol."""
@@ -568,19 +589,17 @@ class Ace(AceBase):
 
     def _shadow_of__srcport(self, other: Ace) -> bool:
         """Return True if self.srcport is in the shadow of the  other.srcport."""
-        if top := set(other.srcport.ports):
-            if bottom := set(self._srcport.ports):
-                diff = bottom.intersection(top)
-                return diff == bottom
+        if top := other.srcport.ranges:
+            if bottom := self._srcport.ranges:
+                return h.ranges_subset(tops=top, bottoms=bottom)
             return False
         return True
 
     def _shadow_of__dstport(self, other: Ace) -> bool:
         """Return True if self.dstport is in the shadow of the  other.dstport."""
-        if top := set(other.dstport.ports):
-            if bottom := set(self._dstport.ports):
-                diff = bottom.intersection(top)
-                return diff == bottom
+        if top := other.dstport.ranges:
+            if bottom := self._dstport.ranges:
+                return h.ranges_subset(tops=top, bottoms=bottom)
             return False
         return True
 
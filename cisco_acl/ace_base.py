@@ -11,6 +11,8 @@ from cisco_acl.wildcard import init_max_ncwb
 class AceBase(Base, ABC):
     """AceBase, parent of: Ace, Remark, AceGroup."""
 
+    __slots__ = ("_line", "_sequence", "_type", "_protocol_nr", "_port_nr", "max_ncwb")
+
     def __init__(self, **kwargs):
         """Init AceBase.
 
@@ -133,11 +135,6 @@ class AceBase(Base, ABC):
 
     # =========================== method =============================
 
-    def copy(self):
-        """Copy the self object."""
-        kwargs = self.data()
-        return self.__class__(**kwargs)
-
     @abstractmethod
     def data(self, uuid: bool = False) -> DAny:
         """Convert self object to the dictionary.
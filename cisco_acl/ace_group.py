@@ -19,6 +19,7 @@ from cisco_acl.ace import Ace, LAce
 from cisco_acl.ace_base import AceBase
 from cisco_acl.group import Group
 from cisco_acl.helpers import ACTIONS
+from cisco_acl.lazy_ace import LazyAce
 from cisco_acl.remark import Remark, LRemark
 from cisco_acl.types_ import DAny
 from cisco_acl.wildcard import init_max_ncwb
@@ -37,6 +38,8 @@ ULAce = Union[LAce, LRemark, LUAce]
 class AceGroup(AceBase, Group):
     """Group of ACE (Access Control Entry)."""
 
+    __slots__ = ("_items", "_name", "_group_by", "_lazy")
+
     def __init__(self, line: str = "", **kwargs):
         r"""Init AceGroup.
 
@@ -72,6 +75,11 @@ class AceGroup(AceBase, Group):
             until next Remark that also startswith `group_by`.
         :type group_by: str
 
+        :param lazy: ACE lines are parsed on the first access to ACE fields (LazyAce objects).
+            True  - ACE lines are not parsed, only sequence and action,
+            False - ACE lines are parsed to Ace objects (default).
+        :type lazy: bool
+
         Alternate way to get `name` and ACEs `items`, if `line` absent.
         :param str type: ACL type: "extended", "standard" (default "extended").
 
@@ -92,6 +100,7 @@ class AceGroup(AceBase, Group):
         """
         self._name = ""
         self._group_by = ""
+        self._lazy = bool(kwargs.get("lazy"))
         self._items: LUAce = []
         AceBase.__init__(self, **kwargs)  # platform, type, note, sequence, protocol_nr, port_nr
         Group.__init__(self)
@@ -160,6 +169,11 @@ class AceGroup(AceBase, Group):
                 raise TypeError(f"{item=} {str} expected")
         self._items = _items
 
+    @property
+    def lazy(self) -> bool:
+        """ACE lines are parsed on the first access to ACE fields (LazyAce objects)."""
+        return self._lazy
+
     @property
     def line(self) -> str:
         """Group of ACL config line."""
@@ -252,6 +266,7 @@ class AceGroup(AceBase, Group):
             name=self._name,
             items=[o.data(uuid=uuid) for o in self._items],
             group_by=self._group_by,
+            lazy=self._lazy,
             note=self.note,
             protocol_nr=self._protocol_nr,
             port_nr=self._port_nr,
@@ -417,7 +432,8 @@ class AceGroup(AceBase, Group):
         action = parsers.parse_action(line)["action"]
         if action == "remark":
             return Remark(line, platform=self._platform, version=self.version, type=self._type)
-        ace_o = Ace(
+        cls = LazyAce if self._lazy else Ace
+        ace_o = cls(
             line=line,
             platform=self._platform,
             version=self.version,
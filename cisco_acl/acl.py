@@ -6,20 +6,24 @@ This class implements most of the Python list methods: append(), extend(), sort(
 from __future__ import annotations
 
 from functools import total_ordering
-from typing import Dict, Generator, List, Union
+from typing import Dict, Generator, Iterable, List, Optional, Union
 
-from cisco_acl import helpers as h
+from cisco_acl import helpers as h, shadow
 from cisco_acl.ace import Ace, LAce
 from cisco_acl.ace_group import AceGroup, UAceg, UAce, LUAceg, OUAce, LUAce
+from cisco_acl.classifier import Classifier, UAddress
 from cisco_acl.helpers import DEF_INDENT
 from cisco_acl.remark import Remark
-from cisco_acl.types_ import LStr, UStr, DAny, DLStr, SStr, T2Str, OLStr
+from cisco_acl.stats import timed
+from cisco_acl.types_ import LStr, UStr, DAny, DLStr, T2Str, OLStr, StrInt
 
 
 @total_ordering
 class Acl(AceGroup):
     """ACL - Access Control List."""
 
+    __slots__ = ("_indent", "_input", "_output", "_classifier")
+
     def __init__(self, line: str = "", **kwargs):
         r"""Init Acl.
 
@@ -65,6 +69,11 @@ class Acl(AceGroup):
             until next Remark that also startswith `group_by`.
         :type group_by: str
 
+        :param lazy: ACE lines are parsed on the first access to ACE fields (LazyAce objects).
+            True  - ACE lines are not parsed, only sequence and action,
+            False - ACE lines are parsed to Ace objects (default).
+        :type lazy: bool
+
         Alternate way to get `name` and ACEs `items`, if `line` absent
         :param str type: ACL type: "extended", "standard" (default from `line`)
 
@@ -90,6 +99,7 @@ class Acl(AceGroup):
             acl.indent -> " "
         """
         self._items: LUAceg = []  # type: ignore
+        self._classifier: Optional[Classifier] = None  # compiled by match()
         items = kwargs.get("items") or []
         if "items" in kwargs:
             del kwargs["items"]
@@ -200,6 +210,7 @@ class Acl(AceGroup):
             else:
                 raise TypeError(f"{item=} {str} expected")
         self._items = _items
+        self._classifier = None
 
         if self._group_by:
             self.group(group_by=self._group_by)
@@ -257,6 +268,7 @@ class Acl(AceGroup):
         if platform == "nxos":
             self.ungroup_ports()
         self._platform = platform
+        self._classifier = None
         for item in self._items:
             item.platform = self._platform
 
@@ -357,6 +369,7 @@ class Acl(AceGroup):
             name=self._name,
             items=[o.data(uuid=uuid) for o in self._items],
             group_by=self._group_by,
+            lazy=self._lazy,
             note=self.note,
             max_ncwb=self.max_ncwb,
             indent=self._indent,
@@ -367,6 +380,7 @@ class Acl(AceGroup):
             data["uuid"] = self.uuid
         return data
 
+    @timed("group")
     def group(self, group_by: str) -> None:
         """Group ACEs to AceGroup by `group_by` startswith in remarks.
 
@@ -416,17 +430,71 @@ class Acl(AceGroup):
                     group_by=group_by,
                     protocol_nr=self._protocol_nr,
                     port_nr=self._port_nr,
+                    lazy=self._lazy,
                     name=group_name,
                     items=aces_items,
                 )
                 grouped_items.append(aceg_o)
         self._items = grouped_items
+        self._classifier = None
         self._group_by = group_by
 
-    def delete_shadow(self, skip: OLStr = None) -> DLStr:
+    def match(self, src: UAddress, dst: UAddress, protocol: StrInt, sport: int = 0,
+              dport: int = 0, flags: Optional[Iterable[str]] = None) -> Ace:
+        """Return the first ACE that matches the packet, implicit deny ACE if no ACE matched.
+
+        The lookup structure (decision tree) is compiled on the first call and recompiled
+        after ACL items are changed by the Acl methods. ACEs changed in place
+        (ace.srcaddr.line = ...) are not tracked, reassign acl.items to recompile.
+        Address groups without items do not match any packet.
+
+        :param src: Source address: "10.0.0.1", 167772161.
+        :type src: str, int, IPv4Address
+
+        :param dst: Destination address.
+        :type dst: str, int, IPv4Address
+
+        :param protocol: IP protocol name or number: "tcp", 6.
+        :type protocol: str, int
+
+        :param sport: Source TCP/UDP port number.
+        :type sport: int
+
+        :param dport: Destination TCP/UDP port number.
+        :type dport: int
+
+        :param flags: Packet flags, option keywords: "ack", "syn", "fragments", etc.
+            ACE with "established" matches packets with "ack" or "rst".
+        :type flags: str, List[str]
+
+        :return: The first matched Ace or Ace("deny ip any any").
+
+        :raises TypeError: If packet value has invalid type.
+        :raises ValueError: If packet value is invalid.
+
+        :example:
+            acl = Acl("ip access-list extended NAME\n"
+                      "  permit tcp host 10.0.0.1 any eq 22\n"
+                      "  permit icmp any any")
+            acl.match("10.0.0.1", "10.0.0.2", "tcp", 1024, 22)
+                -> Ace("permit tcp host 10.0.0.1 any eq 22")
+            acl.match("10.0.0.1", "10.0.0.2", "udp", 1024, 22)
+                -> Ace("deny ip any any")
+        """
+        classifier = self._classifier
+        if classifier is None:
+            aces = list(self._ungroup(self._items))
+            classifier = Classifier(aces=aces, implicit=self._implicit_deny())
+            self._classifier = classifier
+        return classifier.match(src=src, dst=dst, protocol=protocol, sport=sport, dport=dport,
+                                flags=flags)
+
+    def delete_shadow(self, skip: OLStr = None, engine: str = shadow.DEF_ENGINE) -> DLStr:
         """Remove ACEs in the shadow (in the bottom, without hits) from ACL.
 
         :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+        :param engine: Shadow detection engine: "index" (default) - indexed by action,
+            protocol and addresses, "pairwise" - compares all pairs of ACEs.
         :return: dict Shading (in the top) and shadow (in the bottom) ACEs.
 
         :example:
@@ -441,10 +509,10 @@ class Acl(AceGroup):
                       permit ip 10.0.0.0 0.0.0.3 any
                       permit ip host 10.0.0.4 any"
         """
-        shading_d: DLStr = self.shading(skip)
+        shading_d: DLStr = self.shading(skip=skip, engine=engine)
         if not shading_d:
             return {}
-        shadow: LStr = [s for ls in shading_d.values() for s in ls]
+        shadow_l: LStr = [s for ls in shading_d.values() for s in ls]
 
         acl_new: Acl = self.copy()
         acl_new.ungroup()
@@ -456,8 +524,8 @@ class Acl(AceGroup):
             idx = aces.index(top) + 1
             items_top = acl_new.items[:idx]
             items_bot = acl_new.items[idx:]
-            items_bot = [o for o in items_bot if o.line not in shadow]
-            shadow = [s for s in shadow if top != s]
+            items_bot = [o for o in items_bot if o.line not in shadow_l]
+            shadow_l = [s for s in shadow_l if top != s]
             acl_new.items = items_top + items_bot
 
         if self.group_by:
@@ -465,13 +533,15 @@ class Acl(AceGroup):
         self.items = acl_new.items
         return shading_d
 
-    def shadow_of(self, skip: OLStr = None) -> LStr:
+    def shadow_of(self, skip: OLStr = None, engine: str = shadow.DEF_ENGINE) -> LStr:
         """Return ACEs in the shadow (in the bottom).
 
         NOTES:
         - Method compare Ace with the same action. ACEs where self.action=="permit" and
             other.action=="deny" not taken into account (skip checking).
         :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+        :param engine: Shadow detection engine: "index" (default) - indexed by action,
+            protocol and addresses, "pairwise" - compares all pairs of ACEs.
         :return: ACEs in the shadow.
 
         :example:
@@ -482,11 +552,11 @@ class Acl(AceGroup):
                      permit ip host 10.0.0.4 any")
         acl.shadow_of() -> ["permit ip host 10.0.0.1 any", "permit ip host 10.0.0.2 any"]
         """
-        shading_d: DLStr = self.shading(skip)
-        shadow: LStr = [s for ls in shading_d.values() for s in ls]
-        return shadow
+        shading_d: DLStr = self.shading(skip=skip, engine=engine)
+        shadow_l: LStr = [s for ls in shading_d.values() for s in ls]
+        return shadow_l
 
-    def shading(self, skip: OLStr = None) -> DLStr:
+    def shading(self, skip: OLStr = None, engine: str = shadow.DEF_ENGINE) -> DLStr:
         """Return shading `in the top` and shadow `in the bottom` ACEs as dict.
 
         In dict key is shading rule, value shadow rules.
@@ -494,6 +564,8 @@ class Acl(AceGroup):
         - Method compare Ace with the same action. ACEs where self.action=="permit" and
             other.action=="deny" not taken into account (skip checking).
         :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+        :param engine: Shadow detection engine: "index" (default) - indexed by action,
+            protocol and addresses, "pairwise" - compares all pairs of ACEs.
 
         :return: Shading (in the top) and shadow (in the bottom) ACEs
         :raises ValueError: addrgroup without addresses, non-contiguous wildcard
@@ -509,17 +581,7 @@ class Acl(AceGroup):
         acl_o = self.copy()
         acl_o.ungroup()
         aces = [o for o in acl_o.items if isinstance(o, Ace)]
-
-        shading_d: DLStr = {}  # result
-        shadow: SStr = set()
-        for idx, ace_top in enumerate(aces):
-            aces_bottom = aces[idx + 1 :]
-            for ace_bottom in aces_bottom:
-                if ace_bottom.shadow_of(other=ace_top, skip=skip):
-                    if ace_bottom.line not in shadow:
-                        shading_d.setdefault(ace_top.line, []).append(ace_bottom.line)
-                    shadow.add(ace_bottom.line)
-        return shading_d
+        return shadow.shading(aces=aces, skip=skip, engine=engine)
 
     def tcam_count(self) -> int:
         """Calculate sum of ACEs. Also takes into account the addresses in the address group.
@@ -597,6 +659,15 @@ class Acl(AceGroup):
         items.append(self._name)
         return " ".join(items)
 
+    def _implicit_deny(self) -> Ace:
+        """Return implicit deny ACE in the end of ACL."""
+        line = "deny any" if self._type == "standard" else "deny ip any any"
+        return Ace(line, platform=self._platform, version=str(self.version), type=self._type)
+
+    def _items_changed(self) -> None:
+        """Reset compiled classifier after self.items list is changed in place."""
+        self._classifier = None
+
     def _parse_type_name(self, line: str) -> T2Str:
         """Parse ACL type and name from line "ip access-list "."""
         expected = "ip access-list "
@@ -625,6 +696,12 @@ class Acl(AceGroup):
             h.check_name(name)
         return _type, name
 
+    def _slots_data(self) -> DAny:
+        """Return all initialized attributes, compiled classifier is not copied or pickled."""
+        data = super()._slots_data()
+        data["_classifier"] = None
+        return data
+
     def _ungroup(self, items: list) -> Generator:
         """Ungroup AceGroup to a flat list of items."""
         for item in items:
@@ -640,3 +717,14 @@ class Acl(AceGroup):
 LAcl = List[Acl]
 UAces = Union[str, LStr, dict, DAny, Generator, Ace, Remark, AceGroup]
 LUAces = List[UAces]
+
+
+def ungroup_aces(items: list) -> LAce:
+    """Return Ace objects of the items, Remarks are skipped, AceGroups are ungrouped."""
+    aces_: LAce = []
+    for item in items:
+        if isinstance(item, Ace):
+            aces_.append(item)
+        elif isinstance(item, AceGroup):
+            aces_.extend(ungroup_aces(item.items))
+    return aces_
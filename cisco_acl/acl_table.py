@@ -0,0 +1,265 @@
+"""AclTable - columnar representation of Acl, parallel NumPy arrays (optional dependency).
+
+Each row is a combination of source address, source port range, destination address
+and destination port range of one Ace. Address group is expanded to the members,
+multiple ports are expanded to (lo, hi) intervals. Rows are in the order of the ACL,
+row is linked to the Ace by the ace_idx column (index in AclTable.aces)
+and to the top level item by the item_idx column (index in Acl.items).
+
+:example:
+    acl = Acl("ip access-list extended NAME\\n"
+              "  10 permit tcp host 10.0.0.1 any eq 22 443\\n"
+              "  20 deny ip any any")
+    table = AclTable(acl)
+    len(table) -> 3
+    table.dport_lo -> array([22, 443, 0], dtype=uint16)
+    table.ace(1).line -> "10 permit tcp host 10.0.0.1 any eq 22 443"
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from typing import Any, Dict, List
+
+from cisco_acl.ace import Ace, LAce
+from cisco_acl.acl import Acl, ungroup_aces
+from cisco_acl.types_ import LInt, TStr
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+ACTIONS = {"deny": 0, "permit": 1}
+BLOCK_FLOWS = 4096  # count of flows in the block of match_batch()
+BLOCK_ROWS = 256  # count of rows in the block of match_batch()
+PORT_ANY = (0, 65535)
+FLAGS = ("ack", "established", "fin", "fragments", "psh", "rst", "syn", "urg")
+FLAG_BITS: Dict[str, int] = {s: 1 << i for i, s in enumerate(FLAGS)}
+FLAG_OTHER = 1 << 15  # any other option: "dscp", "precedence", "ttl", etc.
+FLAG_ESTABLISHED = FLAG_BITS["established"]
+FLAGS_ESTABLISHED = FLAG_BITS["ack"] | FLAG_BITS["rst"]  # packet flags of established session
+COLUMNS: Dict[str, str] = {
+    "action": "uint8",
+    "protocol": "uint8",
+    "src_net": "uint32",
+    "src_wild": "uint32",
+    "sport_lo": "uint16",
+    "sport_hi": "uint16",
+    "dst_net": "uint32",
+    "dst_wild": "uint32",
+    "dport_lo": "uint16",
+    "dport_hi": "uint16",
+    "flags": "uint16",
+    "sequence": "uint32",
+    "item_idx": "int32",
+    "ace_idx": "int32",
+}
+
+
+class AclTable:  # pylint: disable=too-many-instance-attributes
+    """Columnar representation of Acl, parallel NumPy arrays.
+
+    Columns:
+        action - 0 "deny", 1 "permit"
+        protocol - IP protocol number, 0 - "ip" (any protocol)
+        src_net, src_wild - source network and wildcard mask as integers
+        sport_lo, sport_hi - source port range, (0, 65535) if ACE has no ports
+        dst_net, dst_wild - destination network and wildcard mask as integers
+        dport_lo, dport_hi - destination port range, (0, 65535) if ACE has no ports
+        flags - bitmask of option flags FLAG_BITS, FLAG_OTHER for any other flag
+        sequence - ACE sequence number, 0 if not set
+        item_idx - index of the item in Acl.items (AceGroup for grouped ACEs)
+        ace_idx - index of the Ace in AclTable.aces
+    """
+
+    def __init__(self, acl: Acl):
+        """Init AclTable.
+
+        :param acl: Acl object, Remark items are skipped, AceGroup items are ungrouped.
+        :type acl: Acl
+
+        :raises ImportError: If NumPy is not installed.
+        :raises TypeError: If acl is not Acl.
+        """
+        if np is None:
+            raise ImportError("AclTable requires numpy, install: pip install cisco-acl[numpy]")
+        if not isinstance(acl, Acl):
+            raise TypeError(f"{acl=} {Acl} expected")
+        self.acl: Acl = acl
+        self.aces: LAce = []
+        columns: Dict[str, LInt] = {s: [] for s in COLUMNS}
+        for item_idx, item in enumerate(acl.items):
+            for ace in ungroup_aces([item]):
+                self._add_ace(ace=ace, item_idx=item_idx, columns=columns)
+
+        self.action: Any = None
+        self.protocol: Any = None
+        self.src_net: Any = None
+        self.src_wild: Any = None
+        self.sport_lo: Any = None
+        self.sport_hi: Any = None
+        self.dst_net: Any = None
+        self.dst_wild: Any = None
+        self.dport_lo: Any = None
+        self.dport_hi: Any = None
+        self.flags: Any = None
+        self.sequence: Any = None
+        self.item_idx: Any = None
+        self.ace_idx: Any = None
+        for name, dtype in COLUMNS.items():
+            setattr(self, name, np.array(columns[name], dtype=dtype))
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(rows={len(self)}, aces={len(self.aces)})"
+
+    def __len__(self) -> int:
+        """Count of rows."""
+        return len(self.action)
+
+    # =========================== property ===========================
+
+    @property
+    def columns(self) -> TStr:
+        """Names of the columns."""
+        return tuple(COLUMNS)
+
+    # =========================== method =============================
+
+    def ace(self, row: int) -> Ace:
+        """Return Ace of the row.
+
+        :param row: Row index.
+        :type row: int
+
+        :return: Ace object.
+        """
+        return self.aces[int(self.ace_idx[row])]
+
+    def data(self) -> Dict[str, Any]:
+        """Return columns as dictionary {name: array}."""
+        return {s: getattr(self, s) for s in COLUMNS}
+
+    def match_batch(self, src, dst, protocol, sport=None, dport=None, flags=None,
+                    block_size: int = BLOCK_FLOWS):
+        """Return index of the first matching item in Acl.items for each flow, -1 if not matched.
+
+        Flows are processed in blocks of `block_size` flows and BLOCK_ROWS rows,
+        each block is a vectorized comparison of the flows and rows columns.
+        Wildcards (including non-contiguous) are compared as (ip & ~wildmask) == network.
+        Flows matched in a block of rows are not compared with the next rows.
+
+        :param src: Source addresses, array of uint32.
+        :param dst: Destination addresses, array of uint32.
+        :param protocol: IP protocol numbers, array of uint8.
+        :param sport: Source TCP/UDP ports, array of uint16 (default 0).
+        :param dport: Destination TCP/UDP ports, array of uint16 (default 0).
+        :param flags: Packet flags, bitmask FLAG_BITS, array of uint16 (default 0).
+            Row with "established" matches packets with "ack" or "rst",
+            row with other flags matches packets that have all the flags.
+        :param block_size: Count of flows in the block.
+        :type block_size: int
+
+        :return: Array of int32, index in Acl.items (index of AceGroup for grouped ACL).
+
+        :raises ValueError: If arrays have different length or block_size < 1.
+
+        :example:
+            acl = Acl("ip access-list extended NAME\\n"
+                      "  permit tcp any any eq 22\\n"
+                      "  permit icmp any any")
+            table = AclTable(acl)
+            table.match_batch(src=np.array([1, 2], dtype=np.uint32),
+                              dst=np.array([3, 4], dtype=np.uint32),
+                              protocol=np.array([6, 17], dtype=np.uint8),
+                              dport=np.array([22, 22], dtype=np.uint16)) -> array([0, -1])
+        """
+        src = np.asarray(src, dtype=np.uint32)
+        count = len(src)
+        dst = _init_flows(dst, count=count, dtype=np.uint32, name="dst")
+        protocol = _init_flows(protocol, count=count, dtype=np.uint8, name="protocol")
+        sport = _init_flows(sport, count=count, dtype=np.uint16, name="sport")
+        dport = _init_flows(dport, count=count, dtype=np.uint16, name="dport")
+        flags = _init_flows(flags, count=count, dtype=np.uint16, name="flags")
+        if block_size < 1:
+            raise ValueError(f"{block_size=} expected >= 1")
+
+        result = np.full(count, -1, dtype=np.int32)
+        src_mask = ~self.src_wild
+        dst_mask = ~self.dst_wild
+        required = self.flags & np.uint16(~FLAG_ESTABLISHED & 0xFFFF)
+        established = (self.flags & np.uint16(FLAG_ESTABLISHED)) != 0
+
+        for start in range(0, count, block_size):
+            idxs = np.arange(start, min(start + block_size, count))
+            flows = [a[idxs, None] for a in (src, dst, protocol, sport, dport, flags)]
+            for row in range(0, len(self), BLOCK_ROWS):
+                if not len(idxs):
+                    break
+                rows = slice(row, row + BLOCK_ROWS)
+                src_, dst_, protocol_, sport_, dport_, flags_ = flows
+
+                matched = (src_ & src_mask[rows]) == self.src_net[rows]
+                matched &= (dst_ & dst_mask[rows]) == self.dst_net[rows]
+                matched &= (self.protocol[rows] == 0) | (self.protocol[rows] == protocol_)
+                matched &= (self.sport_lo[rows] <= sport_) & (sport_ <= self.sport_hi[rows])
+                matched &= (self.dport_lo[rows] <= dport_) & (dport_ <= self.dport_hi[rows])
+                if required[rows].any():
+                    matched &= (required[rows] & ~flags_) == 0
+                if established[rows].any():
+                    matched &= ~established[rows] | ((flags_ & np.uint16(FLAGS_ESTABLISHED)) != 0)
+
+                hits = matched.any(axis=1)
+                if hits.any():
+                    firsts = matched.argmax(axis=1)[hits] + row
+                    result[idxs[hits]] = self.item_idx[firsts]
+                    idxs = idxs[~hits]
+                    flows = [a[~hits] for a in flows]
+        return result
+
+    # =========================== helper =============================
+
+    def _add_ace(self, ace: Ace, item_idx: int, columns: Dict[str, LInt]) -> None:
+        """Add rows of the Ace to the columns."""
+        ace_idx = len(self.aces)
+        self.aces.append(ace)
+        action = ACTIONS[ace.action]
+        protocol = ace.protocol.number
+        flags = _flags_bitmask(ace.option.flags)
+        sequence = ace.sequence
+        srcaddrs = ace.srcaddr.wildcard_ints()
+        dstaddrs = ace.dstaddr.wildcard_ints()
+        sports = list(ace.srcport.ranges) or [PORT_ANY]
+        dports = list(ace.dstport.ranges) or [PORT_ANY]
+
+        for src, sport, dst, dport in product(srcaddrs, sports, dstaddrs, dports):
+            row = (action, protocol, *src, *sport, *dst, *dport,
+                   flags, sequence, item_idx, ace_idx)
+            for name, value in zip(COLUMNS, row):
+                columns[name].append(value)
+
+
+# ============================= helpers ==============================
+
+
+def _init_flows(values, count: int, dtype, name: str):
+    """Init array of the flows values, zeros if values is None.
+
+    :raises ValueError: If length of values is not equal to count.
+    """
+    if values is None:
+        return np.zeros(count, dtype=dtype)
+    values = np.asarray(values, dtype=dtype)
+    if values.shape != (count,):
+        raise ValueError(f"{name} shape={values.shape} expected ({count},)")
+    return values
+
+
+def _flags_bitmask(flags: List[str]) -> int:
+    """Return bitmask of option flags, FLAG_OTHER for unknown flags."""
+    bitmask = 0
+    for flag in flags:
+        bitmask |= FLAG_BITS.get(flag, FLAG_OTHER)
+    return bitmask
@@ -7,23 +7,37 @@ Group of AddressAg addresses configured in "object-group network" (ios) or
 from __future__ import annotations
 
 import logging
+import operator
 from functools import total_ordering
 from ipaddress import IPv4Network
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Union
 
 from cisco_acl import parsers, helpers as h
 from cisco_acl.address_ag import AddressAg, OAddressAg, LUSAddressAg
 from cisco_acl.address_ag import LAddressAg
 from cisco_acl.base import Base
 from cisco_acl.group import Group
-from cisco_acl.types_ import LStr, LIpNet, DAny
-from cisco_acl.wildcard import init_max_ncwb
+from cisco_acl.prefix_trie import PrefixTrie
+from cisco_acl.stats import timed
+from cisco_acl.types_ import LStr, LIpNet, LT2Int, DAny, T2Int
+from cisco_acl.wildcard import Wildcard, init_max_ncwb
+
+
+class _Index(NamedTuple):
+    """Lookup index of the AddrGroup items, built on the first lookup."""
+
+    trie: PrefixTrie  # wildcards of the items, values are indexes in items
+    members: Set[AddressAg]  # items for equality check
+    valid: int  # count of the first items with IPv4Network, __contains__ raises on the next
+    items: tuple  # snapshot of AddrGroup.items, to detect changes by the list methods
 
 
 @total_ordering
 class AddrGroup(Base, Group):
     """AddrGroup."""
 
+    __slots__ = ("_indent", "_items", "_line", "_name", "max_ncwb", "_index")
+
     def __init__(self, line: str = "", **kwargs):
         r"""Init AddrGroup.
 
@@ -64,6 +78,7 @@ class AddrGroup(Base, Group):
         self._line: str = ""
         self._name = ""
         self._items: LAddressAg = []
+        self._index: Optional[_Index] = None  # built by lookups
         Base.__init__(self, **kwargs)  # platform, note
         Group.__init__(self)
         self._indent = h.init_indent(**kwargs)
@@ -92,30 +107,31 @@ class AddrGroup(Base, Group):
         return False
 
     def __contains__(self, other: UAddrGr) -> bool:
-        """__contains__."""
+        """__contains__.
+
+        Prefix `other` (or AddrGroup with prefix items) is looked up in the prefix trie,
+        other addresses are compared with each item.
+        """
         if isinstance(other, AddressAg):
-            if other in self._items:
+            wildcards = _prefix_ints([other])
+        elif isinstance(other, AddrGroup):
+            wildcards = _prefix_ints(other.items)
+        else:
+            wildcards = None
+        if not wildcards:
+            return self._contains_items(other)
+
+        index = self._get_index()
+        first = other if isinstance(other, AddressAg) else other.items[0]
+        if first in index.members:
+            return True
+        for wildcard in wildcards:
+            if [i for i in index.trie.covering(wildcard) if i < index.valid]:
                 return True
-            for item in self._items:
-                if not isinstance(item, AddressAg):
-                    raise TypeError(f"{item=} {AddressAg} expected")
-                if other in item:
-                    return True
-            return False
-
-        if isinstance(other, AddrGroup):
-            for other_item in other.items:
-                if not isinstance(other_item, (AddressAg, AddrGroup)):
-                    raise TypeError(f"{other_item=} {AddressAg} expected")
-                if other_item in self._items:
-                    return True
-                for item in self._items:
-                    if not isinstance(item, AddressAg):
-                        raise TypeError(f"{item=} {AddressAg} expected")
-                    if other in item:
-                        return True
-            return False
-        raise TypeError(f"{other=} {UAddrGr} expected")
+        if index.valid < len(self._items):
+            item = self._items[index.valid]
+            raise TypeError(f"{item=} {AddressAg} with {IPv4Network} expected")
+        return False
 
     # =========================== property ===========================
 
@@ -166,6 +182,7 @@ class AddrGroup(Base, Group):
             else:
                 raise TypeError(f"{item=} {str} expected")
         self._items = _items
+        self._index = None
 
     @property
     def line(self) -> str:
@@ -292,6 +309,47 @@ class AddrGroup(Base, Group):
         # ios
         return f"object-group network {self._name}"
 
+    def covering(self, address: Union[str, AddressAg]) -> LAddressAg:
+        """Items that match all addresses of the `address`, lookup in the prefix trie.
+
+        Items without wildcard (address group) are skipped.
+
+        :param address: AddressAg object or address line.
+        :type address: str, AddressAg
+
+        :return: Items in the order of self.items.
+
+        :example:
+            self.items: [AddressAg("10.0.0.0/24"), AddressAg("10.0.0.0/30"),
+                         AddressAg("10.0.1.0/24")]
+            address: "host 10.0.0.1"
+            return: [AddressAg("10.0.0.0/24"), AddressAg("10.0.0.0/30")]
+        """
+        wildcard = self._address_ints(address)
+        idxs = self._get_index().trie.covering(wildcard)
+        return [self._items[i] for i in sorted(set(idxs))]
+
+    def overlapping(self, address: Union[str, AddressAg]) -> LAddressAg:
+        """Items that match at least one address of the `address`, lookup in the prefix trie.
+
+        Items without wildcard (address group) are skipped.
+
+        :param address: AddressAg object or address line.
+        :type address: str, AddressAg
+
+        :return: Items in the order of self.items.
+
+        :example:
+            self.items: [AddressAg("10.0.0.0/24"), AddressAg("10.0.0.0/30"),
+                         AddressAg("10.0.1.0/24")]
+            address: "10.0.0.0/23"
+            return: [AddressAg("10.0.0.0/24"), AddressAg("10.0.0.0/30"),
+                     AddressAg("10.0.1.0/24")]
+        """
+        wildcard = self._address_ints(address)
+        idxs = self._get_index().trie.overlapping(wildcard)
+        return [self._items[i] for i in sorted(set(idxs))]
+
     def ipnets(self) -> LIpNet:
         """List of IPv4Network from all addresses in address group.
 
@@ -376,6 +434,65 @@ class AddrGroup(Base, Group):
 
     # =========================== helper =============================
 
+    def _address_ints(self, address: Union[str, AddressAg]) -> T2Int:
+        """Return (prefix, wildcard mask) integers of the address.
+
+        :raises TypeError: If address is not str or AddressAg with wildcard.
+        """
+        if isinstance(address, str):
+            address = AddressAg(address, platform=self._platform, max_ncwb=self.max_ncwb)
+        if not isinstance(address, AddressAg):
+            raise TypeError(f"{address=} {AddressAg} expected")
+        if address.type == "addrgroup":
+            raise TypeError(f"{address=} {Wildcard} expected")
+        return address.wildcard_ints()[0]
+
+    def _contains_items(self, other: UAddrGr) -> bool:
+        """__contains__, compare other with each item."""
+        if isinstance(other, AddressAg):
+            if other in self._items:
+                return True
+            for item in self._items:
+                if not isinstance(item, AddressAg):
+                    raise TypeError(f"{item=} {AddressAg} expected")
+                if other in item:
+                    return True
+            return False
+
+        if isinstance(other, AddrGroup):
+            for other_item in other.items:
+                if not isinstance(other_item, (AddressAg, AddrGroup)):
+                    raise TypeError(f"{other_item=} {AddressAg} expected")
+                if other_item in self._items:
+                    return True
+                for item in self._items:
+                    if not isinstance(item, AddressAg):
+                        raise TypeError(f"{item=} {AddressAg} expected")
+                    if other in item:
+                        return True
+            return False
+        raise TypeError(f"{other=} {UAddrGr} expected")
+
+    def _get_index(self) -> _Index:
+        """Return lookup index of the items, build it if items are changed.
+
+        Items are compared with the snapshot of the index by identity, so any change of
+        self.items (append, remove, items[i] = ..., etc.) rebuilds the index.
+        Items changed in place (item.line = ...) are not detected,
+        reassign self.items to rebuild the index.
+        """
+        index = self._index
+        items = self._items
+        if (index is None or len(index.items) != len(items)
+                or not all(map(operator.is_, index.items, items))):
+            index = self._index = _build_index(items)
+        return index
+
+    def _items_changed(self) -> None:
+        """Reset lookup index after self.items list is changed in place."""
+        self._index = None
+
+    @timed("address")
     def _line_to_address(self, line: str) -> OAddressAg:
         """Convert config line to AddressAg object.
 
@@ -397,7 +514,43 @@ class AddrGroup(Base, Group):
         addr_o = AddressAg(line=line, platform=self._platform, max_ncwb=self.max_ncwb)
         return addr_o
 
+    def _slots_data(self) -> DAny:
+        """Return all initialized attributes, lookup index is not copied or pickled."""
+        data = super()._slots_data()
+        data["_index"] = None
+        return data
+
+
+# ============================= helpers ==============================
+
+
+def _build_index(items: list) -> _Index:
+    """Build lookup index of the AddrGroup items."""
+    trie = PrefixTrie()
+    valid = -1
+    for idx, item in enumerate(items):
+        is_address = isinstance(item, AddressAg)
+        if is_address and item.type != "addrgroup":
+            trie.insert(item.wildcard_ints()[0], idx)
+        if valid < 0 and not (is_address and isinstance(item.ipnet, IPv4Network)):
+            valid = idx
+    if valid < 0:
+        valid = len(items)
+    members = {o for o in items if isinstance(o, AddressAg)}
+    return _Index(trie=trie, members=members, valid=valid, items=tuple(items))
+
+
+def _prefix_ints(addresses: list) -> Optional[LT2Int]:
+    """Return (prefix, wildcard mask) integers, None if any address is not a prefix AddressAg."""
+    wildcards: LT2Int = []
+    for address in addresses:
+        if not isinstance(address, AddressAg) or not isinstance(address.ipnet, IPv4Network):
+            return None
+        wildcards.extend(address.wildcard_ints())
+    return wildcards
+
 
 DAddrGroup = Dict[str, AddrGroup]
 LAddrGroup = List[AddrGroup]
+DLAddrGroup = Dict[str, LAddrGroup]
 UAddrGr = Union[AddressAg, AddrGroup]
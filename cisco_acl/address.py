@@ -14,6 +14,8 @@ from cisco_acl.types_ import LStr, DAny, LDAny
 class Address(AddressBase):
     """Address - Source or destination address in ACE."""
 
+    __slots__ = ()
+
     def __init__(self, line: str, **kwargs):
         """Init Address.
 
@@ -22,6 +22,8 @@ class AddressAg(AddressBase):
     A "group-object" item of "object-group network " command.
     """
 
+    __slots__ = ("_sequence",)
+
     def __init__(self, line: str, **kwargs):
         """Init AddressAg.
 
@@ -183,7 +185,7 @@ class AddressAg(AddressBase):
 
         data = self.data(uuid=True)
         obj = AddressAg(**data)
-        self.__dict__.update(obj.__dict__)
+        self._copy_slots(obj)
 
     @property
     def sequence(self) -> int:
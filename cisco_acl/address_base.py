@@ -2,13 +2,15 @@
 
 import re
 from abc import abstractmethod
+from collections import Counter, deque
 from functools import total_ordering
-from ipaddress import IPv4Network
-from typing import Optional
+from ipaddress import IPv4Address, IPv4Network
+from typing import Deque, Optional
 
 from cisco_acl import helpers as h
 from cisco_acl.base import Base
-from cisco_acl.types_ import DAny, OIpNet, LIpNet, LStr
+from cisco_acl import wildcard as wc
+from cisco_acl.types_ import DAny, OIpNet, LIpNet, LStr, LT2Int, T2Int
 from cisco_acl.wildcard import Wildcard, init_max_ncwb
 
 
@@ -16,6 +18,9 @@ from cisco_acl.wildcard import Wildcard, init_max_ncwb
 class AddressBase(Base):
     """AddressBase, parent of: Address, AddressAg."""
 
+    __slots__ = ("_type", "_addrgroup", "_items", "_wildcard", "max_ncwb")
+    _clone_shared = ("_wildcard",)  # Wildcard is replaced, not changed in place
+
     def __init__(self, **kwargs):
         """Init AddressBase.
 
@@ -247,8 +252,14 @@ class AddressBase(Base):
             else:
                 self._type = "wildcard"
 
+        # items of address group can be shared by other addresses, copy before changing
+        items = []
         for item in self._items:
-            item.platform = self._platform
+            item_ = item.copy()
+            item_.uuid = item.uuid
+            item_.platform = self._platform
+            items.append(item_)
+        self._items = items
 
         data = self.data(uuid=True)
         self.__init__(**data)  # type: ignore
@@ -379,11 +390,11 @@ class AddressBase(Base):
         ipnets: LIpNet = []
         if self.type == "addrgroup":
             for item in self._items:
-                wildcard_o = getattr(item, "_wildcard")
+                # noinspection PyProtectedMember
+                wildcard_o = item._wildcard
                 if not isinstance(wildcard_o, Wildcard):
                     raise TypeError(f"{self.line} {item=} {Wildcard} expected")
-                # noinspection PyProtectedMember
-                ipnets_ = item._wildcard.ipnets()
+                ipnets_ = wildcard_o.ipnets()
                 ipnets.extend(ipnets_)
         return ipnets
 
@@ -405,15 +416,17 @@ class AddressBase(Base):
     def subnet_of(self, other) -> bool:
         """Check self Address (all ipnets) is subnet of `other` Address (any of ipnet).
 
+        Non-contiguous wildcards are compared as (prefix, wildcard mask) integers,
+        without expanding them to ipnets().
+
         :param other: Other Address (top).
         :type other: Address, AddressAg
 
         :return: True - if Address is subnet of `other` Address.
         """
-        tops = other.ipnets()
-        bottoms = self.ipnets()
-        is_subnet = h.subnet_of(tops=tops, bottoms=bottoms)
-        return is_subnet
+        tops = other.wildcard_ints()
+        bottoms = self.wildcard_ints()
+        return wc.subnet_of(tops=tops, bottoms=bottoms)
 
     def subnets(self) -> LStr:
         """All subnets, including address group and wildcard items.
@@ -430,6 +443,26 @@ class AddressBase(Base):
         ipnets = self.ipnets()
         return [o.with_netmask.replace("/", " ") for o in ipnets]
 
+    def wildcard_ints(self) -> LT2Int:
+        """All wildcards as (prefix, wildcard mask) integers, including address group items.
+
+        :return: List of (prefix, wildcard mask).
+
+        :example:
+            address = Address("10.0.0.0 0.0.1.3")
+            address.wildcard_ints() -> [(167772160, 259)]
+        """
+        if isinstance(self._wildcard, Wildcard):
+            return [self._wildcard.ints()]
+        wildcards: LT2Int = []
+        for item in self._items:
+            # noinspection PyProtectedMember
+            wildcard_o = item._wildcard
+            if not isinstance(wildcard_o, Wildcard):
+                raise TypeError(f"{self.line} {item=} {Wildcard} expected")
+            wildcards.append(wildcard_o.ints())
+        return wildcards
+
     def wildcards(self) -> LStr:
         """All wildcards, including address group and wildcard items.
 
@@ -446,7 +479,8 @@ class AddressBase(Base):
             return [self._wildcard.line]
         wildcards: LStr = []
         for item in self._items:
-            wildcard_o = getattr(item, "_wildcard")
+            # noinspection PyProtectedMember
+            wildcard_o = item._wildcard
             if not isinstance(wildcard_o, Wildcard):
                 raise TypeError(f"{self.line} {item=} {Wildcard} expected")
             wildcards.append(wildcard_o.line)
@@ -579,24 +613,61 @@ def collapse_(addresses: list) -> list:
         if address.type == "wildcard" and not isinstance(address.ipnet, IPv4Network):
             raise TypeError(f"{address=} is non-contiguous wildcard")
 
-    collapsed: LIpNet = []
-    ipnets: LIpNet = [o for a in addresses for o in a.ipnets()]
-    while ipnets:
-        ipnet = ipnets.pop()
-        if [o for o in ipnets if ipnet.subnet_of(o)]:
+    # Networks are popped from the end of the list, supernets are inserted to the beginning,
+    # so networks are processed as a queue: reversed input, then supernets in insertion order.
+    # Networks that are not processed yet are counted in `remaining`, lookups are by prefix.
+    nets: LT2Int = [(int(o.network_address), o.prefixlen) for a in addresses for o in a.ipnets()]
+    remaining: Counter = Counter(nets)
+    queue: Deque[T2Int] = deque(reversed(nets))
+    collapsed: LT2Int = []
+    while queue:
+        net = queue.popleft()
+        remaining[net] -= 1
+        if _is_subnet_of_any(net, remaining):
             continue
-        supernet = ipnet.supernet()
-        subnets = set(supernet.subnets())
-        if subnets.issubset({*ipnets, ipnet}):
-            if supernet not in ipnets:
-                ipnets.insert(0, supernet)
+        supernet = _supernet(net)
+        if all(remaining[o] or o == net for o in _subnets(supernet)):
+            if not remaining[supernet]:
+                queue.append(supernet)
+                remaining[supernet] += 1
             continue
-        collapsed.append(ipnet)
+        collapsed.append(net)
 
     addresses_ = []  # result
-    for ipnet_ in collapsed:
+    for network, prefixlen in sorted(collapsed):
         addr_o = addresses[0].copy()
         addr_o.note = None
-        addr_o.prefix = str(ipnet_)
+        addr_o.prefix = f"{IPv4Address(network)}/{prefixlen}"
         addresses_.append(addr_o)
-    return sorted(addresses_)
+    return addresses_
+
+
+# ============================= helpers ==============================
+
+
+def _is_subnet_of_any(net: T2Int, nets: Counter) -> bool:
+    """Return True if network is subnet of (or equal to) any of counted networks."""
+    network, prefixlen = net
+    for prefixlen_ in range(prefixlen + 1):
+        if nets.get(_supernet((network, prefixlen), prefixlen_)):
+            return True
+    return False
+
+
+def _subnets(net: T2Int) -> LT2Int:
+    """Return 2 subnets of the network (network, prefixlen)."""
+    network, prefixlen = net
+    return [(network, prefixlen + 1), (network | 1 << (31 - prefixlen), prefixlen + 1)]
+
+
+def _supernet(net: T2Int, prefixlen: Optional[int] = None) -> T2Int:
+    """Return supernet (network, prefixlen) of the network, /0 supernet is /0.
+
+    :param net: Network (network, prefixlen).
+    :param prefixlen: Prefix length of the supernet, default prefixlen - 1.
+    """
+    network, prefixlen_ = net
+    if prefixlen is None:
+        prefixlen = max(prefixlen_ - 1, 0)
+    mask = (wc.ALL_ONES << (32 - prefixlen)) & wc.ALL_ONES
+    return network & mask, prefixlen
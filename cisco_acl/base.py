@@ -1,6 +1,9 @@
 """Base - Parent of: Address, Port, Protocol, Ace, AceBase, Acl, AceGroup."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 from uuid import uuid1
 
@@ -8,12 +11,15 @@ from netports import SwVersion
 
 from cisco_acl import helpers as h
 from cisco_acl.helpers import IOS
-from cisco_acl.types_ import LStr, DAny
+from cisco_acl.types_ import DAny, LStr, TStr
 
 
 class Base(ABC):
     """Base - Parent of: Address, Port, Protocol, Ace, AceBase, Acl, AceGroup."""
 
+    __slots__ = ("_platform", "_uuid", "version", "note")
+    _clone_shared: TStr = ()  # attributes shared by the clones, never changed in place
+
     def __init__(self, **kwargs):
         """Init Base.
 
@@ -46,12 +52,26 @@ class Base(ABC):
         """__str__."""
         return self.line
 
+    def __getstate__(self) -> DAny:
+        """Return state for pickle, software version is stored as text.
+
+        UUID is pickled as is, UUID that is not read yet is generated after unpickling.
+        """
+        state = self._slots_data()
+        state["version"] = str(self.version)
+        return state
+
+    def __setstate__(self, state: DAny) -> None:
+        """Restore state from pickle, objects with the same version share SwVersion."""
+        state = state.copy()
+        state["version"] = h.init_version(version=state["version"])
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @staticmethod
     def _init_uuid(**kwargs) -> str:
-        """Init uuid."""
-        if uuid := str(kwargs.get("uuid") or ""):
-            return uuid
-        return str(uuid1())
+        """Init uuid, empty string if uuid is not passed (generated on the first read)."""
+        return str(kwargs.get("uuid") or "")
 
     @staticmethod
     def _init_note(**kwargs) -> Any:
@@ -81,13 +101,15 @@ class Base(ABC):
     @platform.setter
     def platform(self, platform: str) -> None:
         self._platform = h.init_platform(platform=platform)
-        uuid = self.uuid
+        uuid = self._uuid
         self.line = self.line
-        self.uuid = uuid
+        self._uuid = uuid
 
     @property
     def uuid(self) -> str:
-        """Universally Unique Identifier."""
+        """Universally Unique Identifier, generated on the first read."""
+        if not self._uuid:
+            self._uuid = str(uuid1())
         return self._uuid
 
     @uuid.setter
@@ -99,9 +121,13 @@ class Base(ABC):
     # =========================== method =============================
 
     def copy(self):
-        """Copy the self object."""
-        kwargs = self.data()
-        return self.__class__(**kwargs)
+        """Copy the self object.
+
+        Parsed attributes are copied directly, without converting to data() and parsing again.
+        Child objects and lists are copied, immutable values are shared.
+        The copy gets a new UUID.
+        """
+        return self._clone()
 
     @abstractmethod
     def data(self, uuid: bool = False) -> DAny:
@@ -115,6 +141,37 @@ class Base(ABC):
 
     # =========================== helper =============================
 
+    def _clone(self):
+        """Return a structural copy of the self object with a new (lazy) UUID."""
+        cls = self.__class__
+        obj = cls.__new__(cls)
+        shared = self._clone_shared
+        for name, value in self._slots_data().items():
+            if name not in shared:
+                value = _clone_value(value)
+            setattr(obj, name, value)
+        obj._uuid = ""
+        return obj
+
+    def _copy_slots(self, other: Base) -> None:
+        """Copy all attributes of the other object to the self object."""
+        for name, value in other._slots_data().items():
+            setattr(self, name, value)
+
+    def _slots_data(self) -> DAny:
+        """Return all initialized attributes (__slots__ of all classes and __dict__).
+
+        Unset attributes are skipped without __getattr__ (LazyAce fields are not parsed).
+        """
+        data: DAny = {}
+        for name in slot_names(type(self)):
+            try:
+                data[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+        data.update(getattr(self, "__dict__", {}))
+        return data
+
     def _repr__add_param(self, param: str, params: LStr) -> LStr:
         """Add a param to the list of params."""
         if value := getattr(self, param):
@@ -131,3 +188,28 @@ class Base(ABC):
             params.append(f"{version=!r}")
         params = self._repr__add_param("note", params)
         return params
+
+
+# ============================= helpers ==============================
+
+
+def _clone_value(value: Any) -> Any:
+    """Copy Base objects and lists, share immutable values (str, int, SwVersion, etc.)."""
+    if isinstance(value, Base):
+        # noinspection PyProtectedMember
+        return value._clone()
+    if isinstance(value, list):
+        return [_clone_value(s) for s in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def slot_names(cls: type) -> TStr:
+    """Return names of __slots__ of the class and all parent classes."""
+    names: LStr = []
+    for class_ in reversed(cls.__mro__):
+        slots = class_.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(s for s in slots if s not in ("__dict__", "__weakref__"))
+    return tuple(names)
@@ -0,0 +1,248 @@
+"""Caches: LruCache and interning of immutable value objects.
+
+Interning (opt-in, disabled by default) shares the objects created by Ace for each ACE line:
+Protocol, Port, Option and Address. In a large ACL most of them are repeated values:
+"any", "tcp", "eq 443", "log". Interned object is created once for the key
+(class, line, platform, version, port_nr, protocol_nr, etc.) and shared by all ACEs.
+
+Interned objects must not be changed in place. Ace methods that change its objects
+(platform, type setters, ungroup_ports()) replace shared objects by copies,
+changing objects directly (for example ace.srcport.items = [1]) changes all ACEs
+sharing the object.
+
+:example:
+    with cache.interning(maxsize=10000):
+        acls = cisco_acl.acls(config)
+    cache.interning_stats() -> {"hits": 9000, "misses": 1000, "size": 1000, "maxsize": 10000}
+
+Wildcard.ipnets() results are cached by value (prefix, wildcard mask, max_ncwb),
+not by Wildcard object, so Wildcard objects are not kept alive by the cache.
+
+:example:
+    cache.set_ipnets_maxsize(256)
+    cache.ipnets_stats() -> {"hits": 10, "misses": 2, "size": 2, "maxsize": 256}
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterator, Optional
+
+from cisco_acl.types_ import DInt
+
+DEF_MAXSIZE = 4096
+DEF_IPNETS_MAXSIZE = 1024
+
+
+class LruCache:
+    """Least recently used cache with hit/miss statistics."""
+
+    def __init__(self, maxsize: int = DEF_MAXSIZE):
+        """Init LruCache.
+
+        :param maxsize: Max count of items, the least recently used items are evicted.
+        :type maxsize: int
+
+        :raises ValueError: If maxsize < 1.
+        """
+        self._data: OrderedDict = OrderedDict()
+        self._maxsize = init_maxsize(maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(maxsize={self._maxsize!r})"
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if key is in the cache, statistics are not changed."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Count of items in the cache."""
+        return len(self._data)
+
+    # =========================== property ===========================
+
+    @property
+    def maxsize(self) -> int:
+        """Max count of items."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self._maxsize = init_maxsize(maxsize)
+        self._evict()
+
+    # =========================== method =============================
+
+    def clear(self) -> None:
+        """Delete all items and reset statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return cached value, None if key is not in the cache.
+
+        :param key: Cache key.
+        :return: Cached value or None.
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Add value to the cache, evict the least recently used items.
+
+        :param key: Cache key.
+        :param value: Cached value, should not be None.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._evict()
+
+    def stats(self) -> DInt:
+        """Return statistics: hits, misses, size, maxsize."""
+        return dict(hits=self.hits, misses=self.misses, size=len(self._data), maxsize=self._maxsize)
+
+    # =========================== helper =============================
+
+    def _evict(self) -> None:
+        """Delete the least recently used items above maxsize."""
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+# ============================ interning =============================
+
+_INTERNED: Optional[LruCache] = None  # None - interning is disabled
+
+
+def enable_interning(maxsize: int = DEF_MAXSIZE) -> None:
+    """Enable interning of Protocol, Port, Option and Address objects created by Ace.
+
+    :param maxsize: Max count of interned objects.
+    :type maxsize: int
+    """
+    global _INTERNED  # pylint: disable=global-statement
+    if _INTERNED is None:
+        _INTERNED = LruCache(maxsize=maxsize)
+    else:
+        _INTERNED.maxsize = maxsize
+
+
+def disable_interning() -> None:
+    """Disable interning and delete interned objects (ACEs keep the shared objects)."""
+    global _INTERNED  # pylint: disable=global-statement
+    _INTERNED = None
+
+
+def is_interning() -> bool:
+    """Return True if interning is enabled."""
+    return _INTERNED is not None
+
+
+def clear_interning() -> None:
+    """Delete interned objects and reset statistics."""
+    if _INTERNED is not None:
+        _INTERNED.clear()
+
+
+def interning_stats() -> DInt:
+    """Return interning statistics: hits, misses, size, maxsize.
+
+    All values are 0 if interning is disabled.
+    """
+    if _INTERNED is None:
+        return dict(hits=0, misses=0, size=0, maxsize=0)
+    return _INTERNED.stats()
+
+
+@contextmanager
+def interning(maxsize: int = DEF_MAXSIZE) -> Iterator[None]:
+    """Context manager, enables interning inside the block.
+
+    :param maxsize: Max count of interned objects.
+    :type maxsize: int
+    """
+    enabled = is_interning()
+    enable_interning(maxsize=maxsize)
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable_interning()
+
+
+def intern(cls: type, line: str, **kwargs) -> Any:
+    """Return interned object if interning is enabled, otherwise new object.
+
+    :param cls: Class of the value object: Protocol, Port, Option, Address.
+    :param line: Line of the object.
+    :param kwargs: Params of the object: platform, version, port_nr, etc.
+        All values should be hashable.
+    :return: Object cls(line, **kwargs).
+    """
+    if _INTERNED is None:
+        return cls(line, **kwargs)
+    key = (cls, line, *sorted(kwargs.items()))
+    obj = _INTERNED.get(key)
+    if obj is None:
+        obj = cls(line, **kwargs)
+        _INTERNED.set(key, obj)
+    return obj
+
+
+# ============================== ipnets ==============================
+
+_IPNETS: Optional[LruCache] = None  # Wildcard.ipnets() results, created on the first use
+
+
+def ipnets_cache() -> LruCache:
+    """Return cache of Wildcard.ipnets() results."""
+    global _IPNETS  # pylint: disable=global-statement
+    if _IPNETS is None:
+        _IPNETS = LruCache(maxsize=DEF_IPNETS_MAXSIZE)
+    return _IPNETS
+
+
+def set_ipnets_maxsize(maxsize: int = DEF_IPNETS_MAXSIZE) -> None:
+    """Set max count of cached Wildcard.ipnets() results.
+
+    :param maxsize: Max count of cached results, the least recently used are evicted.
+    :type maxsize: int
+    """
+    ipnets_cache().maxsize = maxsize
+
+
+def clear_ipnets() -> None:
+    """Delete cached Wildcard.ipnets() results and reset statistics."""
+    ipnets_cache().clear()
+
+
+def ipnets_stats() -> DInt:
+    """Return Wildcard.ipnets() cache statistics: hits, misses, size, maxsize."""
+    return ipnets_cache().stats()
+
+
+# ============================= helpers ==============================
+
+
+def init_maxsize(maxsize: int) -> int:
+    """Init max size of the cache.
+
+    :raises TypeError: If maxsize is not int.
+    :raises ValueError: If maxsize < 1.
+    """
+    if not isinstance(maxsize, int):
+        raise TypeError(f"{maxsize=} {int} expected")
+    if maxsize < 1:
+        raise ValueError(f"{maxsize=} expected >= 1")
+    return maxsize
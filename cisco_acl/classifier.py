@@ -0,0 +1,387 @@
+"""Classifier - first-match packet lookup in ACEs, HiCuts-style decision tree.
+
+Each Ace is converted to rules, one rule per combination of source address,
+source port range, destination address and destination port range
+(address group members and multiple ports are expanded). Rule is a box of 5 dimensions:
+source address, destination address, protocol, source port, destination port.
+
+Rules are grouped by the wide dimensions (more than half of the range: "any", "gt 1023"),
+the tree of each group is cut in the narrow dimensions only, so wide rules are not
+replicated (EffiCuts). Lookup walks all trees, the rule with the lowest ACE index wins.
+
+Tree node is an aligned power of 2 box. The box is cut to equal parts in the dimension
+where the biggest child has the least rules, count of cuts is limited by the space factor
+(count of replicated rules). Rules below the first rule that covers the whole box are
+dropped, they can never match inside the box. Leaf holds up to BINTH rules ordered by
+ACE position, lookup walks the tree and checks the leaf rules exactly
+(non-contiguous wildcards, TCP flags), the first matching rule wins.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from ipaddress import IPv4Address
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from cisco_acl.ace import Ace, LAce
+from cisco_acl.protocol import PROTOCOL_TO_NR, PROTOCOLS_ANY
+from cisco_acl.types_ import StrInt, T2Int
+
+SRC, DST, PROTOCOL, SPORT, DPORT = range(5)
+BITS = (32, 32, 8, 16, 16)  # width of the dimensions in bits
+BINTH = 8  # max count of rules in the leaf
+SPFAC = 4  # space factor, max replicated rules in the children / rules in the node
+SPACE = 16  # max replicated rules in the tree / rules
+MAX_CUTS = 64
+MAX_DEPTH = 32
+MASK32 = 0xFFFFFFFF
+
+UAddress = Union[str, int, IPv4Address]
+TBool = Tuple[bool, ...]
+TBox = Tuple[T2Int, ...]
+LT2Int = List[T2Int]
+
+
+class _Rule:
+    """Rule of the ACE, box of 5 intervals and exact match values."""
+
+    __slots__ = ("priority", "ace", "box", "nets", "masks", "nc", "flags", "established")
+
+    def __init__(self, priority: int, ace: Ace, src: T2Int, dst: T2Int, sport: T2Int,
+                 dport: T2Int):
+        """Init _Rule.
+
+        :param priority: Index of the ACE, lower value wins.
+        :param ace: ACE of the rule.
+        :param src: Source (network, wildcard mask) integers.
+        :param dst: Destination (network, wildcard mask) integers.
+        :param sport: Source port (lo, hi).
+        :param dport: Destination port (lo, hi).
+        """
+        self.priority = priority
+        self.ace = ace
+        number = ace.protocol.number
+        protocol = (0, 255) if number == 0 else (number, number)
+        # bounding intervals of the wildcards, exact for contiguous wildcards
+        self.box: TBox = ((src[0], src[0] | src[1]), (dst[0], dst[0] | dst[1]),
+                          protocol, sport, dport)
+        self.nets = (src[0], dst[0])
+        self.masks = (~src[1] & MASK32, ~dst[1] & MASK32)
+        self.nc = (_is_nc(src[1]), _is_nc(dst[1]))  # non-contiguous wildcards
+        flags = set(ace.option.flags)
+        self.established = "established" in flags
+        flags.discard("established")
+        self.flags = frozenset(flags)
+
+    def __repr__(self):
+        """__repr__."""
+        return f"{self.__class__.__name__}({self.priority}, {self.ace.line!r})"
+
+    def match(self, point: TBox, flags: frozenset) -> bool:
+        """Return True if the packet matches the rule exactly."""
+        src, dst, protocol, sport, dport = point  # type: ignore
+        box = self.box
+        if (src & self.masks[0]) != self.nets[0] or (dst & self.masks[1]) != self.nets[1]:
+            return False
+        if not box[PROTOCOL][0] <= protocol <= box[PROTOCOL][1]:
+            return False
+        if not box[SPORT][0] <= sport <= box[SPORT][1]:
+            return False
+        if not box[DPORT][0] <= dport <= box[DPORT][1]:
+            return False
+        if self.established and not ("ack" in flags or "rst" in flags):
+            return False
+        return self.flags <= flags
+
+    def wide(self) -> TBool:
+        """Return flags of the dimensions where the rule covers more than half of the range."""
+        return tuple((hi - lo) >> (bits - 1) > 0 for (lo, hi), bits in zip(self.box, BITS))
+
+    def intersects(self, dim: int, lo: int, size: int) -> bool:
+        """Return True if the rule has any point in the aligned block [lo, lo + size - 1]."""
+        rlo, rhi = self.box[dim]
+        if rhi < lo or rlo > lo + size - 1:
+            return False
+        if dim in (SRC, DST):  # non-contiguous wildcard bits out of the block must match
+            return not (lo ^ self.nets[dim]) & self.masks[dim] & ~(size - 1)
+        return True
+
+    def covers(self, box: TBox) -> bool:
+        """Return True if the rule matches all packets in the aligned box (without flags)."""
+        if self.flags or self.established:
+            return False
+        for dim, (lo, hi) in enumerate(box):
+            if dim in (SRC, DST):  # all box bits are wildcard bits, other bits match
+                if (hi - lo) & self.masks[dim] or (lo ^ self.nets[dim]) & self.masks[dim]:
+                    return False
+                continue
+            rlo, rhi = self.box[dim]
+            if rlo > lo or rhi < hi:
+                return False
+        return True
+
+
+class _Node:
+    """Internal node of the tree, child index is the bits of the value in dimension `dim`."""
+
+    __slots__ = ("dim", "shift", "mask", "children")
+
+    def __init__(self, dim: int, shift: int, mask: int, children: list):
+        """Init _Node."""
+        self.dim = dim
+        self.shift = shift
+        self.mask = mask
+        self.children = children
+
+
+class Classifier:
+    """First-match packet classifier of ACEs."""
+
+    def __init__(self, aces: LAce, implicit: Ace):
+        """Init Classifier, compile the decision tree.
+
+        :param aces: Ungrouped ACEs, ordered from the top to the bottom. Remarks are skipped.
+        :param implicit: ACE returned if no ACE matched the packet (implicit deny).
+        """
+        self.implicit = implicit
+        self.platform = implicit.platform
+        groups: Dict[TBool, List[_Rule]] = {}  # rules grouped by wide dimensions
+        count = 0
+        for idx, ace in enumerate(aces):
+            if isinstance(ace, Ace):
+                for rule in _ace_rules(idx, ace):
+                    groups.setdefault(rule.wide(), []).append(rule)
+                    count += 1
+        self.count = count  # count of rules
+        self._priority = len(aces)  # priority lower than any rule
+        box = tuple((0, (1 << s) - 1) for s in BITS)
+        rules_l = sorted(groups.values(), key=lambda rules: rules[0].priority)
+        self._roots = [_build(rules=_prune(rules, box), box=box) for rules in rules_l]
+
+    def __repr__(self):
+        """__repr__."""
+        return f"{self.__class__.__name__}(rules={self.count})"
+
+    # =========================== method =============================
+
+    def lookup(self, src: int, dst: int, protocol: int, sport: int, dport: int,
+               flags: frozenset) -> Ace:
+        """Return the first ACE matching the packet, values are integers (fast path).
+
+        :param src: Source address.
+        :param dst: Destination address.
+        :param protocol: IP protocol number.
+        :param sport: Source port.
+        :param dport: Destination port.
+        :param flags: Packet flags, option keywords: "ack", "syn", etc.
+        :return: The first matched ACE or implicit ACE.
+        """
+        point = (src, dst, protocol, sport, dport)
+        matched: Optional[_Rule] = None
+        priority = self._priority
+        for node in self._roots:
+            while node.__class__ is _Node:
+                node = node.children[(point[node.dim] >> node.shift) & node.mask]
+            for rule in node:
+                if rule.priority >= priority:
+                    break
+                if rule.match(point, flags):
+                    matched, priority = rule, rule.priority
+                    break
+        if matched is None:
+            return self.implicit
+        return matched.ace
+
+    def match(self, src: UAddress, dst: UAddress, protocol: StrInt, sport: int = 0,
+              dport: int = 0, flags: Optional[Iterable[str]] = None) -> Ace:
+        """Return the first ACE matching the packet.
+
+        :param src: Source address: "10.0.0.1", 167772161.
+        :param dst: Destination address.
+        :param protocol: IP protocol name or number: "tcp", 6.
+        :param sport: Source TCP/UDP port number.
+        :param dport: Destination TCP/UDP port number.
+        :param flags: Packet flags, option keywords: "ack", "syn", "fragments", etc.
+            "established" ACE matches packets with "ack" or "rst".
+        :return: The first matched ACE or implicit ACE.
+        """
+        return self.lookup(
+            src=init_address(src),
+            dst=init_address(dst),
+            protocol=init_protocol_nr(protocol, platform=self.platform),
+            sport=init_port_nr(sport),
+            dport=init_port_nr(dport),
+            flags=init_flags(flags),
+        )
+
+
+# ============================= helpers ==============================
+
+
+def init_address(address: UAddress) -> int:
+    """Init IPv4 address as integer.
+
+    :raises TypeError: If address is not str, int, IPv4Address.
+    :raises ValueError: If address is invalid.
+    """
+    if isinstance(address, bool) or not isinstance(address, (str, int, IPv4Address)):
+        raise TypeError(f"{address=} {str} {int} expected")
+    return int(IPv4Address(address))
+
+
+def init_protocol_nr(protocol: StrInt, platform: str) -> int:
+    """Init IP protocol number from name or number.
+
+    :raises TypeError: If protocol is not str, int.
+    :raises ValueError: If protocol is invalid.
+    """
+    if isinstance(protocol, str):
+        if protocol.isdigit():
+            protocol = int(protocol)
+        else:
+            names = PROTOCOL_TO_NR.get(platform) or PROTOCOLS_ANY
+            if protocol not in names:
+                raise ValueError(f"invalid {protocol=}")
+            return names[protocol]
+    if isinstance(protocol, bool) or not isinstance(protocol, int):
+        raise TypeError(f"{protocol=} {str} {int} expected")
+    if not 0 <= protocol <= 255:
+        raise ValueError(f"{protocol=} expected in range 0..255")
+    return protocol
+
+
+def init_port_nr(port: int) -> int:
+    """Init TCP/UDP port number.
+
+    :raises TypeError: If port is not int.
+    :raises ValueError: If port is not in range 0..65535.
+    """
+    if isinstance(port, bool) or not isinstance(port, int):
+        raise TypeError(f"{port=} {int} expected")
+    if not 0 <= port <= 65535:
+        raise ValueError(f"{port=} expected in range 0..65535")
+    return port
+
+
+def init_flags(flags: Optional[Iterable[str]]) -> frozenset:
+    """Init packet flags: "ack syn", ["ack", "syn"].
+
+    :raises TypeError: If flags is not str or list of str.
+    """
+    if not flags:
+        return frozenset()
+    if isinstance(flags, str):
+        return frozenset(flags.split())
+    flags = list(flags)
+    if not all(isinstance(s, str) for s in flags):
+        raise TypeError(f"{flags=} {str} expected")
+    return frozenset(flags)
+
+
+def _ace_rules(priority: int, ace: Ace) -> List[_Rule]:
+    """Return rules of the ACE, one rule for each address and port combination."""
+    srcs = ace.srcaddr.wildcard_ints()
+    dsts = ace.dstaddr.wildcard_ints()
+    sports = list(ace.srcport.ranges) or [(0, 65535)]
+    dports = list(ace.dstport.ranges) or [(0, 65535)]
+    return [_Rule(priority, ace, src, dst, sport, dport)
+            for src in srcs for sport in sports for dst in dsts for dport in dports]
+
+
+def _is_nc(wildmask: int) -> bool:
+    """Return True if the wildcard mask is non-contiguous."""
+    return bool(wildmask & (wildmask + 1))
+
+
+def _prune(rules: List[_Rule], box: TBox) -> List[_Rule]:
+    """Drop rules below the first rule that covers the whole box."""
+    for idx, rule in enumerate(rules):
+        if rule.covers(box):
+            return rules[:idx + 1]
+    return rules
+
+
+def _build(rules: List[_Rule], box: TBox):
+    """Build the tree breadth-first, return the root node: leaf (tuple of rules) or _Node.
+
+    Count of rules replicated in all nodes is limited by SPACE * count of rules,
+    when the limit is reached the remaining nodes become leaves (linear lookup).
+    """
+    holder: list = [None]
+    budget = SPACE * max(len(rules), BINTH)
+    queue = deque([(holder, 0, rules, box, 0)])
+    while queue:
+        parent, idx, rules_, box_, depth = queue.popleft()
+        cut = None
+        if len(rules_) > BINTH and depth < MAX_DEPTH and budget > 0:
+            cut = _choose_cut(rules_, box_)
+        if cut is None:
+            parent[idx] = tuple(rules_)
+            continue
+
+        dim, size, children_rules = cut
+        node = _Node(dim=dim, shift=(size - 1).bit_length(), mask=len(children_rules) - 1,
+                     children=[None] * len(children_rules))
+        parent[idx] = node
+        lo = box_[dim][0]
+        for idx_, child_rules in enumerate(children_rules):
+            child_lo = lo + idx_ * size
+            child_box = box_[:dim] + ((child_lo, child_lo + size - 1),) + box_[dim + 1:]
+            child_rules = _prune(child_rules, child_box)
+            budget -= len(child_rules)
+            queue.append((node.children, idx_, child_rules, child_box, depth + 1))
+    return holder[0]
+
+
+def _choose_cut(rules: List[_Rule], box: TBox) -> Optional[Tuple[int, int, List[List[_Rule]]]]:
+    """Return the best cut (dimension, block size, rules of the children).
+
+    The best cut has the smallest max count of rules in a child, None if cuts in all
+    dimensions do not separate the rules.
+    """
+    best = None
+    best_key = (len(rules), 0)
+    for dim, (lo, hi) in enumerate(box):
+        if lo == hi:
+            continue
+        # rule intervals clipped by the box, offsets from the box start
+        clips = [(max(r.box[dim][0], lo) - lo, min(r.box[dim][1], hi) - lo) for r in rules]
+        if clips.count(clips[0]) == len(clips):
+            continue
+        width = hi - lo + 1
+        ncuts = _choose_ncuts(clips, width=width)
+        size = width // ncuts
+        children_rules = _cut(rules, clips, dim=dim, lo=lo, size=size, ncuts=ncuts)
+        key = (max(len(s) for s in children_rules), sum(len(s) for s in children_rules))
+        if key < best_key:
+            best, best_key = (dim, size, children_rules), key
+    return best
+
+
+def _cut(rules: List[_Rule], clips: LT2Int, dim: int, lo: int, size: int,
+         ncuts: int) -> List[List[_Rule]]:
+    """Return rules of the children, box is cut in dimension `dim` to `ncuts` blocks of `size`."""
+    shift = size.bit_length() - 1
+    children_rules: List[List[_Rule]] = [[] for _ in range(ncuts)]
+    for rule, (rlo, rhi) in zip(rules, clips):
+        if dim in (SRC, DST) and rule.nc[dim]:
+            for idx in range(rlo >> shift, (rhi >> shift) + 1):
+                if rule.intersects(dim, lo + idx * size, size):
+                    children_rules[idx].append(rule)
+        else:
+            for idx in range(rlo >> shift, (rhi >> shift) + 1):
+                children_rules[idx].append(rule)
+    return children_rules
+
+
+def _choose_ncuts(clips: LT2Int, width: int) -> int:
+    """Return count of cuts (power of 2), limited by the space factor."""
+    limit = SPFAC * len(clips)
+    ncuts = 2
+    while ncuts < MAX_CUTS and ncuts * 2 <= width:
+        shift = (width // (ncuts * 2)).bit_length() - 1
+        replicated = sum((hi >> shift) - (lo >> shift) for lo, hi in clips) + len(clips)
+        if replicated + ncuts * 2 > limit:
+            break
+        ncuts *= 2
+    return ncuts
@@ -2,20 +2,26 @@
 
 import re
 from abc import ABC
-from copy import deepcopy
+from typing import Generator, List, Tuple
 
 from cisco_acl import helpers as h
-from cisco_acl.types_ import DAny, DLStr, DStr, LDAny, LStr, OLStr
+from cisco_acl.stats import timed
+from cisco_acl.types_ import DAny, DLStr, DLT2Str, DStr, LDAny, LStr, OLStr, UStr
+
+T2DAny = Tuple[DAny, DAny]
+T2StrLStr = Tuple[str, LStr]
+RE_ACCESS_GROUP = re.compile(r"ip access-group (\S+) (\S+)")
 
 
 class ConfigParser(ABC):
     """CISCO config parser."""
 
-    def __init__(self, config: str = "", **kwargs):
+    def __init__(self, config: UStr = "", **kwargs):
         """Init ConfigParser.
 
         :param config: Cisco config, "show running-config" output.
-        :type config: str
+            String or any iterable of lines (text iterator, file object).
+        :type config: Union[str, Iterable[str]]
 
         :param platform: Platform: "asa", "ios", "nxos". Default "ios".
         :type platform: str
@@ -23,15 +29,20 @@ class ConfigParser(ABC):
         :param version: Software version, default is "0".
         :type version: str
         """
-        self.config: str = str(config)  # raw config
+        self.config: UStr = config if h.is_iterable_lines(config) else str(config)  # raw config
         self.platform: str = h.init_platform(**kwargs)
         self.version: str = str(kwargs.get("version") or "")
 
         self.lines: LStr = []  # config in list format
         self.dic: DLStr = {}  # config in dict format, commands as LStr
-        self.mdic: DAny = {}  # config in multidimensional dict format, commands as LStr
         self.dic_text: DStr = {}  # config in dict format, commands as string
-        self.mdic_text: DAny = {}  # config in multidimensional dict format, commands as string
+        self._config_l: OLStr = None  # config lines of parse_config(), source of mdic, mdic_text
+        self._mdic: DAny = {}
+        self._mdic_text: DAny = {}
+        # "ip access-group" index: {acl_name: [(interface, direction)]}
+        self.acl_interfaces: DLT2Str = {}
+        # "ip access-group" index: {interface: [(acl_name, direction)]}
+        self.interface_acls: DLT2Str = {}
 
     def __repr__(self):
         """__repr__."""
@@ -40,6 +51,36 @@ class ConfigParser(ABC):
         version = self.version
         return f"<{name}: {platform=} {version=}>"
 
+    # =========================== property ===========================
+
+    @property
+    def mdic(self) -> DAny:
+        """Config in multidimensional dict format, commands as LStr.
+
+        Parsed from parse_config() lines on the first access, empty if config is not parsed.
+        """
+        self._init_mdic()
+        return self._mdic
+
+    @mdic.setter
+    def mdic(self, mdic: DAny) -> None:
+        self._init_mdic()
+        self._mdic = mdic
+
+    @property
+    def mdic_text(self) -> DAny:
+        """Config in multidimensional dict format, commands as string.
+
+        Parsed from parse_config() lines on the first access, empty if config is not parsed.
+        """
+        self._init_mdic()
+        return self._mdic_text
+
+    @mdic_text.setter
+    def mdic_text(self, mdic_text: DAny) -> None:
+        self._init_mdic()
+        self._mdic_text = mdic_text
+
     # =========================== method =============================
 
     def addgrs(self) -> LDAny:
@@ -135,24 +176,112 @@ class ConfigParser(ABC):
             return "object-group network "
         return "object-group ip address "
 
+    # ========================== streaming ===========================
+
+    def iter_config(self) -> Generator[str, None, None]:
+        """Iterate config lines without trailing spaces, skip empty lines and comments "!".
+
+        The first line is without indentation.
+        :return: Generator of config lines.
+        """
+        config = self.config
+        if isinstance(config, str):
+            config = config.splitlines()
+        is_first = True
+        for item in config:
+            for line in str(item).splitlines():
+                line = line.rstrip()
+                if not line or line.startswith("!"):
+                    continue
+                if is_first:
+                    line = line.strip()
+                    is_first = False
+                yield line
+
+    def iter_lines(self) -> Generator[str, None, None]:
+        """Iterate command lines without indentation, the same as self.lines.
+
+        :return: Generator of command lines.
+        """
+        for line in self.iter_config():
+            if line := line.strip():
+                yield line
+
+    def iter_sections(self) -> Generator[T2StrLStr, None, None]:
+        """Iterate top-level sections as they appear in config.
+
+        :return: Generator of tuples: not indented line, indented lines without indentation.
+
+        :example:
+            self.config: "interface Ethernet1
+                            ip access-group ACL_NAME in
+                          ip access-list ACL_NAME
+                            permit ip any any"
+            return: ("interface Ethernet1", ["ip access-group ACL_NAME in"]),
+                    ("ip access-list ACL_NAME", ["permit ip any any"])
+        """
+        key = ""
+        lines: LStr = []
+        is_section = False
+        for line in self.iter_config():
+            if line[0].isspace():
+                lines.append(line.strip())
+                continue
+            if is_section:
+                yield key, lines
+            key = line
+            lines = []
+            is_section = True
+        if is_section:
+            yield key, lines
+
+    @timed("parse_sections")
+    def parse_sections(self) -> None:
+        """Parse config in streaming mode, only sections required for ACLs and address groups.
+
+        Config is read line by line, full config dict structures are not created.
+        self.dic_text - "ip access-list", "object-group" sections and "ip access-group" lines
+        of the other sections (interfaces), ready for self.acls() and self.addgrs().
+        self.acl_interfaces, self.interface_acls - "ip access-group" index.
+        """
+        dic: DLStr = {}
+        self._clear_access_groups()
+        for key, lines in self.iter_sections():
+            if not ("ip access-list " in key or "object-group " in key):
+                lines = [s for s in lines if "ip access-group" in s]
+                self._add_access_groups(key, lines)
+            if lines:
+                dic.setdefault(key, []).extend(lines)
+        self.dic_text = {k: "\n".join(v) for k, v in dic.items()}
+
     # ========================= parse_config =========================
 
+    @timed("parse_config")
     def parse_config(self) -> None:
         """Parse config rows to specific format: list, dict, multidimensional dict.
 
         # make rows, main_rows, dic, mdic, etc.
         self.dic_text - config in dict format, commands as string,
-        self.mdic_text - config in multidimensional dict format, commands as string.
+        self.mdic, self.mdic_text - multidimensional dict formats, parsed on the first access.
+        self.acl_interfaces, self.interface_acls - "ip access-group" index.
         """
-        config_l = [s.rstrip() for s in self.config.splitlines()]
-        config_l = [s for s in config_l if s and not s.startswith("!")]
-        if config_l:
-            config_l[0] = config_l[0].strip()
+        config_l = list(self.iter_config())
         self.lines = self._parse_lines(config_l)
         self.dic = self._parse_dic(config_l)
-        self.mdic = self._parse_mdic(config_l)
+        self._clear_access_groups()
+        for key, lines in self.dic.items():
+            if not ("ip access-list " in key or "object-group " in key):
+                self._add_access_groups(key, lines)
         self.dic_text = {k: "\n".join(v) for k, v in self.dic.items()}
-        self.mdic_text = self._join_mdic_text(self.mdic)
+        self._config_l = config_l
+        self._mdic = {}
+        self._mdic_text = {}
+
+    def _init_mdic(self) -> None:
+        """Parse self.mdic, self.mdic_text from the parse_config() lines, once."""
+        if self._config_l is not None:
+            self._mdic, self._mdic_text = self._parse_mdic(self._config_l)
+            self._config_l = None
 
     @staticmethod
     def _parse_lines(config_l: LStr) -> LStr:
@@ -161,22 +290,6 @@ class ConfigParser(ABC):
         lines = [s for s in lines if s]
         return lines
 
-    @staticmethod
-    def _join_mdic_text(mdic: DAny) -> DAny:
-        """Join self.mdic[key]["_config_"] from List[str] to str."""
-
-        def join_config(mdic_text_: DAny) -> None:
-            """Join self.mdic[key]["_config_"] from List[str] to str."""
-            for key, values in mdic_text_.items():
-                if key == "_config_" and isinstance(values, list):
-                    mdic_text_[key] = "\n".join(values)
-                else:
-                    join_config(values)
-
-        mdic_text: DAny = deepcopy(mdic)
-        join_config(mdic_text)
-        return mdic_text
-
     @staticmethod
     def _parse_dic(config_l: LStr) -> DLStr:
         """Config in dictionary format (indented strings in dictionary).
@@ -202,174 +315,107 @@ class ConfigParser(ABC):
                 data[key] = data[key] + [line_] if data.get(key) else [line_]
         return data
 
-    def _parse_mdic(self, config_l: LStr) -> DAny:
-        """Parse config in multidimensional dict format.
+    @staticmethod
+    def _parse_mdic(config_l: LStr) -> T2DAny:
+        """Parse config in multidimensional dict format, commands as LStr and as string.
+
+        Single pass, open sections are kept in the stack. A line is the key of a section if the
+        next line is more indented than the current section lines.
 
         :example:
             data: {"interface Ethernet1/1": {"_config_": ["ip address 1.1.1.1/24",
                                                            "no shutdown"],
                                               "hsrp 5" : {"_config_": ["ip 1.1.1.2"]}}
                    }
+            data_text: {"interface Ethernet1/1": {"_config_": "ip address 1.1.1.1/24\n"
+                                                               "no shutdown",
+                                                   "hsrp 5" : {"_config_": "ip 1.1.1.2"}}
+                        }
+        :raises ValueError: If the first line is indented.
         """
         data: DAny = {"_config_": []}  # result
-        # validation
+        data_text: DAny = {"_config_": ""}
         if not config_l:  # exit if config is empty
-            return data
-        if re.match(r"\s", config_l[0]):  # error if first line is incorrect
+            return data, data_text
+        if config_l[0][:1].isspace():
             raise ValueError("first line in config should not be indented")
-        config_l.append("END_OF_CONFIG")  # add last line, to detect end of config
-
-        # Foreach config, indented lines add to dictionary as value.
-        # More indented line add to more embedded dictionary (dictionary of dictionary)
-        i_max = len(config_l)
-        i_next = 0
-        indent_i = ""  # no indentation
-        for i in range(i_max):
-            # last line, END_OF_CONFIG
-            if i_max - i <= 1:
-                break
-            # skip already processed lines
-            if i_next and i <= i_next:
-                continue
 
-            indent_next = re.sub(r"(^\s*).*", r"\1", config_l[i + 1])  # indentation in next line
-            line_i = config_l[i]
+        # open sections: indentation of the section lines, commands, data, data_text
+        stack: List[Tuple[int, LStr, DAny, DAny]] = [(0, data["_config_"], data, data_text)]
+        indents = [len(s) - len(s.lstrip()) for s in config_l]
+        indents.append(0)  # end of config
+        for i, line in enumerate(config_l):
+            indent, commands, mdic, mdic_text = stack[-1]
+            indent_next = indents[i + 1]
+            line = line.strip()
 
-            # not indented lines, main config
-            if indent_i == indent_next:
-                data["_config_"].append(line_i.strip())  # add not indented line to config section
+            # next line is indented, line is the key of the new section
+            if indent_next > indent:
+                section: DAny = {"_config_": []}
+                section_text: DAny = {"_config_": ""}
+                mdic[line] = section
+                mdic_text[line] = section_text
+                stack.append((indent_next, section["_config_"], section, section_text))
+                continue
 
-            # next line is indented, make more deep indentation parsing
-            elif indent_i < indent_next:
-                # indented config parser
-                (i_next, indent_next, mdic) = self._get_indented_dic(i, config_l)
-                data.update(mdic)  # save
+            commands.append(line)
+            # end of indentation, close sections more indented than the next line
+            while indent_next < indent:
+                _, commands, _, mdic_text = stack.pop()
+                mdic_text["_config_"] = "\n".join(commands)
+                indent = stack[-1][0]
+        data_text["_config_"] = "\n".join(data["_config_"])
 
         # Interface can be without indented configuration, but should be in "mdic" as key
         for line in config_l:
-            # Skip not Interface lines
-            if not re.match("interface .+", line, re.I):
+            if line[:10].lower() != "interface " or not line[10:]:
                 continue
-            line = line.strip()
-            # Skip already created keys
             if data.get(line):
                 continue
-            # make key with empty config
-            data.update({line: {"_config_": []}})
-
-        return data
+            data[line] = {"_config_": []}
+            data_text[line] = {"_config_": ""}
+        return data, data_text
 
     # =========================== helper =============================
 
+    @timed("interface_binding")
     def _add_acl_interfaces(self, acls: LDAny) -> None:
-        """Add input/output interfaces to parsed `acls`.
+        """Add input/output interfaces to parsed `acls` from self.acl_interfaces.
 
         :result: Side effect `acls`.
         """
-        intf_acls_all: LDAny = self._acls_on_interfaces()
-        for acl_d in acls:
-            intf_acls = [d for d in intf_acls_all if d["name"] == acl_d["name"]]
-            for intf_acl in intf_acls:
-                if intf_acl["input"]:
-                    acl_d["input"].append(intf_acl["input"])
-                if intf_acl["output"]:
-                    acl_d["output"].append(intf_acl["output"])
         for acl_d in acls:
-            acl_d["input"] = sorted(set(acl_d["input"]))
-            acl_d["output"] = sorted(set(acl_d["output"]))
+            items = self.acl_interfaces.get(acl_d["name"], [])
+            acl_d["input"] = sorted({s for s, direction in items if direction == "in"})
+            acl_d["output"] = sorted({s for s, direction in items if direction == "out"})
 
-    def _acls_on_interfaces(self) -> LDAny:
-        """Return data of ACLs applied to the interfaces.
+    def _add_access_groups(self, key: str, lines: LStr) -> None:
+        """Add "ip access-group" lines of the section to self.acl_interfaces, self.interface_acls.
 
-        :example:
-            self.config: "interface GigabitEthernet1/1/1
-                            ip address 10.0.2.1 255.255.255.0
-                            ip access-group ACL_NAME in"
-            return: [{"acl": "ACL_NAME",
-                      "input": "interface GigabitEthernet1/1/1",
-                      "output": ""}]
-        """
-        access_groups: LDAny = []
-        intfs_cfg: DStr = self._interfaces_w_acl()
-        for intf_name, intf_cfg in intfs_cfg.items():
-            if not intf_name.startswith("interface "):
-                raise ValueError("invalid interface")
-            if access_group_t := re.findall(r"ip access-group (\S+) (\S+)", intf_cfg):
-                acl_name = access_group_t[0][0]
-                data: DAny = dict(name=acl_name, input="", output="")
-                for acl_name, direction in access_group_t:
-                    if not acl_name:
-                        raise ValueError(f"absent access-group {acl_name=}")
-                    if direction not in ["in", "out"]:
-                        raise ValueError(f"invalid access-group {direction=}")
-                    if direction == "in":
-                        data.update(dict(input=intf_name))
-                    elif direction == "out":
-                        data.update(dict(output=intf_name))
-                access_groups.append(data)
-        return access_groups
-
-    def _get_indented_dic(self, i, config_l) -> tuple:
-        """Config in multidimensional dict format.
-
-        Multi indented strings as dictionary in dictionary.
-        """
-        # init
-        key = config_l[i].strip()
-        i += 1
-        i_next = 0
-        data: DLStr = {"_config_": []}
-        indent_i = re.sub(r"(^\s*)(.*)", r"\1", config_l[i])  # indentation in first line
-        indent_next = ""
-
-        # Foreach config, indented lines add to dictionary as value.
-        # More indented line add to more embedded dictionary (dictionary of dictionary)
-        i_max = len(config_l)
-
-        # pylint: disable=redefined-argument-from-local
-        for i in range(i, i_max):
-            # skip already processed lines
-            if i_next and i <= i_next:
-                continue
-
-            # end of config_l
-            if i_max == i + 1:
-                break
-
-            # indentation in next line
-            indent_next = re.sub(r"(^\s*).*", r"\1", config_l[i + 1])
-            line_i = config_l[i]
-
-            # not indented lines, main config
-            if indent_i == indent_next:
-                data["_config_"].append(line_i.strip())  # add not indented line to config section
-
-            # next line is indented, make more deep indentation parsing
-            elif len(indent_i) < len(indent_next):
-                # indented config parser
-                (i_next, indent_next, mdic) = self._get_indented_dic(i, config_l)
-                data.update(mdic)  # save
-                if len(indent_i) > len(indent_next):
-                    i = i_next
-                    break
-
-            # end of indentation
-            elif len(indent_i) > len(indent_next):
-                data["_config_"].append(line_i.strip())  # add not indented line to config section
-                break
-
-        return i, indent_next, {key: data}
-
-    def _interfaces_w_acl(self) -> DStr:
-        r"""Return dict of interfaces with access-group, skip interfaces without ACLs.
+        :param key: Section line, interface name.
+        :param lines: Section lines.
 
         :example:
-            self.config: "interface GigabitEthernet1/1/1
-                            ip address 10.0.1.1 255.255.255.0
-                            ip access-group ACL_NAME in
-                          interface GigabitEthernet1/1/2
-                            ip address 10.0.2.1 255.255.255.0"
-            return: {"interface GigabitEthernet1/1/1":
-                     "ip address 10.0.1.1 255.255.255.0\nip access-group ACL_NAME in"}
+            key: "interface Ethernet1"
+            lines: ["ip access-group ACL1 in", "ip access-group ACL2 out"]
+            self.acl_interfaces: {"ACL1": [("interface Ethernet1", "in")],
+                                  "ACL2": [("interface Ethernet1", "out")]}
+            self.interface_acls: {"interface Ethernet1": [("ACL1", "in"), ("ACL2", "out")]}
+        :raises ValueError: If access-group is not in the interface or direction is invalid.
         """
-        return {k: s for k, s in self.dic_text.items() if re.search("ip access-group", s, re.M)}
+        for line in lines:
+            for acl_name, direction in RE_ACCESS_GROUP.findall(line):
+                if not key.startswith("interface "):
+                    raise ValueError(f"invalid interface {key=}")
+                if direction not in ["in", "out"]:
+                    raise ValueError(f"invalid access-group {direction=}")
+                intf_acls = self.interface_acls.setdefault(key, [])
+                if (acl_name, direction) in intf_acls:
+                    continue
+                intf_acls.append((acl_name, direction))
+                self.acl_interfaces.setdefault(acl_name, []).append((key, direction))
+
+    def _clear_access_groups(self) -> None:
+        """Delete "ip access-group" index before parsing."""
+        self.acl_interfaces = {}
+        self.interface_acls = {}
@@ -1,30 +1,52 @@
 """Functions to create Acl objects From the "show running-config" output."""
 
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from ipaddress import IPv4Network
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 
 import netports
 from vhelpers import vlist
 
 from cisco_acl import helpers as h
+from cisco_acl import wildcard as wc
 from cisco_acl.ace import Ace, LAce
 from cisco_acl.ace_group import LUAceg
 from cisco_acl.acl import Acl, LAcl
-from cisco_acl.addr_group import AddrGroup, LAddrGroup
-from cisco_acl.address import Address, LAddress
+from cisco_acl.addr_group import AddrGroup, DLAddrGroup, LAddrGroup
+from cisco_acl.address import Address, DLAddress, LAddress
 from cisco_acl.address_ag import AddressAg
 from cisco_acl.config_parser import ConfigParser
+from cisco_acl.lazy_ace import LazyAce
+from cisco_acl.parse_cache import ParseCache
 from cisco_acl.port import Port
 from cisco_acl.protocol import Protocol
-from cisco_acl.types_ import LDAny, LInt, LStr, DAny, LLStr
+from cisco_acl.stats import timed, with_stats
+from cisco_acl.types_ import LDAny, LInt, LStr, DAny, LLStr, UStr
 from cisco_acl.wildcard import init_max_ncwb
 
 UAddress = Union[Address, AddressAg]
+TDeviceConfig = Tuple[Any, UStr, Optional[DAny]]  # device_id, config, kwargs
+
+
+class DeviceAcls(NamedTuple):
+    """Result of acls_many() for one device.
+
+    :param device_id: Device identifier from the items of acls_many().
+    :param acls: Acl objects, empty list if parsing failed.
+    :param error: Exception raised while parsing the config, empty string if no error.
+    """
+
+    device_id: Any
+    acls: LAcl
+    error: str
 
 
 # noinspection PyIncorrectDocstring,DuplicatedCode
-def acls(config: str, **kwargs) -> LAcl:
+@with_stats
+def acls(config: UStr, **kwargs) -> LAcl:
     """Create Acl objects based on the "show running-config" output.
 
     Support address group objects.
@@ -32,7 +54,9 @@ def acls(config: str, **kwargs) -> LAcl:
     grouped to AceGroup by text in remarks (param `group_by`).
 
     :param config: Cisco config, "show running-config" output.
-    :type config: str
+        String or any iterable of lines (text iterator, file object), config is parsed
+        in streaming mode, line by line.
+    :type config: Union[str, Iterable[str]]
 
     :param platform: Platform: "asa", "ios", "nxos". Default "ios".
     :type platform: str
@@ -64,6 +88,18 @@ def acls(config: str, **kwargs) -> LAcl:
         until next Remark that also startswith `group_by`.
     :type group_by: str
 
+    :param lazy: ACE lines are parsed on the first access to ACE fields (LazyAce objects),
+        useful if only ACL names, interfaces and count of ACEs are needed. Default False.
+    :type lazy: bool
+
+    :param cache: Persistent cache of parsed ACLs and address groups,
+        ParseCache object or path to the cache directory. Default None, no cache.
+    :type cache: ParseCache, str, Path
+
+    :param stats: Collector of wall time and call counts of the parse phases,
+        statistics are available by ParseStats.data() after return. Default None.
+    :type stats: ParseStats
+
     :return: List of Acl objects.
     :rtype: List[Acl]
     """
@@ -75,15 +111,18 @@ def acls(config: str, **kwargs) -> LAcl:
     max_ncwb: int = init_max_ncwb(**kwargs)
     protocol_nr = bool(kwargs.get("protocol_nr"))
     port_nr = bool(kwargs.get("port_nr"))
+    lazy = bool(kwargs.get("lazy"))
 
     parser = ConfigParser(config=config, platform=platform, version=version)
-    parser.parse_config()
+    parser.parse_sections()
     parsed_acls: LDAny = parser.acls(names=names)
 
     acl_kwargs = dict(version=version, indent=indent, max_ncwb=max_ncwb,
-                      protocol_nr=protocol_nr, port_nr=port_nr)
-    acls_: LAcl = [Acl(**acl_kwargs, **d) for d in parsed_acls]  # type: ignore
-    _add_addgr_to_aces(acls_, parser)
+                      protocol_nr=protocol_nr, port_nr=port_nr, lazy=lazy)
+    with _init_cache(kwargs.get("cache")) as cache:
+        acls_: LAcl = [_create_acl(acl_kwargs, d, cache) for d in parsed_acls]
+        addgrs = _addgrs_by_name(parser.addgrs(), cache=cache)
+    _add_addgr_to_aces(acls_, parser, addgrs=addgrs)
     if group_by:
         for acl_o in acls_:
             acl_o.group(group_by=group_by)
@@ -91,11 +130,14 @@ def acls(config: str, **kwargs) -> LAcl:
 
 
 # noinspection PyIncorrectDocstring,DuplicatedCode
-def aces(config: str, **kwargs) -> LUAceg:
+@with_stats
+def aces(config: UStr, **kwargs) -> LUAceg:
     """Create Ace objects based on the "show running-config" output.
 
     :param config: Cisco config, "show running-config" output.
-    :type config: str
+        String or any iterable of lines (text iterator, file object), config is parsed
+        in streaming mode, line by line.
+    :type config: Union[str, Iterable[str]]
 
     :param platform: Platform: "asa", "ios", "nxos". Default "ios".
     :type platform: str
@@ -121,6 +163,10 @@ def aces(config: str, **kwargs) -> LUAceg:
         until next Remark that also startswith `group_by`.
     :type group_by: str
 
+    :param stats: Collector of wall time and call counts of the parse phases,
+        statistics are available by ParseStats.data() after return. Default None.
+    :type stats: ParseStats
+
     :return: List of Ace objects.
     :rtype: List[Ace]
     """
@@ -132,11 +178,10 @@ def aces(config: str, **kwargs) -> LUAceg:
     port_nr = bool(kwargs.get("port_nr"))
 
     parser = ConfigParser(config=config, platform=platform, version=version)
-    parser.parse_config()
 
     acl_kwargs = dict(version=version, max_ncwb=max_ncwb, protocol_nr=protocol_nr, port_nr=port_nr)
     acl_o = Acl(platform=platform, **acl_kwargs)  # type: ignore
-    for line in parser.lines:
+    for line in parser.iter_lines():
         # noinspection PyProtectedMember
         if ace_o := acl_o._line_to_oace(line):
             acl_o.items.append(ace_o)
@@ -147,11 +192,14 @@ def aces(config: str, **kwargs) -> LUAceg:
 
 
 # noinspection PyIncorrectDocstring
-def addrgroups(config: str, **kwargs) -> LAddrGroup:
+@with_stats
+def addrgroups(config: UStr, **kwargs) -> LAddrGroup:
     """Create AddrGroup objects based on the "show running-config" output.
 
     :param config: Cisco config, "show running-config" output.
-    :type config: str
+        String or any iterable of lines (text iterator, file object), config is parsed
+        in streaming mode, line by line.
+    :type config: Union[str, Iterable[str]]
 
     :param platform: Platform: "asa", "ios", "nxos". Default "ios".
     :type platform: str
@@ -165,6 +213,14 @@ def addrgroups(config: str, **kwargs) -> LAddrGroup:
     :param indent: Address lines indentation (default "  ").
     :type indent: str
 
+    :param cache: Persistent cache of parsed address groups,
+        ParseCache object or path to the cache directory. Default None, no cache.
+    :type cache: ParseCache, str, Path
+
+    :param stats: Collector of wall time and call counts of the parse phases,
+        statistics are available by ParseStats.data() after return. Default None.
+    :type stats: ParseStats
+
     :return: List of AddrGroup objects.
     :rtype: List[AddrGroup]
     """
@@ -174,12 +230,68 @@ def addrgroups(config: str, **kwargs) -> LAddrGroup:
     indent: str = h.init_indent(**kwargs)
 
     parser = ConfigParser(config=config, platform=platform, version=version)
-    parser.parse_config()
+    parser.parse_sections()
 
     parsed_addgrs: LDAny = parser.addgrs()
     ag_kwargs = dict(version=version, max_ncwb=max_ncwb, indent=indent)
-    addgrs: LAddrGroup = [AddrGroup(**ag_kwargs, **d) for d in parsed_addgrs]  # type: ignore
-    return addgrs
+    with _init_cache(kwargs.get("cache")) as cache:
+        if cache is None:
+            return [AddrGroup(**ag_kwargs, **d) for d in parsed_addgrs]  # type: ignore
+        return [cache.create(AddrGroup, **ag_kwargs, **d) for d in parsed_addgrs]
+
+
+def acls_many(
+        items: Iterable[TDeviceConfig],
+        max_workers: Optional[int] = None,
+        max_pending: int = 0,
+        mp_context: Any = None,
+) -> Iterator[DeviceAcls]:
+    """Create Acl objects for many devices in parallel processes.
+
+    Each config is parsed by acls() in ProcessPoolExecutor. Results are yielded as they
+    are finished, not in order of the items. Exception raised while parsing the config
+    of a device does not stop other devices, it is returned in DeviceAcls.error.
+
+    :param items: Iterable of (device_id, config, kwargs). `config` is "show running-config"
+        output: string or iterable of lines (file object is read in the parent process).
+        `kwargs` are the params of acls(): platform, version, names, etc.
+    :type items: Iterable[Tuple[Any, Union[str, Iterable[str]], Optional[dict]]]
+
+    :param max_workers: Max count of the worker processes, default os.cpu_count().
+    :type max_workers: int
+
+    :param max_pending: Max count of the configs submitted to the pool and not yet
+        returned, default `max_workers` * 2. Limits memory usage on large fleets.
+    :type max_pending: int
+
+    :param mp_context: Multiprocessing context of the ProcessPoolExecutor.
+
+    :return: Generator of DeviceAcls (device_id, acls, error).
+    :rtype: Iterator[DeviceAcls]
+
+    :example:
+        items = [("router1", config1, {"platform": "ios"}),
+                 ("switch1", config2, {"platform": "nxos"})]
+        for device_id, acls_, error in acls_many(items, max_workers=4):
+            ...
+    """
+    workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        pending: Dict[Future, Any] = {}  # future: device_id
+        for device_id, config, kwargs in items:
+            if not isinstance(config, str):
+                config = list(config)
+            future = executor.submit(_acls_device, device_id, config, kwargs or {})
+            pending[future] = device_id
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _future_result(future, pending.pop(future))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _future_result(future, pending.pop(future))
 
 
 # noinspection PyIncorrectDocstring
@@ -308,32 +420,58 @@ def subnet_of(top: UAddress, bottom: UAddress) -> bool:
     :return: True - if address is subnet of `other` address.
     :rtype: bool
     """
-    tops_ = top.ipnets()
-    bottoms_ = bottom.ipnets()
-
-    for bottom_ in bottoms_:
-        for top_ in tops_:
-            if bottom_.subnet_of(top_):
-                break
-        else:
-            return False
-    return True
+    bottoms_ = bottom.wildcard_ints()
+    if not bottoms_:
+        return True
+    return wc.subnet_of(tops=top.wildcard_ints(), bottoms=bottoms_)
 
 
 # ============================= helper ===============================
 
 
-def _check_addgr(ace_o, addgrs, address_o, parser) -> bool:
+def _acls_device(device_id: Any, config: UStr, kwargs: DAny) -> DeviceAcls:
+    """Create Acl objects for one device, worker of acls_many()."""
+    try:
+        acls_ = acls(config, **kwargs)
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        return DeviceAcls(device_id=device_id, acls=[], error=f"{type(ex).__name__}: {ex}")
+    return DeviceAcls(device_id=device_id, acls=acls_, error="")
+
+
+@timed("acl")
+def _create_acl(acl_kwargs: DAny, acl_d: DAny, cache: Optional[ParseCache]) -> Acl:
+    """Create Acl object or load it from the cache, interfaces are not the key of the cache."""
+    if cache is None:
+        return Acl(**acl_kwargs, **acl_d)
+    data = {**acl_kwargs, **acl_d}
+    input_ = data.pop("input")
+    output = data.pop("output")
+    acl_o: Acl = cache.create(Acl, **data)
+    acl_o.input = input_
+    acl_o.output = output
+    return acl_o
+
+
+def _future_result(future: Future, device_id: Any) -> DeviceAcls:
+    """Return result of acls_many() worker, errors of the pool are returned as device error."""
+    try:
+        return future.result()
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        return DeviceAcls(device_id=device_id, acls=[], error=f"{type(ex).__name__}: {ex}")
+
+
+def _check_addgr(ace_o, addgrs: DLAddrGroup, address_o, parser) -> bool:
     """Check addresses in address group.
 
+    :param addgrs: Address groups indexed by name.
+
     :return: True - Single Address group present in config.
         False - Address group not found in config or detected multiple groups,
         with the same name.
     """
     ace = ace_o.line
     addrgroup = address_o.addrgroup
-    addgrs_ = [o for o in addgrs if o.name == addrgroup]
-    count = len(addgrs_)
+    count = len(addgrs.get(addrgroup) or [])
     if not count:
         line = f"{parser.pattern__object_group()} {addrgroup}"
         msg = f"{ace=} has no addresses, {line=} not found in config"
@@ -386,30 +524,59 @@ def _create_acls_w_acegs(parser: ConfigParser, group_by: str) -> LAcl:
     return acls_w_aceg
 
 
-def _add_addgr_to_aces(acls_: LAcl, parser: ConfigParser) -> None:
+@timed("addrgroup_binding")
+def _add_addgr_to_aces(acls_: LAcl, parser: ConfigParser, addgrs: Optional[DLAddrGroup] = None,
+                       resolved: Optional[DLAddress] = None) -> None:
     """Add address groups to Ace.srcaddr Ace.dstaddr.
 
+    Members of the address group are converted to Address objects once,
+    all ACE addresses that refer to the group share the same list of items.
+
     :param acls_: Side effect.
+    :param addgrs: Address groups indexed by name, default parsed from `parser`.
+    :param resolved: Items of the address groups, shared by ACE addresses.
+        Side effect, items of the new groups are added.
     """
-    parsed_addgrs = parser.addgrs()
-    addgrs: LAddrGroup = [AddrGroup(**d) for d in parsed_addgrs]
+    if addgrs is None:
+        addgrs = _addgrs_by_name(parser.addgrs())
+    if resolved is None:
+        resolved = {}
 
     for acl_o in acls_:
         _aces: LAce = [o for o in acl_o.items if isinstance(o, Ace)]
+        _aces = [o for o in _aces if not isinstance(o, LazyAce) or o.has_addrgroup]
         for ace_o in _aces:
             addrs_w_addgr: LAddress = [o for o in (ace_o.srcaddr, ace_o.dstaddr) if o.addrgroup]
             addrs_w_addgr = [o for o in addrs_w_addgr if _check_addgr(ace_o, addgrs, o, parser)]
             for addr_ace_o in addrs_w_addgr:
                 addgr_name = addr_ace_o.addrgroup
-                addgr_o: AddrGroup = [o for o in addgrs if o.name == addgr_name][0]
-                for address_ag_o in addgr_o.items:
-                    if not isinstance(address_ag_o, AddressAg):
-                        continue
-                    address_ag_o.sequence = 0
-                    address_ag_d = address_ag_o.data()
-                    _convert_ios_addr(address_ag_d)
-                    addr_item_o = Address(**address_ag_d)
-                    addr_ace_o.items.append(addr_item_o)
+                items = resolved.get(addgr_name)
+                if items is None:
+                    items = resolved[addgr_name] = _addgr_items(addgrs[addgr_name][0])
+                # noinspection PyProtectedMember
+                addr_ace_o._items = items
+
+
+def _addgrs_by_name(parsed_addgrs: LDAny, cache: Optional[ParseCache] = None) -> DLAddrGroup:
+    """Create AddrGroup objects from parsed address groups, indexed by name."""
+    addgrs: DLAddrGroup = {}
+    for addgr_d in parsed_addgrs:
+        addgr_o = AddrGroup(**addgr_d) if cache is None else cache.create(AddrGroup, **addgr_d)
+        addgrs.setdefault(addgr_o.name, []).append(addgr_o)
+    return addgrs
+
+
+def _addgr_items(addgr_o: AddrGroup) -> LAddress:
+    """Convert AddressAg items of the address group to Address objects."""
+    items: LAddress = []
+    for address_ag_o in addgr_o.items:
+        if not isinstance(address_ag_o, AddressAg):
+            continue
+        address_ag_o.sequence = 0
+        address_ag_d = address_ag_o.data()
+        _convert_ios_addr(address_ag_d)
+        items.append(Address(**address_ag_d))
+    return items
 
 
 def _convert_ios_addr(address_ag_d: DAny) -> None:
@@ -426,6 +593,22 @@ def _convert_ios_addr(address_ag_d: DAny) -> None:
     address_ag_d["line"] = wildcard
 
 
+@contextmanager
+def _init_cache(cache: Any) -> Iterator[Optional[ParseCache]]:
+    """Init ParseCache from ParseCache object or path to the cache directory.
+
+    ParseCache created from the path is closed on exit, ParseCache object of the caller is not.
+    """
+    if cache is None or isinstance(cache, ParseCache):
+        yield cache
+        return
+    if isinstance(cache, (str, os.PathLike)):
+        with ParseCache(cache) as cache_:
+            yield cache_
+        return
+    raise TypeError(f"{cache=} {ParseCache} expected")
+
+
 def _range__port(
         ports_range: str,
         sdst: str,
@@ -473,7 +656,10 @@ def _range__port(
         port = " ".join([f"{i}" for i in ports_])
 
         ace_o = Ace(line, platform=platform, port_nr=port_nr)
-        ace_o.protocol.has_port = True
+        protocol_o = ace_o.protocol.copy()  # interned Protocol is shared
+        protocol_o.has_port = True
+        # noinspection PyProtectedMember
+        ace_o._protocol = protocol_o
 
         # operator
         attr = f"{sdst}port"
@@ -491,8 +677,11 @@ def _range__port(
             protocol=ace_o.protocol.name,
             port_nr=ace_o.port_nr,
         )
-        attr = f"_{sdst}port"
-        setattr(ace_o, attr, port_o)
+        # noinspection PyProtectedMember
+        if sdst == "src":
+            ace_o._srcport = port_o
+        else:
+            ace_o._dstport = port_o
         aces_.append(ace_o)
 
     return aces_
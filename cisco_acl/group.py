@@ -29,6 +29,7 @@ class Group:
     def __delitem__(self, idx: int) -> None:
         """Delete self.items[key]."""
         self.items.__delitem__(idx)
+        self._items_changed()
 
     def __getitem__(self, idx: int):
         """__getitem__."""
@@ -53,14 +54,17 @@ class Group:
         """Add new item to self.items list, if it is not in self.items."""
         if item not in self.items:
             self.items.append(item)
+            self._items_changed()
 
     def append(self, item) -> None:
         """Append item to the end of the self.items list."""
         self.items.append(item)
+        self._items_changed()
 
     def clear(self) -> None:
         """Remove all items from the self.items list."""
         self.items = []
+        self._items_changed()
 
     def copy(self):
         """Return a shallow copy of the self.items list."""
@@ -74,11 +78,13 @@ class Group:
         """Remove item from the self.items list."""
         if item in self.items:
             self.items.remove(item)
+            self._items_changed()
 
     def extend(self, items: Iterable) -> None:
         """Extend the self.items list by appending items."""
         if isinstance(items, (list, set, tuple)):
             self.items.extend(list(items))
+            self._items_changed()
             return
         raise TypeError(f"{items=} {list} expected")
 
@@ -91,14 +97,17 @@ class Group:
 
     def insert(self, *args) -> None:
         """Insert item before index."""
-        return self.items.insert(*args)
+        self.items.insert(*args)
+        self._items_changed()
 
     def pop(self, *args):
         """Remove and return item at index (default last).
 
         Raise IndexError if list is empty or index is out of range.
         """
-        return self.items.pop(*args)
+        item = self.items.pop(*args)
+        self._items_changed()
+        return item
 
     def remove(self, *args) -> None:
         """Remove first occurrence of items in the self.items.
@@ -106,10 +115,12 @@ class Group:
         Raise ValueError if the item is not present.
         """
         self.items.remove(*args)
+        self._items_changed()
 
     def reverse(self) -> None:
         """Reverse order of items in the self.items list."""
         self.items.reverse()
+        self._items_changed()
 
     def sort(self, *args, **kwargs) -> None:
         """Sort the self.items list in ascending order.
@@ -118,8 +129,14 @@ class Group:
             self.items.sort(reverse=True|False, key=myFunc)
         """
         self.items.sort(*args, **kwargs)
+        self._items_changed()
 
     def update(self, items: list) -> None:
         """Extend list by adding items to self.items list, if it is not in the self.items."""
         for item in items:
             self.add(item)
+
+    # =========================== helper =============================
+
+    def _items_changed(self) -> None:
+        """Call after self.items list is changed in place, reset data cached by the subclasses."""
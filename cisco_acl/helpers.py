@@ -2,15 +2,16 @@
 
 import logging
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 from ipaddress import IPv4Network
 from string import ascii_letters, digits, punctuation
 from time import time
-from typing import Any, List, NamedTuple
+from typing import Any, Iterable, List, NamedTuple
 
 from netports import SwVersion
 
-from cisco_acl.types_ import LStr, StrInt, LInt, OInt, SInt, T2Str, T3Str, DInt, SStr, LIpNet
+from cisco_acl.types_ import LStr, StrInt, LInt, OInt, SInt, T2Str, T3Str, DInt, SStr, LIpNet, \
+    TT2Int
 
 IOS = "ios"
 MAX_LINE_LENGTH = 100
@@ -21,6 +22,8 @@ OPERATORS = ("eq", "gt", "lt", "neq", "range")
 
 DEF_INDENT = "  "
 OCTETS = r"\d+\.\d+\.\d+\.\d+"
+PORT_MIN = 1
+PORT_MAX = 65535
 
 
 # =============================== str ================================
@@ -262,13 +265,19 @@ def init_type(**kwargs) -> str:
 def init_version(**kwargs) -> SwVersion:
     """Init version.
 
-    Convert software version string to SwVersion object.
+    Convert software version string to SwVersion object, objects are shared (immutable).
     :param version: software version string.
     :return: SwVersion object.
     """
     version = str(kwargs.get("version") or "")
     if not version:
         version = "0"
+    return _init_sw_version(version)
+
+
+@lru_cache(maxsize=128)
+def _init_sw_version(version: str) -> SwVersion:
+    """Return SwVersion object, objects with the same version text are shared."""
     return SwVersion(version)
 
 
@@ -302,6 +311,18 @@ def is_line_for_acl(line: str) -> bool:
     return False
 
 
+def is_iterable_lines(items: Any) -> bool:
+    """Check `items` is iterable of lines (text iterator, file object), but not a string.
+
+    :example:
+        items: io.StringIO("line1\nline2")
+        return: True
+    """
+    if isinstance(items, (str, bytes, dict)):
+        return False
+    return isinstance(items, Iterable)
+
+
 def lines_wo_spaces(line: str) -> LStr:
     r"""Split line by newline, replaces multiple white spaces with single space.
 
@@ -468,6 +489,65 @@ def ports_to_string(items: LInt) -> str:
     return ",".join(ranges)
 
 
+def ports_to_ranges(items: LInt) -> TT2Int:
+    """Convert list of ports to sorted tuple of (lo, hi) intervals.
+
+    :example:
+        items: [1,3,4,5]
+        return: ((1, 1), (3, 5))
+    """
+    ranges: List[List[int]] = []
+    for item in sorted(items):
+        if ranges and item - ranges[-1][1] <= 1:
+            ranges[-1][1] = max(ranges[-1][1], item)
+        else:
+            ranges.append([item, item])
+    return tuple((lo, hi) for lo, hi in ranges)
+
+
+def ranges_to_ports(ranges: TT2Int) -> LInt:
+    """Convert (lo, hi) intervals to list of ports.
+
+    :example:
+        ranges: ((1, 1), (3, 5))
+        return: [1, 3, 4, 5]
+    """
+    return [i for lo, hi in ranges for i in range(lo, hi + 1)]
+
+
+def ranges_to_string(ranges: TT2Int) -> str:
+    """Convert (lo, hi) intervals to string.
+
+    :example:
+        ranges: ((1, 1), (3, 5))
+        return: "1,3-5"
+    """
+    return ",".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in ranges)
+
+
+def ranges_subset(tops: TT2Int, bottoms: TT2Int) -> bool:
+    """Check all `bottoms` intervals are covered by `tops` intervals.
+
+    :param tops: Sorted and merged (lo, hi) intervals in the top.
+    :param bottoms: Sorted (lo, hi) intervals in the bottom.
+    :return: True - if all ports in `bottoms` are in `tops`.
+    :example:
+        tops: ((1, 5),)
+        bottoms: ((1, 1), (3, 5))
+        return: True
+    """
+    idx = 0
+    for lo, hi in bottoms:
+        while idx < len(tops) and tops[idx][1] < lo:
+            idx += 1
+        if idx >= len(tops):
+            return False
+        top_lo, top_hi = tops[idx]
+        if not top_lo <= lo <= hi <= top_hi:
+            return False
+    return True
+
+
 def string_to_ports(ports: str) -> LInt:
     """Convert string to list of ports.
 
@@ -0,0 +1,104 @@
+"""LazyAce - ACE with deferred parsing.
+
+LazyAce keeps the normalized ACE line, sequence number and action. Protocol, addresses, ports
+and options are parsed on the first access to any of these fields (or to `line`, `data()`,
+etc.), after that LazyAce behaves like Ace. Useful for jobs that need only ACL names,
+interfaces and count of ACEs. Invalid ACE lines raise ValueError on the first access.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from cisco_acl import parsers, helpers as h
+from cisco_acl.ace import Ace
+from cisco_acl.ace_base import AceBase
+
+# attributes set by parsing of the line
+LAZY_SLOTS = ("_type", "_protocol", "_srcaddr", "_srcport", "_dstaddr", "_dstport", "_option")
+
+
+class LazyAce(Ace):
+    """ACE with deferred parsing, the line is parsed on the first access to ACE fields."""
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, line: str, **kwargs):
+        """Init LazyAce.
+
+        :param line: ACE config, a line that starts with "allow" or "deny".
+        :type line: str
+
+        Other parameters are the same as in Ace.
+
+        :example:
+            ace = LazyAce("10 permit tcp host 10.0.0.1 eq 179 any")
+            ace.is_parsed -> False
+            ace.sequence -> 10
+            ace.action -> "permit"
+            ace.srcport -> Port("eq bgp")
+            ace.is_parsed -> True
+        """
+        self._raw = ""
+        if kwargs.get("srcaddr") or kwargs.get("dstaddr"):  # items of address groups
+            Ace.__init__(self, line, **kwargs)
+            return
+        AceBase.__init__(self, **kwargs)  # platform, note, protocol_nr, port_nr, max_ncwb
+        line = h.init_line(line)
+        ace_d = parsers.parse_action(line)
+        self._sequence = h.init_int(ace_d["sequence"])
+        self._action = h.init_ace_action(ace_d["action"])
+        self._raw = line
+        del self._type  # detected by parsing, unless changed by Acl or AceGroup
+
+    def __getattr__(self, name: str) -> Any:
+        """Parse the line on the first access to the ACE fields."""
+        if name in LAZY_SLOTS and self._raw:
+            self._parse()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __hash__(self) -> int:
+        """__hash__."""
+        return self.line.__hash__()
+
+    def __eq__(self, other) -> bool:
+        """== equality, LazyAce is equal to Ace with the same line."""
+        if isinstance(other, Ace):
+            return self.__hash__() == other.__hash__()
+        return False
+
+    # =========================== property ===========================
+
+    @property
+    def has_addrgroup(self) -> bool:
+        """True if the ACE refers to an address group, the line is not parsed."""
+        if self._raw:
+            return not parsers.ADDRGROUPS.isdisjoint(self._raw.split(" "))
+        return bool(self._srcaddr.addrgroup or self._dstaddr.addrgroup)
+
+    @property
+    def is_parsed(self) -> bool:
+        """True if the line is parsed to ACE fields."""
+        return not self._raw
+
+    # =========================== helper =============================
+
+    def _parse(self) -> None:
+        """Parse the line, set ACE fields, sequence number changed before parsing is kept."""
+        ace_o = Ace(
+            line=self._raw,
+            platform=self._platform,
+            version=self.version,
+            protocol_nr=self._protocol_nr,
+            port_nr=self._port_nr,
+            max_ncwb=self.max_ncwb,
+        )
+        try:
+            type_ = object.__getattribute__(self, "_type")
+        except AttributeError:
+            type_ = ace_o.type
+        for name in LAZY_SLOTS:
+            setattr(self, name, getattr(ace_o, name))
+        self._type = type_
+        self._raw = ""
@@ -16,6 +16,8 @@ LOGS = ("log", "log-input")
 class Option(Base):
     """ACE. Option."""
 
+    __slots__ = ("_line", "_flags", "_logs")
+
     def __init__(self, line: str = "", **kwargs):
         """Init Option.
 
@@ -0,0 +1,236 @@
+"""ParseCache - persistent cache of parsed objects in SQLite database (optional).
+
+Maps the hash of the parameters of the object (config section, platform, version,
+parse options) to the compressed pickled Acl or AddrGroup object. Identical ACLs of many
+devices (golden templates) are parsed once. Objects loaded from the cache get new UUIDs.
+
+The cache is stamped by CACHE_VERSION and the package version, entries of another version
+are deleted on open. The least recently used entries are deleted if the size of the entries
+is more than `max_bytes`, the size is a running total in the meta table, kept by triggers.
+
+:example:
+    cache = ParseCache("~/.cache/cisco_acl", max_bytes=100_000_000)
+    acls = cisco_acl.acls(config, cache=cache)
+    cache.stats() -> {"hits": 90, "misses": 10, "entries": 10, "bytes": 81920, ...}
+"""
+
+from __future__ import annotations
+
+import copyreg
+import hashlib
+import io
+import pickle
+import sqlite3
+import sys
+import zlib
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from cisco_acl.base import Base
+from cisco_acl.types_ import DAny, DInt
+
+CACHE_VERSION = 1  # increase if cached objects are changed
+DB_NAME = "cisco_acl_cache.sqlite3"
+DEF_MAX_BYTES = 256 * 1024 * 1024
+UPath = Union[str, Path]
+
+
+class ParseCache:
+    """Persistent cache of parsed objects in SQLite database."""
+
+    def __init__(self, path: UPath, max_bytes: int = DEF_MAX_BYTES):
+        """Init ParseCache, database is opened on the first access.
+
+        :param path: Directory of the cache, created if not exists.
+        :type path: str, Path
+
+        :param max_bytes: Max size of the entries (compressed pickled objects) in bytes.
+        :type max_bytes: int
+
+        :raises ValueError: If max_bytes < 1.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"{max_bytes=} expected >= 1")
+        self.path: Path = Path(path).expanduser()
+        self.max_bytes: int = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._used = 0  # usage counter of the entries, the last used entry has the max value
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}({str(self.path)!r}, max_bytes={self.max_bytes})"
+
+    def __enter__(self) -> ParseCache:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close database."""
+        self.close()
+
+    def __getstate__(self) -> DAny:
+        """Return state for pickle (acls_many() workers), database is opened again."""
+        return dict(path=self.path, max_bytes=self.max_bytes)
+
+    def __setstate__(self, state: DAny) -> None:
+        """Restore state from pickle."""
+        self.__init__(**state)  # type: ignore
+
+    # =========================== method =============================
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        self._connect().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def create(self, cls, **kwargs) -> Any:
+        """Return object loaded from the cache, or create object and store it in the cache.
+
+        :param cls: Class of the object, Acl or AddrGroup.
+        :param kwargs: Parameters of the object, key of the cache.
+        :return: Object, equal to cls(**kwargs).
+        """
+        key = make_key(cls.__name__, sorted(kwargs.items()))
+        if (obj := self.get(key)) is not None:
+            return obj
+        obj = cls(**kwargs)
+        self.set(key, obj)
+        return obj
+
+    def get(self, key: str) -> Any:
+        """Return object loaded from the cache, None if key is not in the cache."""
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        conn.execute("UPDATE entries SET used = ? WHERE key = ?", (self._next_used(), key))
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, obj: Any) -> None:
+        """Store object in the cache, delete the least recently used entries above max_bytes."""
+        value = zlib.compress(dumps(obj), 1)
+        if len(value) > self.max_bytes:
+            return
+        conn = self._connect()
+        conn.execute("INSERT OR REPLACE INTO entries (key, value, size, used) VALUES (?, ?, ?, ?)",
+                     (key, value, len(value), self._next_used()))
+        if self._size() > self.max_bytes:
+            self._evict()
+
+    def stats(self) -> DInt:
+        """Return hits, misses, count of entries, size of entries and max size in bytes."""
+        conn = self._connect()
+        entries, size = conn.execute("SELECT COUNT(*), SUM(size) FROM entries").fetchone()
+        return dict(hits=self.hits, misses=self.misses, entries=entries, bytes=size or 0,
+                    max_bytes=self.max_bytes)
+
+    # =========================== helper =============================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database, create tables, delete entries of another version."""
+        if self._conn is not None:
+            return self._conn
+        self.path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path / DB_NAME), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA recursive_triggers=ON")  # delete trigger on INSERT OR REPLACE
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+                         "value BLOB NOT NULL, size INTEGER NOT NULL, used INTEGER NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            # running total of the entries size
+            conn.execute("CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                         "BEGIN UPDATE meta SET value = value + new.size WHERE name = 'size'; END")
+            conn.execute("CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                         "BEGIN UPDATE meta SET value = value - old.size WHERE name = 'size'; END")
+            conn.execute("INSERT OR IGNORE INTO meta (name, value) "
+                         "SELECT 'size', COALESCE(SUM(size), 0) FROM entries")
+            stamp = version_stamp()
+            row = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != stamp:
+                conn.execute("DELETE FROM entries")
+                conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)",
+                             (stamp,))
+            self._used = conn.execute("SELECT MAX(used) FROM entries").fetchone()[0] or 0
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries if size is more than max_bytes."""
+        conn = self._connect()
+        size = self._size()
+        if size <= self.max_bytes:
+            return
+        keys = []
+        for key, size_ in conn.execute("SELECT key, size FROM entries ORDER BY used"):
+            if size <= self.max_bytes:
+                break
+            keys.append((key,))
+            size -= size_
+        conn.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+    def _size(self) -> int:
+        """Return size of the entries, running total in the meta table."""
+        row = self._connect().execute("SELECT value FROM meta WHERE name = 'size'").fetchone()
+        return int(row[0])
+
+    def _next_used(self) -> int:
+        """Return the next value of the usage counter, entries with lower values are older."""
+        self._used += 1
+        return self._used
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler of Base objects without UUID, loaded objects get new (lazy) UUID."""
+
+    def reducer_override(self, obj):
+        """Return state of Base object with empty UUID."""
+        if isinstance(obj, Base):
+            # noinspection PyProtectedMember
+            state = obj._slots_data()
+            state["_uuid"] = ""
+            state["version"] = str(obj.version)
+            return copyreg.__newobj__, (type(obj),), state  # type: ignore
+        return NotImplemented
+
+
+# ============================ functions =============================
+
+
+def dumps(obj: Any) -> bytes:
+    """Pickle object, Base objects are pickled without UUID."""
+    file = io.BytesIO()
+    _Pickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return file.getvalue()
+
+
+def make_key(*items: Any) -> str:
+    """Return hash of the items, key of the cache entry."""
+    return hashlib.blake2b(repr(items).encode(), digest_size=20).hexdigest()
+
+
+def version_stamp() -> str:
+    """Return version of the cached entries: CACHE_VERSION, package and Python versions."""
+    try:
+        package_version = version("cisco_acl")
+    except PackageNotFoundError:
+        package_version = "0"
+    return f"{CACHE_VERSION}:{package_version}:{sys.version_info[0]}.{sys.version_info[1]}"
@@ -1,11 +1,70 @@
-"""Parsing helpers."""
+"""Parsing helpers.
+
+ACE lines normalized by helpers.init_line() (single spaces, no leading/trailing spaces)
+are parsed by the tokenizer in one pass over the words of the line.
+Not normalized lines are parsed by the regex, the result of both is identical.
+"""
+
+import re
+from itertools import chain
+from typing import List, Optional, Tuple
 
 from cisco_acl import helpers as h
 from cisco_acl.port_name import all_known_names
+from cisco_acl.stats import timed
 from cisco_acl.types_ import DStr, LStr
 
+KNOWN_NAMES = frozenset(all_known_names())
+OPERATORS = frozenset(h.OPERATORS)
+ACE_ACTIONS = ("permit", "deny")
+ADDRGROUPS = frozenset(("object-group", "addrgroup"))  # ios: "object-group", nxos: "addrgroup"
+ADDR_FIRST_CHARS = frozenset("aho")  # first chars of "any", "host", "object-group", "addrgroup"
+
+RE_OCTETS = re.compile(h.OCTETS)
+RE_PREFIX = re.compile(h.OCTETS + r"/\d+")
+
+TAddr = Tuple[str, int, bool]  # address, count of words, is the last word matched entirely
+
+
+def _ace_regex(standard: bool) -> "re.Pattern":
+    """Compile regex of extended or standard ACE line."""
+    space = r"(?: )"
+    text = r"\S+"
+    addrs = [
+        "any",  # "any"
+        f"host {h.OCTETS}",  # "host A.B.C.D"
+        f"(?:object-group|addrgroup) {text}",  # ios: "object-group", nxos: "addrgroup"
+        h.OCTETS + r"/\d+",  # "A.B.C.D/LEN"
+        f"{h.OCTETS} {h.OCTETS}",  # "A.B.C.D A.B.C.D"
+    ]
+    if standard:
+        addrs.append(h.OCTETS)  # host
+    addr = "|".join(addrs)
+
+    re_sequence = r"(\d+)?"
+    re_action = f"{space}?(permit|deny)"
+    if standard:
+        re_srcaddr = f"{space}({addr})"
+        re_log = "( .+)?"
+        return re.compile(f"^{re_sequence}{re_action}{re_srcaddr}{re_log}")
+    re_proto = f"({space}{text})?"
+    re_srcaddr = f"{space}({addr})"
+    re_srcport = "( .+)?"
+    re_dstaddr = f"{space}({addr})"
+    re_dstport = "( .+)?"
+    return re.compile(
+        f"^{re_sequence}{re_action}{re_proto}{re_srcaddr}{re_srcport}{re_dstaddr}{re_dstport}"
+    )
+
 
-def parse_ace_extended(line: str) -> DStr:  # pylint: disable=too-many-locals
+RE_ACE_EXTENDED = _ace_regex(standard=False)
+RE_ACE_STANDARD = _ace_regex(standard=True)
+RE_ACTION = re.compile(r"^(\d+)?(?: )?(" + "|".join(h.ACTIONS) + r")( .+)")
+RE_ADDRESS = re.compile(r"^(\d+\s+)?(.+)")
+
+
+@timed("tokenize")
+def parse_ace_extended(line: str) -> DStr:
     """Parse extended ACE line to the dictionary.
 
     :param line: ACE string.
@@ -23,32 +82,14 @@ def parse_ace_extended(line: str) -> DStr:  # pylint: disable=too-many-locals
         "option": "log",
      }
     """
-    space = r"(?: )"
-    text = r"\S+"
-    addr = "|".join(
-        [
-            "any",  # "any"
-            f"host {h.OCTETS}",  # "host A.B.C.D"
-            f"(?:object-group|addrgroup) {text}",  # ios: "object-group", nxos: "addrgroup"
-            h.OCTETS + r"/\d+",  # "A.B.C.D/LEN"
-            f"{h.OCTETS} {h.OCTETS}",  # "A.B.C.D A.B.C.D"
-        ]
-    )
-
-    re_sequence = r"(\d+)?"
-    re_action = f"{space}?(permit|deny)"
-    re_proto = f"({space}{text})?"
-    re_srcaddr = f"{space}({addr})"
-    re_srcport = "( .+)?"
-    re_dstaddr = f"{space}({addr})"
-    re_dstport = "( .+)?"
-
-    regex = f"^{re_sequence}{re_action}{re_proto}{re_srcaddr}{re_srcport}{re_dstaddr}{re_dstport}"
-    _items = h.re_find_t(regex, line)
-    if not _items:
+    words = line.split()
+    if " ".join(words) == line:
+        items = _tokenize_ace_extended(words)
+    else:
+        items = _regex_items(RE_ACE_EXTENDED, line)
+    if not items:
         return {}
 
-    items = [s.strip() for s in _items]
     dstport_option = items[-1]
     result: DStr = _parse_dstport_option(dstport_option)
     data = dict(
@@ -64,6 +105,7 @@ def parse_ace_extended(line: str) -> DStr:  # pylint: disable=too-many-locals
     return data
 
 
+@timed("tokenize")
 def parse_ace_standard(line: str) -> DStr:
     """Parse standard ACE line to the dictionary.
 
@@ -81,30 +123,14 @@ def parse_ace_standard(line: str) -> DStr:
                  "dstport": "",
                  "option": "log"}
     """
-    space = r"(?: )"
-    text = r"\S+"
-    addr = "|".join(
-        [
-            "any",  # "any"
-            f"host {h.OCTETS}",  # "host A.B.C.D"
-            f"(?:object-group|addrgroup) {text}",  # ios: "object-group", nxos: "addrgroup"
-            h.OCTETS + r"/\d+",  # "A.B.C.D/LEN"
-            f"{h.OCTETS} {h.OCTETS}",  # "A.B.C.D A.B.C.D"
-            h.OCTETS,  # host
-        ]
-    )
-
-    re_sequence = r"(\d+)?"
-    re_action = f"{space}?(permit|deny)"
-    re_srcaddr = f"{space}({addr})"
-    re_log = "( .+)?"
-
-    regex = f"^{re_sequence}{re_action}{re_srcaddr}{re_log}"
-    _items = h.re_find_t(regex, line)
-    if not _items:
+    words = line.split()
+    if " ".join(words) == line:
+        items = _tokenize_ace_standard(words)
+    else:
+        items = _regex_items(RE_ACE_STANDARD, line)
+    if not items:
         return {}
 
-    items = [s.strip() for s in _items]
     data = dict(
         sequence=items[0],
         action=items[1],
@@ -129,15 +155,14 @@ def _parse_dstport_option(line: str) -> DStr:
     """
     dstports: LStr = []  # result
     options: LStr = []  # result
-    known_names = all_known_names()
 
     if items := line.split():
         operator = items[0]
-        if operator in h.OPERATORS:
+        if operator in OPERATORS:
             dstports.append(operator)
             items = items[1:]
             for id_, item in enumerate(items):
-                if item.isdigit() or item in known_names:
+                if item.isdigit() or item in KNOWN_NAMES:
                     dstports.append(item)
                     continue
                 options = items[id_:]
@@ -158,17 +183,9 @@ def parse_action(line: str) -> DStr:
         line: "permit ip any any"
         return: "permit"
     """
-    space = r"(?: )"
-    actions = "|".join(h.ACTIONS)
-
-    re_sequence = r"(\d+)?"
-    re_action = f"{space}?({actions})"
-    re_text = r"( .+)"
-    regex = f"^{re_sequence}{re_action}{re_text}"
-    _items = h.re_find_t(regex, line)
-    if not _items:
+    items = _regex_items(RE_ACTION, line)
+    if not items:
         raise ValueError(f"invalid {line=}")
-    items = [s.strip() for s in _items]
     data = dict(
         sequence=items[0],
         action=items[1],
@@ -184,15 +201,164 @@ def parse_address(line: str) -> DStr:
         line: "10 host 10.0.0.1"
         return: {"sequence": 10, "address": "host 10.0.0.1"}
     """
-    re_sequence = r"(\d+\s+)?"
-    re_address = "(.+)"
-    regex = f"^{re_sequence}{re_address}"
-    _items = h.re_find_t(regex, line)
-    if not _items:
+    items = _regex_items(RE_ADDRESS, line)
+    if not items:
         raise ValueError(f"invalid {line=}")
-    items = [s.strip() for s in _items]
     data = dict(
         sequence=items[0],
         address=items[1],
     )
     return data
+
+
+# ============================= helpers ==============================
+
+
+def _regex_items(regex: "re.Pattern", line: str) -> LStr:
+    """Return stripped groups of the regex matched at the beginning of the line.
+
+    :return: List of groups, empty list if line does not match the regex.
+    """
+    match = regex.match(line)
+    if not match:
+        return []
+    return [(s or "").strip() for s in match.groups()]
+
+
+def _tokenize_ace_extended(words: LStr) -> LStr:
+    """Split words of normalized extended ACE line to the items.
+
+    The same backtracking as in RE_ACE_EXTENDED: protocol is optional, source port is greedy
+    (the last possible destination address is taken), the destination address can match
+    the beginning of the word, in this case the rest of the line is ignored.
+    :param words: Words of normalized line.
+    :return: sequence, action, protocol, srcaddr, srcport, dstaddr, dstport_option.
+        Empty list if line is not ACE.
+    """
+    split = _split_action(words)
+    if split is None:
+        return []
+    sequence, action, words = split
+    count = len(words)
+    for idx_src in (1, 0):  # with protocol, without protocol
+        if idx_src >= count:
+            continue
+        src_count = _addr_middle(words, idx_src)
+        if not src_count:
+            continue
+        idx_port = idx_src + src_count
+        # srcport: the longest first, then without srcport
+        for idx_dst in chain(range(count - 1, idx_port, -1), (idx_port,)):
+            if idx_dst >= count:
+                continue
+            dst = _addr_end(words, idx_dst, standard=False)
+            if dst is None:
+                continue
+            dstaddr, dst_count, entire = dst
+            return [
+                sequence,
+                action,
+                words[0] if idx_src else "",
+                " ".join(words[idx_src:idx_port]),
+                " ".join(words[idx_port:idx_dst]),
+                dstaddr,
+                " ".join(words[idx_dst + dst_count :]) if entire else "",
+            ]
+    return []
+
+
+def _tokenize_ace_standard(words: LStr) -> LStr:
+    """Split words of normalized standard ACE line to the items.
+
+    :param words: Words of normalized line.
+    :return: sequence, action, srcaddr, option. Empty list if line is not ACE.
+    """
+    split = _split_action(words)
+    if split is None:
+        return []
+    sequence, action, words = split
+    if not words:
+        return []
+    src = _addr_end(words, 0, standard=True)
+    if src is None:
+        return []
+    srcaddr, src_count, entire = src
+    option = " ".join(words[src_count:]) if entire else ""
+    return [sequence, action, srcaddr, option]
+
+
+def _split_action(words: LStr) -> Optional[Tuple[str, str, LStr]]:
+    """Split words of ACE line to sequence, action and the rest words.
+
+    :return: sequence, action, rest words. None if line does not start with action.
+    """
+    first = words[0] if words else ""
+    if first in ACE_ACTIONS:
+        return "", first, words[1:]
+    if first.isdecimal():
+        if len(words) > 1 and words[1] in ACE_ACTIONS:
+            return first, words[1], words[2:]
+        return None
+    for action in ACE_ACTIONS:  # "10permit"
+        if first.endswith(action) and first[: -len(action)].isdecimal():
+            return first[: -len(action)], action, words[1:]
+    return None
+
+
+def _addr_middle(words: LStr, idx: int) -> int:
+    """Return count of words of the address in the middle of the line.
+
+    The address should be followed by other words.
+    :return: Count of words, 0 if words[idx] is not address.
+    """
+    word = words[idx]
+    if word == "any":
+        return 1
+    has_next = idx + 2 < len(words)
+    if has_next:
+        if word in ADDRGROUPS:
+            return 2
+        if word == "host":
+            return 2 if RE_OCTETS.fullmatch(words[idx + 1]) else 0
+    if RE_PREFIX.fullmatch(word):
+        return 1
+    if has_next and RE_OCTETS.fullmatch(word) and RE_OCTETS.fullmatch(words[idx + 1]):
+        return 2
+    return 0
+
+
+def _addr_end(words: LStr, idx: int, standard: bool) -> Optional[TAddr]:
+    """Return the address followed by optional ports and options.
+
+    The last word of the address can be matched partially, "anyX" is "any".
+    :param standard: True - standard ACE, bare "A.B.C.D" is host address.
+    :return: address, count of words, is the last word matched entirely.
+        None if words[idx] is not address.
+    """
+    word = words[idx]
+    char = word[:1]
+    if char not in ADDR_FIRST_CHARS and not char.isdecimal():
+        return None
+    if word.startswith("any"):
+        return "any", 1, word == "any"
+    has_next = idx + 1 < len(words)
+    if has_next:
+        if word == "host":
+            if match := RE_OCTETS.match(words[idx + 1]):
+                return _addr_match(f"host {match.group()}", 2, match, words[idx + 1])
+        elif word in ADDRGROUPS:
+            return f"{word} {words[idx + 1]}", 2, True
+    if match := RE_PREFIX.match(word):
+        return _addr_match(match.group(), 1, match, word)
+    if has_next and RE_OCTETS.fullmatch(word):
+        if match := RE_OCTETS.match(words[idx + 1]):
+            return _addr_match(f"{word} {match.group()}", 2, match, words[idx + 1])
+    if standard:
+        if match := RE_OCTETS.match(word):
+            return _addr_match(match.group(), 1, match, word)
+    return None
+
+
+def _addr_match(addr: str, count: int, match: "re.Match", word: str) -> TAddr:
+    """Return address, count of words, is the last word matched entirely."""
+    return addr, count, match.end() == len(word)
@@ -9,13 +9,15 @@ from cisco_acl import helpers as h
 from cisco_acl.base import Base
 from cisco_acl.helpers import OPERATORS
 from cisco_acl.port_name import PortName
-from cisco_acl.types_ import LInt, LStr, IInt, DAny, StrInt
+from cisco_acl.types_ import LInt, LStr, IInt, DAny, StrInt, SInt, TT2Int
 
 
 @total_ordering
 class Port(Base):
     """Port - ACE TCP/UDP source or destination port object."""
 
+    __slots__ = ("_protocol", "_port_nr", "_operator", "_items", "_ranges", "_sport")
+
     def __init__(self, line: str = "", **kwargs):
         """Init Port.
 
@@ -45,6 +47,7 @@ class Port(Base):
             port.operator -> "eq"
             port.items -> [80, 443]
             port.ports -> [80, 443]
+            port.ranges -> ((80, 80), (443, 443))
             port.sport -> "80,443"
 
         :example: nxos, "neq" (can match only one port in single line).
@@ -53,6 +56,7 @@ class Port(Base):
             port.operator -> "neq"
             port.items -> [80]
             port.ports -> [1, 2, ..., 79, 81, ..., 65534, 65535]
+            port.ranges -> ((1, 79), (81, 65535))
             port.sport -> "1-79,81-65535"
 
         :example: Range.
@@ -77,6 +81,24 @@ class Port(Base):
 
     # ========================== redefined ===========================
 
+    def __contains__(self, other) -> bool:
+        """Check is port number or all ports of other Port in self ports.
+
+        :param other: Port number or Port object.
+        :return: True - if port is in self.ports.
+        :raises TypeError: If other is not int or Port.
+        :example:
+            80 in Port("range 1 100") -> True
+            Port("eq 80 443") in Port("range 1 100") -> False
+        """
+        if isinstance(other, int):
+            return any(lo <= other <= hi for lo, hi in self._ranges)
+        if isinstance(other, Port):
+            if not other.ranges:
+                return False
+            return h.ranges_subset(tops=self._ranges, bottoms=other.ranges)
+        raise TypeError(f"{other=} {int} {Port} expected")
+
     def __hash__(self) -> int:
         """__hash__."""
         return self.line.__hash__()
@@ -138,17 +160,19 @@ class Port(Base):
         if not items:
             self._operator = ""
             self._items = []
-            self._ports = []
+            self._ranges = ()
             self._sport = ""
             return
 
         self._operator = self._line__operator(items)
         items = items[1:]
         _items: LInt = self._line__items_to_ints(items)
-        ports: LInt = self._items_to_ports(_items)
         self._items = _items
-        self._ports = ports
-        self._sport = h.ports_to_string(ports)
+        self._ranges = self._items_to_ranges(_items)
+        if self._operator == "eq":
+            self._sport = h.ports_to_string(_items)
+        else:
+            self._sport = h.ranges_to_string(self._ranges)
 
     @property
     def operator(self) -> str:
@@ -177,11 +201,15 @@ class Port(Base):
     def ports(self) -> LInt:
         """ACE list of int TCP/UDP port numbers.
 
+        The list is built from the ranges on each request,
+        use Port.ranges or `in` operator to check ports.
         :example:
             Port("eq www 443") -> [80, 443]
             Port("neq www") -> [1, 2, ..., 79, 81, ..., 65534, 65535]
         """
-        return self._ports
+        if self._operator == "eq":
+            return self._items.copy()
+        return h.ranges_to_ports(self._ranges)
 
     @ports.setter
     def ports(self, ports: IInt) -> None:
@@ -193,6 +221,16 @@ class Port(Base):
         items.insert(0, self.operator)
         self.line = " ".join(items)
 
+    @property
+    def ranges(self) -> TT2Int:
+        """ACE TCP/UDP ports as sorted tuple of (lo, hi) intervals.
+
+        :example:
+            Port("eq www 443") -> ((80, 80), (443, 443))
+            Port("neq www") -> ((1, 79), (81, 65535))
+        """
+        return self._ranges
+
     @property
     def protocol(self) -> str:
         """Protocol name: "tcp", "udp", ""."""
@@ -203,9 +241,9 @@ class Port(Base):
         if not isinstance(protocol, (int, str)):
             raise TypeError(f"{protocol=} {int} {str} expected")
         self._protocol = h.init_protocol(line=self.line, protocol=protocol)
-        uuid = self.uuid
+        uuid = self._uuid
         self.line = self.line
-        self.uuid = uuid
+        self._uuid = uuid
 
     @property
     def sport(self) -> str:
@@ -255,7 +293,7 @@ class Port(Base):
             # property
             items=self._items,
             operator=self._operator,
-            ports=self._ports,
+            ports=self.ports,
             sport=self._sport,
         )
         if uuid:
@@ -327,23 +365,50 @@ class Port(Base):
             self.operator == "ge"
             self._items_to_ports([4, 5, 6, ..., 65535]) -> [4]
         """
+        if self._operator == "eq":
+            return items
+        ranges: TT2Int = self._items_to_ranges(items)
+        return h.ranges_to_ports(ranges)
+
+    def _items_to_ranges(self, items: LInt) -> TT2Int:
+        """Transform line items to sorted (lo, hi) intervals.
+
+        :example:
+            self.operator == "range"
+            self._items_to_ranges([1, 4]) -> ((1, 4),)
+
+            self.operator == "neq"
+            self._items_to_ranges([4]) -> ((1, 3), (5, 65535))
+        """
         operator = self._operator
         if operator == "eq":
-            return items
+            return h.ports_to_ranges(items)
         if operator == "range":
-            items = list(range(items[0], items[-1] + 1))
-            return items
+            if items[0] > items[-1]:
+                return ()
+            return ((items[0], items[-1]),)
 
-        all_ports = list(range(1, 65535 + 1))
+        port_min, port_max = h.PORT_MIN, h.PORT_MAX
         if operator == "neq":
-            items = [i for i in all_ports if i not in items]
-            return items
+            ranges = []
+            lo = port_min
+            for item in sorted(set(items)):
+                if item < lo:
+                    continue
+                if item > port_max:
+                    break
+                if item > lo:
+                    ranges.append((lo, item - 1))
+                lo = item + 1
+            if lo <= port_max:
+                ranges.append((lo, port_max))
+            return tuple(ranges)
         if operator == "gt":
-            items = [i for i in all_ports if i > items[0]]
-            return items
+            lo = max(items[0] + 1, port_min)
+            return ((lo, port_max),) if lo <= port_max else ()
         if operator == "lt":
-            items = [i for i in all_ports if i < items[0]]
-            return items
+            hi = min(items[0] - 1, port_max)
+            return ((port_min, hi),) if port_min <= hi else ()
         raise ValueError(f"invalid port {operator=}")
 
     def _ports_to_items(self, ports: LInt) -> LInt:
@@ -362,10 +427,10 @@ class Port(Base):
         if operator == "range":
             return [ports[0], ports[-1]]
         if operator == "neq":
-            items: LInt = list(range(1, 65535 + 1))
-            for port in ports:
-                items.remove(port)
-            return items
+            ports_: SInt = set(ports)
+            if len(ports_) != len(ports) or not ports_.issubset(range(h.PORT_MIN, h.PORT_MAX + 1)):
+                raise ValueError(f"invalid {ports=}")
+            return [i for i in range(h.PORT_MIN, h.PORT_MAX + 1) if i not in ports_]
         if operator == "gt":
             return [ports[0] - 1]
         if operator == "lt":
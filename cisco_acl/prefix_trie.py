@@ -0,0 +1,178 @@
+"""PrefixTrie - binary prefix trie of wildcards (prefix, wildcard mask) as integers.
+
+Contiguous wildcards (prefixes) are stored in the trie, node depth is the prefix length,
+lookups walk at most 32 nodes. Non-contiguous wildcards are stored in a list
+and compared with each lookup (linear fallback), they are rare in address groups.
+
+:example:
+    trie = PrefixTrie()
+    trie.insert((0x0A000000, 0xFF), "10.0.0.0/24")
+    trie.insert((0x0A000000, 0x3), "10.0.0.0/30")
+    trie.covering((0x0A000001, 0)) -> ["10.0.0.0/24", "10.0.0.0/30"]
+    trie.overlapping((0x0A000000, 0xFFFF)) -> ["10.0.0.0/24", "10.0.0.0/30"]
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+from cisco_acl import wildcard as wc
+from cisco_acl.types_ import LAny, T2Int
+
+PREFIX_LEN = 32
+
+
+class _Node:
+    """Node of the trie, values of the prefix ending at the node."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        """Init _Node."""
+        self.children: List[Optional[_Node]] = [None, None]
+        self.values: LAny = []
+
+
+class PrefixTrie:
+    """Binary prefix trie of wildcards, linear list of non-contiguous wildcards."""
+
+    __slots__ = ("_root", "_count", "_nc")
+
+    def __init__(self):
+        """Init empty PrefixTrie."""
+        self._root = _Node()
+        self._count = 0
+        self._nc: List[Tuple[T2Int, Any]] = []
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(count={self._count}, nc={len(self._nc)})"
+
+    def __len__(self) -> int:
+        """Count of inserted wildcards."""
+        return self._count + len(self._nc)
+
+    # =========================== method =============================
+
+    def insert(self, wildcard: T2Int, value: Any) -> None:
+        """Insert wildcard with the value, the same wildcard may have multiple values.
+
+        :param wildcard: (prefix, wildcard mask) integers.
+        :type wildcard: Tuple[int, int]
+
+        :param value: Value returned by lookups.
+        :type value: Any
+        """
+        prefix, wildmask = wildcard
+        if not _is_contiguous(wildmask):
+            self._nc.append((wildcard, value))
+            return
+        node = self._root
+        for bit in _bits(prefix, _depth(wildmask)):
+            child = node.children[bit]
+            if child is None:
+                child = node.children[bit] = _Node()
+            node = child
+        node.values.append(value)
+        self._count += 1
+
+    def covering(self, wildcard: T2Int) -> LAny:
+        """Values of the wildcards that match all addresses of the `wildcard`.
+
+        :param wildcard: (prefix, wildcard mask) integers.
+        :type wildcard: Tuple[int, int]
+
+        :return: Values of the prefixes from the shortest to the longest,
+            then values of the non-contiguous wildcards in insertion order.
+
+        :example:
+            trie: [(0x0A000000, 0xFF), "A"], [(0x0A000000, 0x3), "B"]
+            wildcard: (0x0A000004, 0x3)
+            return: ["A"]
+        """
+        prefix, wildmask = wildcard
+        node: Optional[_Node] = self._root
+        values: LAny = list(self._root.values)
+        for bit in _bits(prefix, _depth(wildmask)):
+            node = node.children[bit]  # type: ignore
+            if node is None:
+                break
+            values.extend(node.values)
+        values.extend(v for w, v in self._nc if wc.is_subset(wildcard, w))
+        return values
+
+    def overlapping(self, wildcard: T2Int) -> LAny:
+        """Values of the wildcards that match at least one address of the `wildcard`.
+
+        :param wildcard: (prefix, wildcard mask) integers.
+        :type wildcard: Tuple[int, int]
+
+        :return: Values of the prefixes covering the `wildcard` from the shortest,
+            then the longer prefixes in the trie order,
+            then values of the non-contiguous wildcards in insertion order.
+
+        :example:
+            trie: [(0x0A000000, 0xFF), "A"], [(0x0A000000, 0x3), "B"]
+            wildcard: (0x0A000000, 0xFFFF)
+            return: ["A", "B"]
+        """
+        prefix, wildmask = wildcard
+        depth = _depth(wildmask)
+        node: Optional[_Node] = self._root
+        values: LAny = []
+        for bit in _bits(prefix, depth):
+            values.extend(node.values)  # type: ignore
+            node = node.children[bit]  # type: ignore
+            if node is None:
+                break
+        if node is not None:
+            network = prefix & ~wildmask & _mask(depth)
+            nc_wildcard = None if _is_contiguous(wildmask) else wildcard
+            values.extend(self._subtree(node, network, depth, nc_wildcard))
+        values.extend(v for w, v in self._nc if wc.is_overlap(wildcard, w))
+        return values
+
+    # =========================== helper =============================
+
+    def _subtree(self, node: _Node, network: int, depth: int, nc_wildcard) -> LAny:
+        """Values of the node and all children nodes (depth-first, 0 child first).
+
+        :param nc_wildcard: Non-contiguous wildcard, only overlapping prefixes are returned.
+        """
+        values: LAny = []
+        stack = [(node, network, depth)]
+        while stack:
+            node, network, depth = stack.pop()
+            if nc_wildcard is not None:
+                wildcard = (network, wc.ALL_ONES >> depth)
+                if not wc.is_overlap(wildcard, nc_wildcard):
+                    continue
+            values.extend(node.values)
+            for bit in (1, 0):
+                if child := node.children[bit]:
+                    stack.append((child, network | bit << (PREFIX_LEN - 1 - depth), depth + 1))
+        return values
+
+
+# ============================= helpers ==============================
+
+
+def _bits(prefix: int, depth: int) -> List[int]:
+    """Bits of the prefix from the highest, count of bits is depth."""
+    return [prefix >> (PREFIX_LEN - 1 - i) & 1 for i in range(depth)]
+
+
+def _depth(wildmask: int) -> int:
+    """Count of the high bits fixed by the wildcard mask (prefix length of contiguous mask)."""
+    return PREFIX_LEN - wildmask.bit_length()
+
+
+def _is_contiguous(wildmask: int) -> bool:
+    """Check wildcard mask has only low bits, 0.0.0.255 - True, 0.0.1.3 - False."""
+    return not wildmask & (wildmask + 1)
+
+
+def _mask(depth: int) -> int:
+    """Network mask of the prefix length."""
+    return wc.ALL_ONES ^ (wc.ALL_ONES >> depth)
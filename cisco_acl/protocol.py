@@ -98,6 +98,8 @@ NR_TO_PROTOCOL = dict(
 class Protocol(Base):
     """ACE IP protocol object."""
 
+    __slots__ = ("_number", "_protocol_nr", "_has_port")
+
     def __init__(self, line: str = "", **kwargs):
         """Init Protocol.
 
@@ -14,6 +14,8 @@ from cisco_acl.types_ import DAny
 class Remark(AceBase):
     """Remark - comments in ACL."""
 
+    __slots__ = ("_action", "_text")
+
     def __init__(self, line: str = "", **kwargs):
         """Init Remark.
 
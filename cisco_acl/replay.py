@@ -0,0 +1,484 @@
+"""Replay of flow logs, hit counters of ACEs.
+
+Flows are read from CSV and classic pcap files in chunks (constant memory on large files),
+each flow is classified by the decision tree of Acl.match() against one or more ACLs,
+hits are counted per Ace. Chunks can be classified in parallel processes.
+
+:example:
+    acls = cisco_acl.acls(config)
+    counter = replay(acls, read_csv("flows.csv"), max_workers=4)
+    for hits in counter.never_hit():
+        print(hits.acl, hits.line)
+"""
+
+import csv
+import struct
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from cisco_acl.ace import Ace, LAce
+from cisco_acl.acl import Acl, LAcl, ungroup_aces
+from cisco_acl.classifier import Classifier, init_address, init_flags, init_protocol_nr
+from cisco_acl.types_ import DStr, LInt
+
+CHUNK_SIZE = 10_000
+CSV_COLUMNS: DStr = {  # Flow field: CSV column name
+    "src": "src",
+    "dst": "dst",
+    "protocol": "protocol",
+    "sport": "sport",
+    "dport": "dport",
+    "flags": "flags",
+    "count": "count",
+}
+MAX_ADDRESS = 2 ** 32 - 1
+MAX_PORT = 65535
+
+# pcap
+PCAP_MAGIC = {0xA1B2C3D4, 0xA1B23C4D}  # microsecond, nanosecond timestamps
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = (101, 228)
+LINKTYPE_LINUX_SLL = 113
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPE_VLAN = (0x8100, 0x88A8)
+TCP_FLAGS = (("fin", 0x01), ("syn", 0x02), ("rst", 0x04), ("psh", 0x08), ("ack", 0x10),
+             ("urg", 0x20))
+FRAGMENTS = frozenset(["fragments"])
+
+UFile = Union[str, Path, Any]  # path or file object
+LLInt = List[LInt]
+
+
+class Flow(NamedTuple):
+    """Flow (packet) to replay.
+
+    :param src: Source address as integer.
+    :param dst: Destination address as integer.
+    :param protocol: IP protocol number.
+    :param sport: Source TCP/UDP port, 0 for other protocols.
+    :param dport: Destination TCP/UDP port, 0 for other protocols.
+    :param flags: Packet flags, option keywords: "ack", "syn", "fragments", etc.
+    :param count: Count of hits (packets) of the flow.
+    """
+
+    src: int
+    dst: int
+    protocol: int
+    sport: int = 0
+    dport: int = 0
+    flags: FrozenSet[str] = frozenset()
+    count: int = 1
+
+
+LFlow = List[Flow]
+
+
+class AceHits(NamedTuple):
+    """Hit counter of the Ace.
+
+    :param acl: Acl name.
+    :param idx: Index of the Ace in the ungrouped ACL items, -1 for implicit deny.
+    :param sequence: Ace sequence number, 0 if not set.
+    :param line: Ace line, "deny ip any any" for implicit deny.
+    :param hits: Count of hits.
+    """
+
+    acl: str
+    idx: int
+    sequence: int
+    line: str
+    hits: int
+
+
+LAceHits = List[AceHits]
+
+
+class HitCounter:
+    """Hit counters of the ACEs of the ACLs.
+
+    Each flow is counted in each ACL, by the first matching Ace
+    or by the implicit deny if no Ace matched. Remarks are skipped, AceGroups are ungrouped.
+    ACEs changed in place after HitCounter init are not tracked.
+    """
+
+    def __init__(self, acls: Iterable[Acl]):
+        """Init HitCounter.
+
+        :param acls: Acl objects.
+        :type acls: List[Acl]
+
+        :raises TypeError: If acls items are not Acl.
+        """
+        self.acls: LAcl = list(acls)
+        for acl in self.acls:
+            if not isinstance(acl, Acl):
+                raise TypeError(f"{acl=} {Acl} expected")
+        self.flows = 0
+        self._aces: List[LAce] = [ungroup_aces(o.items) for o in self.acls]
+        # noinspection PyProtectedMember
+        self._implicit: LAce = [o._implicit_deny() for o in self.acls]
+        self._counts: LLInt = [[0] * (len(o) + 1) for o in self._aces]  # last is implicit
+        self._classifiers: List[Optional[Classifier]] = [None for _ in self.acls]
+        self._indexes: List[Dict[int, int]] = [
+            {id(o): i for i, o in enumerate(aces)} for aces in self._aces
+        ]
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(acls={len(self.acls)}, flows={self.flows})"
+
+    # =========================== method =============================
+
+    def count(self, flows: Iterable[Flow]) -> LLInt:
+        """Return hit counters of the flows, counters of HitCounter are not changed.
+
+        :param flows: Flows.
+        :return: Counters [[ace hits, ..., implicit hits], ...] per ACL.
+        """
+        counts: LLInt = [[0] * len(o) for o in self._counts]
+        lookups = []
+        for acl_idx, implicit in enumerate(self._implicit):
+            classifier = self._classifier(acl_idx)
+            lookups.append((classifier.lookup, self._indexes[acl_idx], implicit,
+                            counts[acl_idx]))
+
+        for flow in flows:
+            for lookup, indexes, implicit, counts_ in lookups:
+                ace = lookup(flow.src, flow.dst, flow.protocol, flow.sport, flow.dport,
+                             flow.flags)
+                idx = -1 if ace is implicit else indexes[id(ace)]
+                counts_[idx] += flow.count
+        return counts
+
+    def merge(self, counts: LLInt, flows: int = 0) -> None:
+        """Add counters to the HitCounter.
+
+        :param counts: Counters returned by count().
+        :param flows: Count of flows.
+        """
+        for counts_, counts_add in zip(self._counts, counts):
+            for idx, hits in enumerate(counts_add):
+                counts_[idx] += hits
+        self.flows += flows
+
+    def update(self, flows: Iterable[Flow]) -> None:
+        """Classify the flows and add hits to the counters.
+
+        :param flows: Flows.
+        """
+        flows = list(flows)
+        self.merge(self.count(flows), flows=len(flows))
+
+    def hits(self) -> LAceHits:
+        """Return hit counters of all ACEs and implicit deny of all ACLs.
+
+        :return: List of AceHits, ACEs are in the order of the ACL, implicit deny is the last.
+        """
+        items: LAceHits = []
+        for acl, aces, implicit, counts in zip(self.acls, self._aces, self._implicit,
+                                               self._counts):
+            for idx, ace in enumerate(aces):
+                items.append(AceHits(acl.name, idx, ace.sequence, ace.line, counts[idx]))
+            items.append(AceHits(acl.name, -1, 0, implicit.line, counts[-1]))
+        return items
+
+    def never_hit(self) -> LAceHits:
+        """Return hit counters of the ACEs without hits, implicit deny is skipped."""
+        return [o for o in self.hits() if not o.hits and o.idx >= 0]
+
+    # =========================== helper =============================
+
+    def _classifier(self, acl_idx: int) -> Classifier:
+        """Return decision tree of the ACL, compiled on the first call."""
+        classifier = self._classifiers[acl_idx]
+        if classifier is None:
+            classifier = Classifier(aces=self._aces[acl_idx], implicit=self._implicit[acl_idx])
+            self._classifiers[acl_idx] = classifier
+        return classifier
+
+
+# ============================ functions =============================
+
+
+def replay(
+        acls: Iterable[Acl],
+        chunks: Iterable[LFlow],
+        max_workers: int = 0,
+        max_pending: int = 0,
+        mp_context: Any = None,
+) -> HitCounter:
+    """Classify chunks of flows against the ACLs, return hit counters of the ACEs.
+
+    :param acls: Acl objects.
+    :type acls: List[Acl]
+
+    :param chunks: Chunks of flows: read_csv(), read_pcap() or any iterable of List[Flow].
+    :type chunks: Iterable[List[Flow]]
+
+    :param max_workers: Count of the worker processes, 0 - classify in the current
+        process (default). Each worker compiles the ACLs once.
+    :type max_workers: int
+
+    :param max_pending: Max count of the chunks submitted to the pool and not yet
+        returned, default `max_workers` * 2. Limits memory usage on large files.
+    :type max_pending: int
+
+    :param mp_context: Multiprocessing context of the ProcessPoolExecutor.
+
+    :return: HitCounter with counters of all chunks.
+
+    :example:
+        counter = replay(acls, read_pcap("traffic.pcap"), max_workers=4)
+        counter.never_hit() -> [AceHits(acl="NAME", idx=1, sequence=20, line=..., hits=0)]
+    """
+    counter = HitCounter(acls)
+    if not max_workers:
+        for flows in chunks:
+            counter.update(flows)
+        return counter
+
+    max_pending = max_pending or max_workers * 2
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                             initializer=_init_worker, initargs=(counter.acls,)) as executor:
+        pending: Dict[Future, int] = {}  # future: count of flows
+        for flows in chunks:
+            flows = list(flows)
+            pending[executor.submit(_count_worker, flows)] = len(flows)
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    counter.merge(future.result(), flows=pending.pop(future))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                counter.merge(future.result(), flows=pending.pop(future))
+    return counter
+
+
+def read_csv(
+        file: UFile,
+        chunk_size: int = CHUNK_SIZE,
+        columns: Optional[DStr] = None,
+        platform: str = "ios",
+) -> Iterator[LFlow]:
+    """Read flows from CSV file with header, yield chunks of flows.
+
+    Columns src, dst, protocol are required. Addresses are "10.0.0.1" or integers,
+    protocol is name "tcp" or number, flags are option keywords separated by space "ack syn",
+    count is count of packets (default 1). Empty values of sport, dport, count are defaults.
+
+    :param file: Path or text file object.
+    :type file: str, Path, TextIO
+
+    :param chunk_size: Max count of flows in the chunk.
+    :type chunk_size: int
+
+    :param columns: Mapping of the Flow fields to the CSV column names,
+        default CSV_COLUMNS {"src": "src", "dst": "dst", ...}. Updates the defaults.
+    :type columns: Dict[str, str]
+
+    :param platform: Platform of the protocol names: "ios" (default), "nxos".
+    :type platform: str
+
+    :return: Generator of chunks of flows.
+
+    :raises ValueError: If required column is missing or value is invalid.
+
+    :example:
+        # flows.csv
+        # src,dst,protocol,sport,dport
+        # 10.0.0.1,10.0.0.2,tcp,1024,22
+        for flows in read_csv("flows.csv"):
+            ...
+    """
+    columns_ = {**CSV_COLUMNS, **(columns or {})}
+    with _open(file, mode="r") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            return
+        header = [s.strip() for s in header]
+        idxs = {k: header.index(v) for k, v in columns_.items() if v in header}
+        for key in ("src", "dst", "protocol"):
+            if key not in idxs:
+                raise ValueError(f"missing {key=} column {columns_[key]!r} in {header=}")
+
+        flows: LFlow = []
+        for line_nr, row in enumerate(reader, start=2):
+            if not row:
+                continue
+            try:
+                flow = _init_csv_flow(row, idxs, platform)
+            except (KeyError, TypeError, ValueError) as ex:
+                raise ValueError(f"invalid {line_nr=} {row=}, {ex}") from ex
+            flows.append(flow)
+            if len(flows) >= chunk_size:
+                yield flows
+                flows = []
+        if flows:
+            yield flows
+
+
+def read_pcap(file: UFile, chunk_size: int = CHUNK_SIZE) -> Iterator[LFlow]:
+    """Read packets from classic pcap file (not pcapng), yield chunks of flows.
+
+    Link types: Ethernet (with VLAN tags), raw IP, Linux cooked capture.
+    Each IPv4 packet is a flow with count=1, other packets are skipped.
+    TCP flags are "ack", "fin", "psh", "rst", "syn", "urg",
+    non-initial fragments have flags "fragments" and ports 0.
+
+    :param file: Path or binary file object.
+    :type file: str, Path, BinaryIO
+
+    :param chunk_size: Max count of flows in the chunk.
+    :type chunk_size: int
+
+    :return: Generator of chunks of flows.
+
+    :raises ValueError: If the file is not classic pcap or link type is not supported.
+    """
+    with _open(file, mode="rb") as fh:
+        header = fh.read(24)
+        if len(header) < 24:
+            raise ValueError("invalid pcap header")
+        if struct.unpack("<I", header[:4])[0] in PCAP_MAGIC:
+            endian = "<"
+        elif struct.unpack(">I", header[:4])[0] in PCAP_MAGIC:
+            endian = ">"
+        else:
+            raise ValueError(f"invalid pcap magic={header[:4].hex()}, pcapng is not supported")
+        linktype = struct.unpack(f"{endian}I", header[20:24])[0] & 0x0FFFFFFF
+        if linktype not in (LINKTYPE_ETHERNET, LINKTYPE_LINUX_SLL, *LINKTYPE_RAW):
+            raise ValueError(f"not supported pcap {linktype=}")
+        record = struct.Struct(f"{endian}IIII")
+
+        flows: LFlow = []
+        while True:
+            data = fh.read(16)
+            if len(data) < 16:
+                break
+            _, _, incl_len, _ = record.unpack(data)
+            packet = fh.read(incl_len)
+            if len(packet) < incl_len:
+                break
+            flow = _init_pcap_flow(packet, linktype)
+            if flow is None:
+                continue
+            flows.append(flow)
+            if len(flows) >= chunk_size:
+                yield flows
+                flows = []
+        if flows:
+            yield flows
+
+
+# ============================= helpers ==============================
+
+
+@contextmanager
+def _open(file: UFile, mode: str) -> Iterator[Any]:
+    """Open file by path, file object is yielded as is (not closed)."""
+    if isinstance(file, (str, Path)):
+        kwargs = {"newline": ""} if mode == "r" else {}
+        with open(file, mode, **kwargs) as fh:  # pylint: disable=unspecified-encoding
+            yield fh
+    elif hasattr(file, "read"):
+        yield file
+    else:
+        raise TypeError(f"{file=} {str} {Path} or file object expected")
+
+
+def _init_csv_flow(row: List[str], idxs: Dict[str, int], platform: str) -> Flow:
+    """Init Flow from the CSV row."""
+    values = {k: row[i].strip() for k, i in idxs.items() if i < len(row)}
+    kwargs: Dict[str, Any] = {
+        "src": _init_csv_address(values["src"]),
+        "dst": _init_csv_address(values["dst"]),
+        "protocol": init_protocol_nr(values["protocol"], platform),
+    }
+    for key in ("sport", "dport"):
+        if values.get(key):
+            kwargs[key] = _init_csv_port(values[key])
+    if values.get("count"):
+        kwargs["count"] = int(values["count"])
+    if values.get("flags"):
+        kwargs["flags"] = init_flags(values["flags"])
+    return Flow(**kwargs)
+
+
+def _init_csv_address(address: str) -> int:
+    """Init address as integer: "10.0.0.1", "167772161".
+
+    :raises ValueError: If address is invalid or not in range 0..2**32-1.
+    """
+    if address.isdigit():
+        address_i = int(address)
+        if address_i > MAX_ADDRESS:
+            raise ValueError(f"{address=} expected in range 0..{MAX_ADDRESS}")
+        return address_i
+    return init_address(address)
+
+
+def _init_csv_port(port: str) -> int:
+    """Init TCP/UDP port as integer.
+
+    :raises ValueError: If port is not in range 0..65535.
+    """
+    port_i = int(port)
+    if not 0 <= port_i <= MAX_PORT:
+        raise ValueError(f"{port=} expected in range 0..{MAX_PORT}")
+    return port_i
+
+
+def _init_pcap_flow(packet: bytes, linktype: int) -> Optional[Flow]:
+    """Init Flow from the pcap packet, None if the packet is not IPv4."""
+    offset = 0
+    if linktype == LINKTYPE_ETHERNET:
+        offset = 12
+        ethertype = int.from_bytes(packet[offset:offset + 2], "big")
+        while ethertype in ETHERTYPE_VLAN:
+            offset += 4
+            ethertype = int.from_bytes(packet[offset:offset + 2], "big")
+        if ethertype != ETHERTYPE_IPV4:
+            return None
+        offset += 2
+    elif linktype == LINKTYPE_LINUX_SLL:
+        if int.from_bytes(packet[14:16], "big") != ETHERTYPE_IPV4:
+            return None
+        offset = 16
+
+    ip_ = packet[offset:]
+    if len(ip_) < 20 or ip_[0] >> 4 != 4:
+        return None
+    ihl = (ip_[0] & 0x0F) * 4
+    protocol = ip_[9]
+    src = int.from_bytes(ip_[12:16], "big")
+    dst = int.from_bytes(ip_[16:20], "big")
+    if int.from_bytes(ip_[6:8], "big") & 0x1FFF:  # fragment offset, non-initial fragment
+        return Flow(src, dst, protocol, flags=FRAGMENTS)
+
+    sport = dport = 0
+    flags: FrozenSet[str] = frozenset()
+    l4_ = ip_[ihl:]
+    if protocol in (6, 17) and len(l4_) >= 4:
+        sport = int.from_bytes(l4_[0:2], "big")
+        dport = int.from_bytes(l4_[2:4], "big")
+    if protocol == 6 and len(l4_) >= 14:
+        flags = frozenset(s for s, bit in TCP_FLAGS if l4_[13] & bit)
+    return Flow(src, dst, protocol, sport, dport, flags)
+
+
+_WORKER: Dict[str, HitCounter] = {}  # HitCounter of the worker process
+
+
+def _init_worker(acls: LAcl) -> None:
+    """Init HitCounter in the worker process."""
+    _WORKER["counter"] = HitCounter(acls)
+
+
+def _count_worker(flows: LFlow) -> LLInt:
+    """Return hit counters of the flows in the worker process."""
+    return _WORKER["counter"].count(flows)
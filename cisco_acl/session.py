@@ -0,0 +1,207 @@
+"""AclSession - incremental update of Acl objects when the config is changed.
+
+Session keeps hashes of the "ip access-list" and "object-group" sections of the previous
+config and the created Acl and AddrGroup objects. On update only ACLs with changed sections
+or with changed address groups are parsed again, other Acl objects are kept,
+interfaces (input/output) of the kept ACLs are updated.
+
+:example:
+    session = AclSession(platform="ios")
+    session.update(config1) -> AclChanges(added=["ACL1", "ACL2"], changed=[], removed=[])
+    session.update(config2) -> AclChanges(added=[], changed=["ACL2"], removed=[])
+    session.acls -> [Acl("ip access-list extended ACL1 ..."), Acl("... ACL2 ...")]
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, NamedTuple
+
+from cisco_acl import functions as f
+from cisco_acl import helpers as h
+from cisco_acl.ace import Ace
+from cisco_acl.acl import Acl, LAcl
+from cisco_acl.addr_group import AddrGroup, DLAddrGroup, LAddrGroup
+from cisco_acl.address import DLAddress
+from cisco_acl.config_parser import ConfigParser
+from cisco_acl.types_ import DAny, DStr, LDAny, LStr, SStr, UStr
+from cisco_acl.wildcard import init_max_ncwb
+
+
+class AclChanges(NamedTuple):
+    """Result of AclSession.update(), names of ACLs in the order of the config.
+
+    :param added: ACLs that are not in the previous config.
+    :param changed: ACLs that are parsed again (ACL or address group config is changed)
+        or have changed interfaces.
+    :param removed: ACLs that are not in the new config.
+    """
+
+    added: LStr
+    changed: LStr
+    removed: LStr
+
+
+class AclSession:
+    """Incremental update of Acl objects, only changed config sections are parsed."""
+
+    def __init__(self, **kwargs):
+        """Init AclSession.
+
+        :param platform: Platform: "asa", "ios", "nxos". Default "ios".
+        :type platform: str
+
+        :param version: Software version, default is "0".
+        :type version: str
+
+        :param names: Parses only ACLs with specified names, skips any other.
+        :type names: List[str]
+
+        :param max_ncwb: Max count of non-contiguous wildcard bits.
+        :type max_ncwb: int
+
+        :param indent: ACE lines indentation (default "  ").
+        :type indent: str
+
+        :param protocol_nr: Well-known ip protocols as numbers.
+        :type protocol_nr: bool
+
+        :param port_nr: Well-known TCP/UDP ports as numbers.
+        :type port_nr: bool
+
+        :param group_by: Startswith in remark line, ACEs are grouped to AceGroup.
+        :type group_by: str
+        """
+        self.platform: str = h.init_platform(**kwargs)
+        self.version: str = str(kwargs.get("version") or "")
+        self.names = kwargs.get("names")
+        self.group_by: str = str(kwargs.get("group_by") or "")
+        self._acl_kwargs: DAny = dict(
+            version=self.version,
+            indent=h.init_indent(**kwargs),
+            max_ncwb=init_max_ncwb(**kwargs),
+            protocol_nr=bool(kwargs.get("protocol_nr")),
+            port_nr=bool(kwargs.get("port_nr")),
+        )
+        self._acls: Dict[str, Acl] = {}
+        self._acl_hashes: DStr = {}
+        self._acl_addgrs: Dict[str, SStr] = {}  # names of address groups used in ACL
+        self._addgrs: DLAddrGroup = {}
+        self._addgr_hashes: DStr = {}
+        self._resolved: DLAddress = {}  # items of address groups shared by ACE addresses
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(platform={self.platform!r}, acls={len(self._acls)})"
+
+    # =========================== property ===========================
+
+    @property
+    def acls(self) -> LAcl:
+        """Acl objects of the last updated config."""
+        return list(self._acls.values())
+
+    @property
+    def addrgroups(self) -> LAddrGroup:
+        """AddrGroup objects of the last updated config."""
+        return [o for items in self._addgrs.values() for o in items]
+
+    # =========================== method =============================
+
+    def update(self, config: UStr) -> AclChanges:
+        """Update Acl objects by the new config, parse only changed sections.
+
+        ACL is parsed again if "ip access-list" section or any "object-group" used in the ACL
+        is changed. If only interfaces are changed, Acl object is kept with new input/output.
+
+        :param config: Cisco config, "show running-config" output.
+            String or any iterable of lines (text iterator, file object).
+        :type config: Union[str, Iterable[str]]
+
+        :return: Names of added, changed and removed ACLs.
+        """
+        parser = ConfigParser(config=config, platform=self.platform, version=self.version)
+        parser.parse_sections()
+        changed_addgrs: SStr = self._update_addgrs(parser.addgrs())
+
+        added: LStr = []
+        changed: LStr = []
+        acls_: Dict[str, Acl] = {}
+        hashes: DStr = {}
+        parsed: LAcl = []  # new Acl objects, address groups are not added yet
+        for acl_d in parser.acls(names=self.names):
+            name = acl_d["name"]
+            if name in acls_:
+                continue
+            hashes[name] = _hash(acl_d["line"])
+            acl_o = self._acls.get(name)
+            if acl_o is None:
+                acl_o = Acl(**self._acl_kwargs, **acl_d)
+                parsed.append(acl_o)
+                added.append(name)
+            elif hashes[name] != self._acl_hashes[name] or self._acl_addgrs[name] & changed_addgrs:
+                acl_o = Acl(**self._acl_kwargs, **acl_d)
+                parsed.append(acl_o)
+                changed.append(name)
+            elif acl_o.input != acl_d["input"] or acl_o.output != acl_d["output"]:
+                acl_o.input = acl_d["input"]
+                acl_o.output = acl_d["output"]
+                changed.append(name)
+            acls_[name] = acl_o
+
+        # noinspection PyProtectedMember
+        f._add_addgr_to_aces(parsed, parser, addgrs=self._addgrs, resolved=self._resolved)
+        for acl_o in parsed:
+            self._acl_addgrs[acl_o.name] = _acl_addgrs(acl_o)
+            if self.group_by:
+                acl_o.group(group_by=self.group_by)
+
+        removed: LStr = [s for s in self._acls if s not in acls_]
+        for name in removed:
+            del self._acl_addgrs[name]
+        self._acls = acls_
+        self._acl_hashes = hashes
+        return AclChanges(added=added, changed=changed, removed=removed)
+
+    # =========================== helper =============================
+
+    def _update_addgrs(self, parsed_addgrs: LDAny) -> SStr:
+        """Create AddrGroup objects of the changed address groups.
+
+        :return: Names of added, changed and removed address groups.
+        """
+        parsed: Dict[str, LDAny] = {}
+        for addgr_d in parsed_addgrs:
+            parsed.setdefault(addgr_d["name"], []).append(addgr_d)
+        hashes: DStr = {}
+        for name, addgrs_d in parsed.items():
+            hashes[name] = _hash("\n".join(s for d in addgrs_d for s in d["items"]))
+
+        names = set(hashes).union(self._addgr_hashes)
+        changed: SStr = {s for s in names if hashes.get(s) != self._addgr_hashes.get(s)}
+        for name in changed:
+            self._resolved.pop(name, None)
+            self._addgrs.pop(name, None)
+            if name in parsed:
+                self._addgrs[name] = [AddrGroup(**d) for d in parsed[name]]
+        self._addgrs = {s: self._addgrs[s] for s in parsed}  # order of the config
+        self._addgr_hashes = hashes
+        return changed
+
+
+# ============================= helpers ==============================
+
+
+def _acl_addgrs(acl: Acl) -> SStr:
+    """Names of address groups used in ACEs of the ACL."""
+    names: SStr = set()
+    for ace_o in acl.items:
+        if isinstance(ace_o, Ace):
+            names.update(o.addrgroup for o in (ace_o.srcaddr, ace_o.dstaddr) if o.addrgroup)
+    return names
+
+
+def _hash(text: str) -> str:
+    """Hash of the config section."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
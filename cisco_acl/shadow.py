@@ -0,0 +1,261 @@
+"""Shadow detection engines for Acl.shading().
+
+"pairwise" - compares every (top, bottom) pair of ACEs, O(n^2) calls of Ace.shadow_of().
+"index" - buckets ACEs by action and protocol and indexes source/destination addresses
+    by network prefix, so each bottom ACE is compared only with the top ACEs that can
+    cover it. The final decision is still made by Ace.shadow_of(), result is identical
+    to the "pairwise" engine.
+"""
+
+from __future__ import annotations
+
+from ipaddress import IPv4Network
+from typing import Dict, List, Optional, Tuple
+
+from cisco_acl.address import Address
+from cisco_acl.ace import Ace, LAce
+from cisco_acl.types_ import DLStr, LInt, OLStr, SInt, SStr
+
+ENGINES = ("index", "pairwise")
+DEF_ENGINE = "index"
+
+TNet = Tuple[int, int]  # network address as integer, prefix length
+DLInt = Dict[TNet, LInt]
+
+
+def shading(aces: LAce, skip: OLStr = None, engine: str = DEF_ENGINE) -> DLStr:
+    """Return shading `in the top` and shadow `in the bottom` ACEs as dict.
+
+    :param aces: Ungrouped ACEs, ordered from the top to the bottom.
+    :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+    :param engine: Shadow detection engine: "index" (default), "pairwise".
+    :return: Shading (in the top) and shadow (in the bottom) ACEs.
+    :raises ValueError: Invalid engine.
+    """
+    if engine == "index":
+        return shading_index(aces=aces, skip=skip)
+    if engine == "pairwise":
+        return shading_pairwise(aces=aces, skip=skip)
+    raise ValueError(f"{engine=} expected {ENGINES}")
+
+
+def shading_pairwise(aces: LAce, skip: OLStr = None) -> DLStr:
+    """Return shading and shadow ACEs, compare all (top, bottom) pairs.
+
+    :param aces: Ungrouped ACEs, ordered from the top to the bottom.
+    :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+    :return: Shading (in the top) and shadow (in the bottom) ACEs.
+    """
+    shading_d: DLStr = {}  # result
+    shadow: SStr = set()
+    for idx, ace_top in enumerate(aces):
+        aces_bottom = aces[idx + 1 :]
+        for ace_bottom in aces_bottom:
+            if ace_bottom.shadow_of(other=ace_top, skip=skip):
+                if ace_bottom.line not in shadow:
+                    shading_d.setdefault(ace_top.line, []).append(ace_bottom.line)
+                shadow.add(ace_bottom.line)
+    return shading_d
+
+
+def shading_index(aces: LAce, skip: OLStr = None) -> DLStr:
+    """Return shading and shadow ACEs, compare only ACEs selected by the index.
+
+    For each bottom ACE find the first top ACE that shades it. The pairwise engine
+    registers bottom line at the first (top, bottom) pair in the order of iteration,
+    so pairs are sorted before building the result to keep the same keys and values order.
+    :param aces: Ungrouped ACEs, ordered from the top to the bottom.
+    :param skip: Skips checking specified address type: "addrgroup", "nc_wildcard".
+    :return: Shading (in the top) and shadow (in the bottom) ACEs.
+    """
+    index = ShadowIndex(aces)
+    pairs: Dict[str, Tuple[int, int]] = {}  # bottom line: (idx_top, idx_bottom)
+    for idx_bottom, ace_bottom in enumerate(aces):
+        for idx_top in index.candidates(idx_bottom):
+            if ace_bottom.shadow_of(other=aces[idx_top], skip=skip):
+                pair = (idx_top, idx_bottom)
+                line = ace_bottom.line
+                if line not in pairs or pair < pairs[line]:
+                    pairs[line] = pair
+                break
+
+    shading_d: DLStr = {}  # result
+    for idx_top, idx_bottom in sorted(pairs.values()):
+        shading_d.setdefault(aces[idx_top].line, []).append(aces[idx_bottom].line)
+    return shading_d
+
+
+class ShadowIndex:
+    """Index of ACEs, that can shade (cover) other ACEs.
+
+    ACEs are bucketed by action and protocol. In each bucket source and destination
+    addresses are indexed by network prefix. Bottom network can be covered only by
+    one of its supernets, so lookup takes at most 33 dict queries per address.
+    Addresses that cannot be represented by prefixes (non-contiguous wildcard,
+    address group with non-contiguous wildcard) are always returned as candidates.
+    """
+
+    def __init__(self, aces: LAce):
+        """Init ShadowIndex.
+
+        :param aces: Ungrouped ACEs, ordered from the top to the bottom.
+        """
+        self.aces = aces
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        for idx, ace in enumerate(aces):
+            bucket = self._buckets.setdefault(self._bucket_key(ace), _Bucket())
+            bucket.add(idx=idx, srcaddr=ace.srcaddr, dstaddr=ace.dstaddr)
+
+    def candidates(self, idx: int) -> LInt:
+        """Return indexes of the top ACEs that can shade ACE with index `idx`.
+
+        :param idx: Index of the bottom ACE.
+        :return: Sorted indexes of the top ACEs, all less than `idx`.
+        """
+        ace = self.aces[idx]
+        action = ace.action
+        keys = [(action, "ip"), (action, str(ace.protocol.number))]
+
+        candidates: SInt = set()
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            candidates.update(bucket.candidates(srcaddr=ace.srcaddr, dstaddr=ace.dstaddr))
+        return sorted(i for i in candidates if i < idx)
+
+    # =========================== helper =============================
+
+    @staticmethod
+    def _bucket_key(ace: Ace) -> Tuple[str, str]:
+        """Return bucket key: action, protocol ("ip" for any protocol or protocol number)."""
+        if ace.protocol.name == "ip":
+            return ace.action, "ip"
+        return ace.action, str(ace.protocol.number)
+
+
+class _Bucket:
+    """Source and destination address indexes of ACEs with the same action and protocol."""
+
+    def __init__(self):
+        """Init _Bucket."""
+        self.src = _AddrIndex()
+        self.dst = _AddrIndex()
+
+    def add(self, idx: int, srcaddr: Address, dstaddr: Address) -> None:
+        """Add top ACE to the index."""
+        self.src.add(idx=idx, address=srcaddr)
+        self.dst.add(idx=idx, address=dstaddr)
+
+    def candidates(self, srcaddr: Address, dstaddr: Address) -> LInt:
+        """Return indexes of ACEs covering both source and destination address.
+
+        The dimension with fewer candidates is used, the other one is checked by
+        Ace.shadow_of().
+        """
+        src_keys = self.src.keys(srcaddr)
+        dst_keys = self.dst.keys(dstaddr)
+        src_count = self.src.count(src_keys)
+        dst_count = self.dst.count(dst_keys)
+        if src_count <= dst_count:
+            return self.src.candidates(src_keys)
+        return self.dst.candidates(dst_keys)
+
+
+class _AddrIndex:
+    """Address index, network prefix to list of ACE indexes."""
+
+    def __init__(self):
+        """Init _AddrIndex."""
+        self.nets: DLInt = {}
+        self.unindexed: LInt = []  # ACEs that can cover any address
+        self.all: LInt = []
+
+    def add(self, idx: int, address: Address) -> None:
+        """Add address of the top ACE to the index."""
+        self.all.append(idx)
+        nets = _top_nets(address)
+        if nets is None:
+            self.unindexed.append(idx)
+            return
+        for net in nets:
+            self.nets.setdefault(net, []).append(idx)
+
+    def keys(self, address: Address) -> Optional[List[TNet]]:
+        """Return index keys (supernets) for the bottom address.
+
+        :return: List of supernets, None if address cannot be indexed
+            (all ACEs are candidates).
+        """
+        ipnet = _bottom_ipnet(address)
+        if ipnet is None:
+            return None
+        if not ipnet:
+            return []
+        network = int(ipnet.network_address)
+        keys: List[TNet] = []
+        for prefixlen in range(ipnet.prefixlen + 1):
+            mask = (0xFFFFFFFF << (32 - prefixlen)) & 0xFFFFFFFF
+            key = (network & mask, prefixlen)
+            if key in self.nets:
+                keys.append(key)
+        return keys
+
+    def count(self, keys: Optional[List[TNet]]) -> int:
+        """Return count of candidates for the keys."""
+        if keys is None:
+            return len(self.all)
+        return sum(len(self.nets[k]) for k in keys) + len(self.unindexed)
+
+    def candidates(self, keys: Optional[List[TNet]]) -> LInt:
+        """Return indexes of ACEs for the keys."""
+        if keys is None:
+            return list(self.all)
+        candidates: LInt = list(self.unindexed)
+        for key in keys:
+            candidates.extend(self.nets[key])
+        return candidates
+
+
+# ============================ functions =============================
+
+
+def _top_nets(address: Address) -> Optional[List[TNet]]:
+    """Return networks of the top address as index keys.
+
+    :return: List of (network, prefixlen), None if address cannot be indexed.
+    """
+    ipnet = address.ipnet
+    if isinstance(ipnet, IPv4Network):
+        return [(int(ipnet.network_address), ipnet.prefixlen)]
+    if address.type != "addrgroup":
+        return None  # non-contiguous wildcard
+    nets: List[TNet] = []
+    for item in address.items:
+        ipnet = getattr(item, "ipnet", None)
+        if not isinstance(ipnet, IPv4Network):
+            return None
+        nets.append((int(ipnet.network_address), ipnet.prefixlen))
+    return nets
+
+
+def _bottom_ipnet(address: Address):
+    """Return one of the networks of the bottom address.
+
+    Any network of the bottom address must be covered by the top address,
+    so one network is enough to select candidates.
+    :return: IPv4Network, False if address has no networks (cannot be shaded),
+        None if address cannot be indexed.
+    """
+    ipnet = address.ipnet
+    if isinstance(ipnet, IPv4Network):
+        return ipnet
+    try:
+        wildcards = address.wildcard_ints()
+    except (TypeError, ValueError):
+        return None  # Ace.shadow_of() raises the same error
+    if not wildcards:
+        return False
+    prefix, wildmask = wildcards[0]
+    hostmask = wildmask & ~(wildmask + 1)  # contiguous bits, the first network of the wildcard
+    return IPv4Network((prefix, 32 - hostmask.bit_length()))
@@ -0,0 +1,146 @@
+"""ParseStats - opt-in wall time and call counters of the parse pipeline phases.
+
+Phases are functions decorated by timed(name). Statistics are collected only while
+a ParseStats object is active (acls(stats=...), aces(stats=...), addrgroups(stats=...)
+or ParseStats.collect()), otherwise the decorated functions only check the active collector.
+Time of the phase includes time of the nested phases, for example "acl" includes
+"tokenize" and "address". The active collector is a context variable, each thread (and asyncio
+task) has its own one, ACLs parsed by acls_many() in worker processes are not counted.
+
+Phases:
+    parse_config - ConfigParser.parse_config(), full config to dict structures.
+    parse_sections - ConfigParser.parse_sections(), streaming section splitting.
+    interface_binding - input/output interfaces of the ACLs.
+    acl - creation of Acl objects from the ACL sections (includes tokenize, address).
+    tokenize - parse_ace_extended() parse_ace_standard() calls, a standard ACE line is
+        tokenized by both.
+    address - Address, AddressAg and Wildcard objects of ACEs and address groups.
+    addrgroup_binding - address group items of ACE addresses.
+    group - Acl.group(), ACEs grouping to AceGroup by remarks.
+
+:example:
+    stats = ParseStats()
+    acls = cisco_acl.acls(config, stats=stats)
+    stats.data() -> {"parse_sections": {"calls": 1, "seconds": 0.01}, "acl": {...}, ...}
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Optional
+
+from cisco_acl.types_ import DAny
+
+PHASES = (
+    "parse_config",
+    "parse_sections",
+    "interface_binding",
+    "acl",
+    "tokenize",
+    "address",
+    "addrgroup_binding",
+    "group",
+)
+
+_ACTIVE: ContextVar[Optional[ParseStats]] = ContextVar("_ACTIVE", default=None)  # None - disabled
+
+
+class ParseStats:
+    """Wall time and call counters of the parse pipeline phases."""
+
+    def __init__(self):
+        """Init ParseStats, statistics are collected inside collect()."""
+        self._calls: Dict[str, int] = {}
+        self._seconds: Dict[str, float] = {}
+
+    def __repr__(self):
+        """__repr__."""
+        name = self.__class__.__name__
+        return f"{name}(calls={sum(self._calls.values())})"
+
+    # =========================== method =============================
+
+    def add(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Add wall time and calls to the phase.
+
+        :param name: Phase name.
+        :param seconds: Wall time.
+        :param calls: Count of calls.
+        """
+        self._calls[name] = self._calls.get(name, 0) + calls
+        self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def clear(self) -> None:
+        """Delete statistics."""
+        self._calls.clear()
+        self._seconds.clear()
+
+    @contextmanager
+    def collect(self) -> Iterator[ParseStats]:
+        """Context manager, self is the active collector inside the block."""
+        token = _ACTIVE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    def data(self) -> DAny:
+        """Return statistics of the called phases in the pipeline order.
+
+        :return: {phase: {"calls": int, "seconds": float}}.
+        """
+        names = [s for s in PHASES if s in self._calls]
+        names.extend(s for s in self._calls if s not in PHASES)
+        return {s: dict(calls=self._calls[s], seconds=self._seconds[s]) for s in names}
+
+
+# ============================ functions =============================
+
+
+@contextmanager
+def collecting(stats: Optional[ParseStats]) -> Iterator[None]:
+    """Context manager, collects statistics to `stats` inside the block, None - not collected.
+
+    :raises TypeError: If stats is not ParseStats.
+    """
+    if stats is None:
+        yield
+        return
+    if not isinstance(stats, ParseStats):
+        raise TypeError(f"{stats=} {ParseStats} expected")
+    with stats.collect():
+        yield
+
+
+def timed(name: str) -> Callable:
+    """Decorator, adds wall time of the function to the phase `name` of the active collector."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = _ACTIVE.get()
+            if stats is None:
+                return func(*args, **kwargs)
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.add(name, perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def with_stats(func: Callable) -> Callable:
+    """Decorator, collects statistics to ParseStats passed in the `stats` keyword argument."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with collecting(kwargs.get("stats")):
+            return func(*args, **kwargs)
+
+    return wrapper
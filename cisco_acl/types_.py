@@ -23,6 +23,7 @@ SInt = Set[int]
 SStr = Set[str]
 StrInt = Union[str, int]
 T2IStr = Tuple[int, str]
+T2Int = Tuple[int, int]
 T2Str = Tuple[str, str]
 T3Str = Tuple[str, str, str]
 TStr = Tuple[str, ...]
@@ -38,12 +39,16 @@ LIpNet = List[IPv4Network]
 LLStr = List[LStr]
 LOIpNet = List[OIpNet]
 LStrInt = List[StrInt]
+LT2Int = List[T2Int]
 LT2IStr = List[T2IStr]
+LT2Str = List[T2Str]
 OLStr = Optional[LStr]
 T2IpAddr = Tuple[IPv4Address, IPv4Address]
+TT2Int = Tuple[T2Int, ...]
 TLintInt = Tuple[LInt, int]
 UStr = Union[str, IStr]
 
 DDLStr = Dict[str, DLStr]
+DLT2Str = Dict[str, LT2Str]
 DLDStr = Dict[str, LDStr]
 
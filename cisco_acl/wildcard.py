@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
 from ipaddress import NetmaskValueError, IPv4Address, IPv4Network
 from itertools import product
+from typing import Iterable, Iterator, Optional
 
-from cisco_acl import helpers as h
+from cisco_acl import cache, helpers as h
 from cisco_acl.base import Base
-from cisco_acl.types_ import LIpNet, LInt, DAny, OIpNet, T2IpAddr, TLintInt
+from cisco_acl.types_ import LIpNet, LInt, DAny, OIpNet, T2Int, T2IpAddr, TLintInt, LT2Int
 
 PREFIX_LEN = 32  # IPv4 prefix length
 ALL_ONES = (2**PREFIX_LEN) - 1
@@ -19,6 +19,8 @@ MAX_NCWB = 30  # Maximum allowed count of non-contiguous wildcard bits
 class Wildcard(Base):
     """Wildcard network that of Cisco ACL."""
 
+    __slots__ = ("ipnet", "_ncwb", "_prefixlen", "_max_ncwb", "_prefix", "_wildmask")
+
     def __init__(self, line: str, **kwargs):
         """Init Wildcard.
 
@@ -61,6 +63,24 @@ class Wildcard(Base):
         """__str__."""
         return self.line
 
+    def __getstate__(self) -> DAny:
+        """Return state for pickle, IP addresses are stored as integers."""
+        state = super().__getstate__()
+        state["_prefix"] = int(self._prefix)
+        state["_wildmask"] = int(self._wildmask)
+        if self.ipnet is not None:
+            state["ipnet"] = (int(self.ipnet.network_address), self.ipnet.prefixlen)
+        return state
+
+    def __setstate__(self, state: DAny) -> None:
+        """Restore state from pickle."""
+        state = state.copy()
+        state["_prefix"] = IPv4Address(state["_prefix"])
+        state["_wildmask"] = IPv4Address(state["_wildmask"])
+        if state["ipnet"] is not None:
+            state["ipnet"] = IPv4Network(state["ipnet"])
+        super().__setstate__(state)
+
     # =========================== property ===========================
 
     @property
@@ -180,17 +200,93 @@ class Wildcard(Base):
             data["uuid"] = self.uuid
         return data
 
-    @lru_cache
+    def ints(self) -> T2Int:
+        """Return prefix and wildcard mask as integers, host bits of the prefix are cleared.
+
+        :example:
+            wildcard = Wildcard("10.0.0.0 0.0.1.3")
+            wildcard.ints() -> (167772160, 259)
+        """
+        return int(self._prefix), int(self._wildmask)
+
+    def intersection(self, other: Wildcard) -> Optional[Wildcard]:
+        """Wildcard of addresses that match both wildcards, computed without ipnets().
+
+        :param other: Other Wildcard.
+        :type other: Wildcard
+
+        :return: Wildcard object, None if wildcards do not overlap.
+        :raises NetmaskValueError: If non-contiguous wildcard bits of the result increase max_ncwb.
+
+        :example:
+            wildcard = Wildcard("10.0.0.0 0.0.1.255")
+            wildcard.intersection(Wildcard("10.0.0.0 0.255.0.3")) -> Wildcard("10.0.0.0 0.0.0.3")
+        """
+        ints = intersection(self.ints(), other.ints())
+        if ints is None:
+            return None
+        line = f"{IPv4Address(ints[0])} {IPv4Address(ints[1])}"
+        return Wildcard(line, platform=self._platform, max_ncwb=self.max_ncwb)
+
+    def overlaps(self, other: Wildcard) -> bool:
+        """Check self and `other` Wildcard match at least one common address.
+
+        :param other: Other Wildcard.
+        :type other: Wildcard
+
+        :return: True - if wildcards overlap.
+
+        :example:
+            wildcard = Wildcard("10.0.0.0 0.0.1.0")
+            wildcard.overlaps(Wildcard("10.0.1.0 0.0.0.255")) -> True
+            wildcard.overlaps(Wildcard("10.0.2.0 0.0.0.255")) -> False
+        """
+        return is_overlap(self.ints(), other.ints())
+
+    def subnet_of(self, other: Wildcard) -> bool:
+        """Check all addresses of self Wildcard match `other` Wildcard.
+
+        :param other: Other Wildcard (top).
+        :type other: Wildcard
+
+        :return: True - if self is subnet of `other`.
+
+        :example:
+            wildcard = Wildcard("10.0.0.0 0.0.1.0")
+            wildcard.subnet_of(Wildcard("10.0.0.0 0.0.1.3")) -> True
+            wildcard.subnet_of(Wildcard("10.0.0.0 0.0.0.3")) -> False
+        """
+        return is_subset(self.ints(), other.ints())
+
     def ipnets(self) -> LIpNet:
         """List of IPv4Network that match this wildcard.
 
+        Result is cached in cache.ipnets_cache() by (prefix, wildcard mask, max_ncwb),
+        each call returns a new list.
         :return: List of IPv4Network.
         :example:
             wildcard = Wildcard("10.0.0.0 0.0.1.3")
             wildcard.ipnets() -> [IPv4Network("10.0.0.0/30"),
                                   IPv4Network("10.0.1.0/30")]
         """
-        ipnets: LIpNet = []
+        ipnets_cache = cache.ipnets_cache()
+        key = (*self.ints(), self.max_ncwb)
+        ipnets = ipnets_cache.get(key)
+        if ipnets is None:
+            ipnets = tuple(self.iter_ipnets())
+            ipnets_cache.set(key, ipnets)
+        return list(ipnets)
+
+    def iter_ipnets(self) -> Iterator[IPv4Network]:
+        """Generator of IPv4Network that match this wildcard, not cached.
+
+        Streams large expansions of non-contiguous wildcards without creating the list.
+        :return: Generator of IPv4Network in the same order as ipnets().
+        :example:
+            wildcard = Wildcard("10.0.0.0 0.0.1.3")
+            list(wildcard.iter_ipnets()) -> [IPv4Network("10.0.0.0/30"),
+                                             IPv4Network("10.0.1.0/30")]
+        """
         prefix_i = int(self._prefix)
         repeat = len(self._ncwb)
         for bits_values in product((0, 1), repeat=repeat):
@@ -201,9 +297,7 @@ class Wildcard(Base):
                     prefix_i_ |= mask
                 else:
                     prefix_i_ &= ~mask
-            ipnet = IPv4Network((prefix_i_, self._prefixlen))
-            ipnets.append(ipnet)
-        return ipnets
+            yield IPv4Network((prefix_i_, self._prefixlen))
 
     # =========================== helper =============================
 
@@ -314,6 +408,23 @@ def init_max_ncwb(**kwargs) -> int:
     return max_ncwb
 
 
+def intersection(wildcard1: T2Int, wildcard2: T2Int) -> Optional[T2Int]:
+    """Intersection of two wildcards (prefix, wildcard mask) as integers.
+
+    Bits fixed (not in the wildcard mask) in both wildcards must be equal,
+    the result has bits fixed in any of the wildcards.
+    :return: (prefix, wildcard mask), None if wildcards do not overlap.
+    :example:
+        intersection((0x0A000000, 0x1FF), (0x0A000000, 0xFF0003)) -> (0x0A000000, 0x3)
+    """
+    if not is_overlap(wildcard1, wildcard2):
+        return None
+    prefix1, wildmask1 = wildcard1
+    prefix2, wildmask2 = wildcard2
+    wildmask = wildmask1 & wildmask2
+    return (prefix1 & ~wildmask1 | prefix2 & ~wildmask2) & ~wildmask & ALL_ONES, wildmask
+
+
 def invert_mask(mask: str) -> str:
     """Invert mask to wildcard and vice versa.
 
@@ -359,9 +470,79 @@ def is_mask(mask: str) -> bool:
     return True
 
 
+def is_overlap(wildcard1: T2Int, wildcard2: T2Int) -> bool:
+    """Check two wildcards (prefix, wildcard mask) match at least one common address.
+
+    :example:
+        is_overlap((0x0A000000, 0x100), (0x0A000100, 0xFF)) -> True
+    """
+    prefix1, wildmask1 = wildcard1
+    prefix2, wildmask2 = wildcard2
+    return not (prefix1 ^ prefix2) & ~(wildmask1 | wildmask2) & ALL_ONES
+
+
+def is_subset(bottom: T2Int, top: T2Int) -> bool:
+    """Check all addresses of the `bottom` wildcard match the `top` wildcard.
+
+    Wildcards are (prefix, wildcard mask) as integers. Bottom is subset of top if
+    all bottom wildcard bits are top wildcard bits and the bits fixed in top are equal.
+    :example:
+        is_subset((0x0A000000, 0x100), (0x0A000000, 0x103)) -> True
+        is_subset((0x0A000000, 0x100), (0x0A000000, 0x3)) -> False
+    """
+    prefix1, wildmask1 = bottom
+    prefix2, wildmask2 = top
+    if wildmask1 & ~wildmask2:
+        return False
+    return not (prefix1 ^ prefix2) & ~wildmask2 & ALL_ONES
+
+
+def subnet_of(tops: Iterable[T2Int], bottoms: Iterable[T2Int]) -> bool:
+    """Check all networks of the `bottoms` wildcards are subnets of any `tops` wildcard.
+
+    Same result as comparing Wildcard.ipnets() of the bottoms with the tops,
+    without expanding non-contiguous wildcards: if the bottom wildcard is not subset
+    of one top wildcard, it is split by the non-contiguous bit fixed in the overlapped tops.
+    :param tops: Wildcards (prefix, wildcard mask) in the top.
+    :param bottoms: Wildcards (prefix, wildcard mask) in the bottom.
+    :return: True - if all bottoms are covered by tops, False if tops or bottoms are empty.
+    """
+    tops_: LT2Int = list(tops)
+    bottoms_: LT2Int = list(bottoms)
+    if not (tops_ and bottoms_):
+        return False
+    return all(_is_covered(o, tops_) for o in bottoms_)
+
+
 def sum_octets(mask: str) -> int:
     """Return sum of "A.B.C.D" octets."""
     octets: LInt = [int(s) for s in mask.split(".")]
     if len(octets) != 4:
         raise ValueError(f"invalid {mask=}, expected 4 octets")
     return sum([octets[0] * 256**3, octets[1] * 256**2, octets[2] * 256, octets[3]])
+
+
+# ============================= helpers ==============================
+
+
+def _is_covered(bottom: T2Int, tops: LT2Int) -> bool:
+    """Check each network of the bottom wildcard is subnet of any top wildcard."""
+    prefix, wildmask = bottom
+    overlapped: LT2Int = []
+    for top in tops:
+        if is_subset(bottom, top):
+            return True
+        if is_overlap(bottom, top):
+            overlapped.append(top)
+
+    # non-contiguous bits of the bottom, fixed in any of the overlapped tops
+    ncwb = wildmask ^ (wildmask & ~(wildmask + 1))
+    split_bits = 0
+    for _, top_wildmask in overlapped:
+        split_bits |= ncwb & ~top_wildmask
+    if not split_bits:
+        return False
+    bit = 1 << (split_bits.bit_length() - 1)
+    wildmask &= ~bit
+    return _is_covered((prefix, wildmask), overlapped) \
+        and _is_covered((prefix | bit, wildmask), overlapped)
@@ -0,0 +1,33 @@
+"""Create Acl objects for many devices in parallel processes."""
+
+import cisco_acl
+
+CONFIG_IOS = """
+hostname ROUTER1
+ip access-list extended ACL_NAME
+  permit tcp host 10.0.0.1 any eq 21
+  permit icmp any any
+"""
+
+CONFIG_NXOS = """
+hostname SWITCH1
+ip access-list ACL_NAME
+  10 permit tcp 10.0.0.0/24 any eq www
+"""
+
+if __name__ == "__main__":
+    items = [
+        ("router1", CONFIG_IOS, {"platform": "ios"}),
+        ("switch1", CONFIG_NXOS, {"platform": "nxos"}),
+        ("typo", CONFIG_IOS, {"platform": "typo"}),
+    ]
+    # Results are yielded as soon as they are finished
+    for device_id, acls, error in cisco_acl.acls_many(items, max_workers=2):
+        if error:
+            print(f"{device_id=} {error=}")
+            continue
+        for acl in acls:
+            print(f"{device_id=} {acl.name=} {len(acl.items)=}")
+    # device_id='router1' acl.name='ACL_NAME' len(acl.items)=2
+    # device_id='switch1' acl.name='ACL_NAME' len(acl.items)=1
+    # device_id='typo' error="ValueError: Invalid platform='typo', expected=[...]."
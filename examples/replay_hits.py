@@ -0,0 +1,35 @@
+"""Replay flow logs against ACLs, count hits of ACEs, find ACEs without traffic."""
+
+import io
+
+import cisco_acl
+from cisco_acl.replay import read_csv, replay
+
+CONFIG = """
+ip access-list extended ACL_NAME
+  10 permit tcp host 10.0.0.1 any eq 22
+  20 permit udp any any eq 53
+  30 permit icmp any any
+"""
+
+FLOWS = """src,dst,protocol,sport,dport
+10.0.0.1,10.0.0.2,tcp,1024,22
+10.0.0.3,10.0.0.2,udp,1024,53
+10.0.0.3,10.0.0.2,udp,1024,53
+10.0.0.3,10.0.0.2,tcp,1024,80
+"""
+
+if __name__ == "__main__":
+    acls = cisco_acl.acls(CONFIG)
+    # read_csv() and read_pcap() accept path or file object, flows are read in chunks
+    counter = replay(acls, read_csv(io.StringIO(FLOWS)))
+    for hits in counter.hits():
+        print(f"{hits.acl} {hits.line!r} {hits.hits=}")
+    # ACL_NAME '10 permit tcp host 10.0.0.1 any eq 22' hits.hits=1
+    # ACL_NAME '20 permit udp any any eq domain' hits.hits=2
+    # ACL_NAME '30 permit icmp any any' hits.hits=0
+    # ACL_NAME 'deny ip any any' hits.hits=1
+
+    for hits in counter.never_hit():
+        print(f"never hit: {hits.acl} {hits.line!r}")
+    # never hit: ACL_NAME '30 permit icmp any any'
@@ -10,6 +10,7 @@ REQ_NO_LINE = dict(
     name="",
     items=[],
     group_by="",
+    lazy=False,
     note="",
     sequence=0,
     protocol_nr=False,
@@ -159,6 +160,7 @@ REQ_LINE = dict(
                 note="",
                 max_ncwb=16)],
     group_by="",
+    lazy=False,
     note="a",
     protocol_nr=True,
     port_nr=True,
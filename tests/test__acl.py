@@ -6,6 +6,7 @@ from ipaddress import IPv4Network
 import dictdiffer
 
 from cisco_acl import Ace, AceGroup, Acl, Remark, Address
+from cisco_acl.shadow import ENGINES
 from tests import test__acl__helpers as h2
 from tests.helpers_test import (
     ACL_NAME_CNX,
@@ -574,6 +575,7 @@ class Test(Helpers):
                                  logs=[])),
             ],
             group_by="",
+            lazy=False,
             note="a",
             max_ncwb=16,
             indent=" ",
@@ -646,6 +648,85 @@ class Test(Helpers):
             diff = list(dictdiffer.diff(first=result, second=req_acegs_d))
             self.assertEqual(diff, [], msg=f"{line=}")
 
+    def test_valid__match(self):
+        """Acl.match()"""
+        line = f"{ACL_NAME_IOS}\n" \
+               "remark TEXT\n" \
+               "10 permit tcp host 10.0.0.1 any eq 22 443\n" \
+               "20 deny tcp 10.0.0.0 0.0.0.255 any\n" \
+               "30 permit udp 10.0.0.0 0.0.1.254 gt 1023 any range 1 100\n" \
+               "40 permit tcp any any established\n" \
+               "50 permit icmp any host 10.0.0.1 echo\n" \
+               "60 permit ip object-group NAME any"
+        acl_o = Acl(line)
+        acl_o.items[-1].srcaddr.items = [Address("10.0.3.0/24"), Address("host 10.0.4.1")]
+        for src, dst, protocol, sport, dport, flags, req in [
+            ("10.0.0.1", "1.1.1.1", "tcp", 1, 22, None, 10),
+            (0x0A000001, "1.1.1.1", 6, 1, 443, "", 10),
+            (IPv4Network("10.0.0.1/32").network_address, "1.1.1.1", "6", 1, 443, [], 10),
+            ("10.0.0.1", "1.1.1.1", "tcp", 1, 23, None, 20),
+            ("10.0.0.2", "1.1.1.1", "tcp", 1, 22, None, 20),
+            ("10.0.1.2", "1.1.1.1", "udp", 1024, 100, None, 30),
+            ("10.0.1.3", "1.1.1.1", "udp", 1024, 100, None, 0),
+            ("10.0.1.2", "1.1.1.1", "udp", 1023, 100, None, 0),
+            ("10.0.1.2", "1.1.1.1", "udp", 1024, 101, None, 0),
+            ("10.0.1.2", "1.1.1.1", "tcp", 1, 2, None, 0),
+            ("10.0.1.2", "1.1.1.1", "tcp", 1, 2, "ack", 40),
+            ("10.0.1.2", "1.1.1.1", "tcp", 1, 2, ["rst", "psh"], 40),
+            ("1.1.1.1", "10.0.0.1", "icmp", 0, 0, None, 0),
+            ("1.1.1.1", "10.0.0.1", "icmp", 0, 0, "echo", 50),
+            ("10.0.3.9", "1.1.1.1", "gre", 0, 0, None, 60),
+            ("10.0.4.1", "1.1.1.1", 47, 0, 0, None, 60),
+            ("10.0.4.2", "1.1.1.1", 47, 0, 0, None, 0),
+        ]:
+            msg = f"{src=} {dst=} {protocol=} {sport=} {dport=} {flags=}"
+            result = acl_o.match(src, dst, protocol, sport, dport, flags)
+            self.assertEqual(result.sequence, req, msg=msg)
+            if not req:
+                self.assertEqual(result.line, DENY_IP, msg=msg)
+
+        acl_o = Acl(f"{ACL_NAME_IOS_STD}\npermit 10.0.0.0 0.0.0.255")
+        self.assertEqual(acl_o.match("10.0.0.1", "1.1.1.1", "tcp").line,
+                         "permit 10.0.0.0 0.0.0.255")
+        self.assertEqual(acl_o.match("10.0.1.1", "1.1.1.1", "tcp").line, "deny any")
+
+    def test_valid__match__changed(self):
+        """Acl.match() compiled classifier is reset after items are changed"""
+        acl_o = Acl(f"{ACL_NAME_IOS}\n{PERMIT_ICMP}")
+        for method, args, req in [
+            ("append", [Ace(PERMIT_TCP)], PERMIT_TCP),
+            ("insert", [0, Ace(DENY_IP)], DENY_IP),
+            ("pop", [0], PERMIT_TCP),
+            ("remove", [acl_o.items[0]], PERMIT_TCP),
+            ("reverse", [], PERMIT_TCP),
+            ("clear", [], DENY_IP),
+            ("extend", [[Ace(PERMIT_UDP), Ace(PERMIT_TCP)]], PERMIT_TCP),
+        ]:
+            acl_o.match("10.0.0.1", "10.0.0.2", "icmp")
+            getattr(acl_o, method)(*args)
+            result = acl_o.match("10.0.0.1", "10.0.0.2", "tcp")
+            self.assertEqual(result.line, req, msg=f"{method=}")
+
+        acl_o.items = [PERMIT_IP]
+        self.assertEqual(acl_o.match("10.0.0.1", "10.0.0.2", "tcp").line, PERMIT_IP)
+        self.assertIsNone(acl_o.copy()._classifier, msg="copy without classifier")
+
+    def test_invalid__match(self):
+        """Acl.match()"""
+        acl_o = Acl(f"{ACL_NAME_IOS}\n{PERMIT_IP}")
+        for src, protocol, sport, flags, error in [
+            ("10.0.0.256", "tcp", 0, None, ValueError),
+            (None, "tcp", 0, None, TypeError),
+            ("10.0.0.1", "typo", 0, None, ValueError),
+            ("10.0.0.1", 256, 0, None, ValueError),
+            ("10.0.0.1", None, 0, None, TypeError),
+            ("10.0.0.1", "tcp", 65536, None, ValueError),
+            ("10.0.0.1", "tcp", "1", None, TypeError),
+            ("10.0.0.1", "tcp", 0, [1], TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{src=} {protocol=} {sport=} {flags=}"):
+                acl_o.match(src, "10.0.0.1", protocol, sport, 0, flags)
+
     def test_valid__resequence(self):
         """Acl.resequence()"""
         aces_0 = f"{ACL_NAME_IOS}\n  {PERMIT_IP}\n  {DENY_IP}\n  {REMARK}"
@@ -818,14 +899,26 @@ class Test(Helpers):
         ]:
             line = f"{ACL_NAME_CNX}\n{line}"
             obj = Acl(line, platform="nxos")
-            # shading
-            result = obj.shading()
-            diff = list(dictdiffer.diff(first=result, second=req_d))
-            self.assertEqual(diff, [], msg=f"{line=}")
-            # shadow
-            result_ = obj.shadow_of()
-            req = [s for ls in req_d.values() for s in ls]
-            self.assertEqual(result_, req, msg=f"{line=}")
+            for engine in ENGINES:
+                # shading
+                result = obj.shading(engine=engine)
+                diff = list(dictdiffer.diff(first=result, second=req_d))
+                self.assertEqual(diff, [], msg=f"{line=} {engine=}")
+                self.assertEqual(list(result), list(req_d), msg=f"{line=} {engine=}")
+                # shadow
+                result_ = obj.shadow_of(engine=engine)
+                req = [s for ls in req_d.values() for s in ls]
+                self.assertEqual(result_, req, msg=f"{line=} {engine=}")
+
+    def test_invalid__shading(self):
+        """Acl.shading()"""
+        obj = Acl(f"{ACL_NAME_CNX}\n{PERMIT_IP}\n{PERMIT_IP}", platform="nxos")
+        for engine, error in [
+            ("", ValueError),
+            ("typo", ValueError),
+        ]:
+            with self.assertRaises(error, msg=f"{engine=}"):
+                obj.shading(engine=engine)
 
     def test_valid__sort(self):
         """Acl.sort()"""
@@ -22,6 +22,7 @@ REQ_GROUPS_ACEGS_D = dict(
     input=[],
     output=[],
     group_by="=== ",
+    lazy=False,
     note="",
     max_ncwb=16,
     indent="  ",
@@ -35,6 +36,7 @@ REQ_GROUPS_ACEGS_D = dict(
              type="extended",
              name="",
              group_by="=== ",
+             lazy=False,
              items=[
                  dict(line="permit icmp any any",
                       platform="ios",
@@ -114,6 +116,7 @@ REQ_GROUPS_ACEGS_D = dict(
              type="extended",
              name="=== NAME1",
              group_by="=== ",
+             lazy=False,
              items=[
                  dict(line="remark === NAME1",
                       platform="ios",
@@ -207,6 +210,7 @@ REQ_GROUPS_ACEGS_D = dict(
              type="extended",
              name="=== NAME2",
              group_by="=== ",
+             lazy=False,
              items=[
                  dict(line="remark === NAME2",
                       platform="ios",
@@ -386,6 +390,7 @@ REQ_GROUP_REMARKS_D = dict(
                       action="remark",
                       text="=== NAME1")],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
@@ -404,11 +409,13 @@ REQ_GROUP_REMARKS_D = dict(
                       action="remark",
                       text="=== NAME2")],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
              sequence=0)],
     group_by="=== ",
+    lazy=False,
     note="",
     max_ncwb=16,
     indent="  ",
@@ -616,6 +623,7 @@ REQ_DUPLICATE_REMARKS = {
                    "action": "remark",
                    "text": "text_after_eq_3"}],
         "group_by": "=== ",
+        "lazy": False,
         "note": "",
         "protocol_nr": False,
         "port_nr": False,
@@ -771,11 +779,13 @@ REQ_DUPLICATE_REMARKS = {
                                "flags": [],
                                "logs": []}}],
          "group_by": "=== ",
+         "lazy": False,
          "note": "",
          "protocol_nr": False,
          "port_nr": False,
          "sequence": 0}],
     "group_by": "=== ",
+    "lazy": False,
     "note": "",
     "max_ncwb": 16,
     "indent": "  ",
@@ -0,0 +1,144 @@
+"""Unittest acl_table.py"""
+
+import random
+import unittest
+
+from cisco_acl import Acl, AclTable, Address
+from cisco_acl import acl_table
+from tests.helpers_test import ACL_NAME_IOS
+from tests.test__classifier import _generate_aces
+
+ANY = (0, 0xFFFFFFFF)
+PORTS = (0, 65535)
+
+
+@unittest.skipIf(acl_table.np is None, "numpy is not installed")
+class Test(unittest.TestCase):
+    """AclTable"""
+
+    def test_valid__init__(self):
+        """AclTable.__init__()"""
+        for line, req in [
+            ("", []),
+            ("remark TEXT", []),
+            ("permit ip any any", [(1, 0, *ANY, *PORTS, *ANY, *PORTS, 0, 0, 0, 0)]),
+            ("10 deny tcp host 10.0.0.1 eq 1 10.0.0.0 0.0.0.255 range 2 3 ack", [
+                (0, 6, 0x0A000001, 0, 1, 1, 0x0A000000, 0xFF, 2, 3, 1, 10, 0, 0),
+            ]),
+            ("permit udp 10.0.0.1 0.0.1.254 any eq 1 3", [
+                (1, 17, 0x0A000001, 0x1FE, *PORTS, *ANY, 1, 1, 0, 0, 0, 0),
+                (1, 17, 0x0A000001, 0x1FE, *PORTS, *ANY, 3, 3, 0, 0, 0, 0),
+            ]),
+            ("permit tcp any any neq 2 established dscp ef", [
+                (1, 6, *ANY, *PORTS, *ANY, 1, 1, 0x8002, 0, 0, 0),
+                (1, 6, *ANY, *PORTS, *ANY, 3, 65535, 0x8002, 0, 0, 0),
+            ]),
+        ]:
+            acl_o = Acl(f"{ACL_NAME_IOS}\n{line}")
+            table = AclTable(acl_o)
+            result = list(zip(*[table.data()[s].tolist() for s in table.columns]))
+            self.assertEqual(result, req, msg=f"{line=}")
+            self.assertEqual(len(table), len(req), msg=f"{line=}")
+
+    def test_valid__init__addrgroup(self):
+        """AclTable.__init__() address group members, AceGroup items"""
+        line = f"{ACL_NAME_IOS}\nremark TEXT\npermit ip object-group NAME any\n" \
+               "remark TEXT2\ndeny ip any any"
+        acl_o = Acl(line, group_by="TEXT")
+        ace_o = acl_o.items[0].items[1]
+        ace_o.srcaddr.items = [Address("10.0.0.0/30"), Address("host 10.0.0.5")]
+        table = AclTable(acl_o)
+
+        self.assertEqual(table.src_net.tolist(), [0x0A000000, 0x0A000005, 0])
+        self.assertEqual(table.src_wild.tolist(), [3, 0, 0xFFFFFFFF])
+        self.assertEqual(table.item_idx.tolist(), [0, 0, 1])
+        self.assertEqual(table.ace_idx.tolist(), [0, 0, 1])
+        self.assertIs(table.ace(1), ace_o)
+        self.assertEqual(table.ace(2).line, "deny ip any any")
+
+        ace_o.srcaddr.items = []
+        table = AclTable(acl_o)
+        self.assertEqual(table.ace_idx.tolist(), [1], msg="empty address group")
+
+    def test_valid__match_batch(self):
+        """AclTable.match_batch() and Acl.match() return the same item"""
+        np = acl_table.np
+        for seed in range(4):
+            rand = random.Random(seed)
+            acl_o = Acl(ACL_NAME_IOS, items=_generate_aces(count=300, seed=seed))
+            for ace_o in acl_o.items:
+                for addr_o in [ace_o.srcaddr, ace_o.dstaddr]:
+                    if addr_o.type == "addrgroup":
+                        addr_o.items = [Address("10.0.0.0 0.0.0.1"), Address("host 10.0.0.4")]
+            table = AclTable(acl_o)
+
+            packets, flags = [], []
+            for _ in range(1000):
+                packets.append((
+                    0x0A000000 | rand.getrandbits(rand.choice([3, 10, 24])),
+                    0x0A000000 | rand.getrandbits(rand.choice([3, 10, 24])),
+                    rand.choice([1, 6, 17, 47]),
+                    rand.choice([0, 1, 2, 3, 4, 1023, 1024, 65535]),
+                    rand.choice([0, 1, 2, 3, 4, 1023, 1024, 65535]),
+                ))
+                flags.append(rand.choice(["", "ack", "syn", "rst"]))
+            req = []
+            for packet, flag in zip(packets, flags):
+                ace_o = acl_o.match(*packet, flags=flag)
+                req.append(next((i for i, o in enumerate(acl_o.items) if o is ace_o), -1))
+
+            columns = [np.array(s) for s in zip(*packets)]
+            flags_ = np.array([acl_table.FLAG_BITS.get(s, 0) for s in flags])
+            for block_size in [1, 7, 4096]:
+                result = table.match_batch(*columns, flags=flags_, block_size=block_size)
+                self.assertEqual(result.tolist(), req, msg=f"{seed=} {block_size=}")
+
+    def test_valid__match_batch__defaults(self):
+        """AclTable.match_batch() default ports and flags, grouped ACL, empty arrays"""
+        np = acl_table.np
+        line = f"{ACL_NAME_IOS}\nremark TEXT\npermit tcp any any eq 22\n" \
+               "permit tcp any any established\nremark TEXT2\npermit udp any any\n" \
+               "permit ip 10.0.0.1 0.0.1.254 any"
+        acl_o = Acl(line, group_by="TEXT")
+        table = AclTable(acl_o)
+        src = np.array([1, 1, 0x0A000001, 0x0A000101, 0x0A000002], dtype=np.uint32)
+        protocol = np.array([6, 17, 1, 1, 1], dtype=np.uint8)
+        result = table.match_batch(src=src, dst=src, protocol=protocol)
+        self.assertEqual(result.tolist(), [-1, 1, 1, 1, -1])
+
+        result = table.match_batch(src=src, dst=src, protocol=protocol,
+                                   dport=np.array([22, 22, 22, 22, 22]))
+        self.assertEqual(result.tolist(), [0, 1, 1, 1, -1])
+
+        flags = np.array([acl_table.FLAG_BITS["rst"]] * 5)
+        result = table.match_batch(src=src, dst=src, protocol=protocol, flags=flags)
+        self.assertEqual(result.tolist(), [0, 1, 1, 1, -1])
+
+        empty = np.array([], dtype=np.uint32)
+        result = table.match_batch(src=empty, dst=empty, protocol=empty)
+        self.assertEqual(result.tolist(), [])
+
+    def test_invalid__match_batch(self):
+        """AclTable.match_batch()"""
+        table = AclTable(Acl(f"{ACL_NAME_IOS}\npermit ip any any"))
+        for kwargs, error in [
+            (dict(src=[1], dst=[1, 2], protocol=[6]), ValueError),
+            (dict(src=[1], dst=[1], protocol=[6], dport=[1, 2]), ValueError),
+            (dict(src=[1], dst=[1], protocol=[[6]]), ValueError),
+            (dict(src=[1], dst=[1], protocol=[6], block_size=0), ValueError),
+        ]:
+            with self.assertRaises(error, msg=f"{kwargs=}"):
+                table.match_batch(**kwargs)
+
+    def test_invalid__init__(self):
+        """AclTable.__init__()"""
+        for acl, error in [
+            ("ip access-list extended NAME", TypeError),
+            (None, TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{acl=}"):
+                AclTable(acl)
+
+
+if __name__ == "__main__":
+    unittest.main()
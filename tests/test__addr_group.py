@@ -1,5 +1,6 @@
 """unittest addr_group.py"""
 
+import random
 import unittest
 from ipaddress import IPv4Network
 
@@ -183,6 +184,51 @@ class Test(Helpers):
             with self.assertRaises(error):
                 obj1.__contains__(obj2)
 
+    def test_valid__contains__random(self):
+        """AddrGroup.__contains__() prefix trie and items comparison return the same"""
+        rand = random.Random(0)
+        for _ in range(200):
+            items = [f"10.0.{rand.getrandbits(2)}.{rand.getrandbits(8)}/{rand.randrange(22, 33)}"
+                     for _ in range(rand.randrange(1, 20))]
+            addrgroup = AddrGroup(f"{NAME_CNX}", items=items, platform="nxos")
+            for _ in range(10):
+                prefixlen = rand.randrange(22, 33)
+                prefix = f"10.0.{rand.getrandbits(2)}.{rand.getrandbits(8)}/{prefixlen}"
+                other = AddressAg(prefix, platform="nxos")
+                req = addrgroup._contains_items(other)
+                result = other in addrgroup
+                self.assertEqual(result, req, msg=f"{items=} {prefix=}")
+
+    def test_valid__contains__changed(self):
+        """AddrGroup.__contains__() after items are changed"""
+        addrgroup = AddrGroup(f"{NAME_CNX}\n{PREFIX30}", platform="nxos")
+        self.assertNotIn(A_PREF24, addrgroup)
+        addrgroup.items.append(AddressAg(PREFIX24, platform="nxos"))
+        self.assertIn(A_PREF24, addrgroup)
+        addrgroup.items = [PREFIX30]
+        self.assertNotIn(A_PREF24, addrgroup)
+        addrgroup.insert(0, AddressAg(PREFIX24, platform="nxos"))
+        self.assertIn(A_PREF24, addrgroup)
+        copy_ = addrgroup.copy()
+        addrgroup.pop(0)
+        self.assertNotIn(A_PREF24, addrgroup)
+        self.assertIn(A_PREF24, copy_)
+
+        # same length changes
+        items = ["10.0.0.0/24", "10.0.1.0/24"]
+        addrgroup = AddrGroup(f"{NAME_CNX}", items=items, platform="nxos")
+        host5 = AddressAg("host 10.5.0.1", platform="nxos")
+        self.assertNotIn(host5, addrgroup)
+        addrgroup.items[0] = AddressAg("10.5.0.0/16", platform="nxos")
+        self.assertIn(host5, addrgroup)
+
+        host1 = AddressAg("host 10.0.1.1", platform="nxos")
+        self.assertIn(host1, addrgroup)
+        addrgroup.items.remove(addrgroup.items[1])
+        addrgroup.items.append(AddressAg("10.9.0.0/16", platform="nxos"))
+        self.assertNotIn(host1, addrgroup)
+        self.assertEqual(addrgroup.covering("host 10.9.0.1"), [addrgroup.items[1]])
+
     # =========================== property ===========================
 
     def test_valid__indent(self):
@@ -388,6 +434,49 @@ class Test(Helpers):
             result = obj.cmd_addgr_name()
             self.assertEqual(result, req, msg=f"{platform=}")
 
+    def test_valid__covering(self):
+        """AddrGroup.covering()"""
+        items = ["10.0.0.0/24", "10.0.0.0/30", "10.0.1.0/24", "10.0.0.0 0.0.1.3", "10.0.0.0/24"]
+        addrgroup = AddrGroup(f"{NAME_CNX}", items=items, platform="nxos")
+        for address, req in [
+            ("host 10.0.0.1", [0, 1, 3, 4]),
+            ("host 10.0.1.1", [2, 3]),
+            ("host 10.0.0.4", [0, 4]),
+            ("10.0.0.0/24", [0, 4]),
+            ("10.0.0.0/23", []),
+            (AddressAg("10.0.0.0 0.0.1.1", platform="nxos"), [3]),
+            ("host 10.0.2.1", []),
+        ]:
+            result = addrgroup.covering(address)
+            self.assertEqual(result, [addrgroup.items[i] for i in req], msg=f"{address=}")
+
+    def test_invalid__covering(self):
+        """AddrGroup.covering()"""
+        addrgroup = AddrGroup(f"{NAME_CNX}\n{PREFIX24}", platform="nxos")
+        for address, error in [
+            (1, TypeError),
+            ("text", ValueError),
+            (AddrGroup(f"{NAME_CNX}\n{PREFIX24}", platform="nxos"), TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{address=}"):
+                addrgroup.covering(address)
+
+    def test_valid__overlapping(self):
+        """AddrGroup.overlapping()"""
+        items = ["10.0.0.0/24", "10.0.0.0/30", "10.0.1.0/24", "10.0.0.0 0.0.1.3", "10.1.0.0/16"]
+        addrgroup = AddrGroup(f"{NAME_CNX}", items=items, platform="nxos")
+        for address, req in [
+            ("host 10.0.0.1", [0, 1, 3]),
+            ("10.0.0.0/23", [0, 1, 2, 3]),
+            ("10.0.0.4/30", [0]),
+            ("10.0.0.0/8", [0, 1, 2, 3, 4]),
+            ("10.0.0.0 0.0.1.0", [0, 1, 2, 3]),
+            ("10.0.0.4 0.255.0.0", [0, 4]),
+            ("host 10.2.0.0", []),
+        ]:
+            result = addrgroup.overlapping(address)
+            self.assertEqual(result, [addrgroup.items[i] for i in req], msg=f"{address=}")
+
     def test_valid__ipnets(self):
         """Address.ipnets()"""
         pref30 = AddressAg(PREFIX30, platform="nxos")
@@ -1,5 +1,6 @@
 """Unittest address.py"""
 
+import random
 import unittest
 from ipaddress import IPv4Network, NetmaskValueError
 from logging import WARNING
@@ -42,6 +43,23 @@ from tests.helpers_test import (
 )
 
 
+def _collapse_legacy(ipnets: list) -> list:
+    """Return collapsed networks, legacy algorithm that scans the list for each network."""
+    ipnets = list(ipnets)
+    collapsed = []
+    while ipnets:
+        ipnet = ipnets.pop()
+        if [o for o in ipnets if ipnet.subnet_of(o)]:
+            continue
+        supernet = ipnet.supernet()
+        if set(supernet.subnets()).issubset({*ipnets, ipnet}):
+            if supernet not in ipnets:
+                ipnets.insert(0, supernet)
+            continue
+        collapsed.append(ipnet)
+    return collapsed
+
+
 # noinspection DuplicatedCode
 class Test(Helpers):
     """Address"""
@@ -616,6 +634,36 @@ class Test(Helpers):
             result = bottom.subnet_of(top)
             self.assertEqual(result, req, msg=f"{top=} {bottom=}")
 
+    def test_valid__is_subnet__nc_wildcard(self):
+        """Address.is_subnet() non-contiguous wildcards"""
+        wild_nc = Address("10.0.0.0 0.0.1.3", platform="ios")
+        wild_nc30 = Address("0.0.0.0 127.255.255.254", platform="ios", max_ncwb=30)
+        pr0_30 = Address("10.0.0.0/30", platform="nxos")
+        pr1_30 = Address("10.0.1.0/30", platform="nxos")
+        ag_01 = Address("addrgroup A", platform="nxos", items=[pr0_30, pr1_30])
+        for top, bottom, req in [
+            (ag_01, wild_nc, True),
+            (wild_nc, ag_01, True),
+            (wild_nc, pr1_30, True),
+            (pr1_30, wild_nc, False),
+            (wild_nc30, wild_nc, False),
+            (wild_nc30, Address("host 10.0.0.4", platform="ios"), True),
+            (wild_nc30, Address("host 10.0.0.5", platform="ios"), False),
+        ]:
+            result = bottom.subnet_of(top)
+            self.assertEqual(result, req, msg=f"{top=} {bottom=}")
+
+    def test_valid__wildcard_ints(self):
+        """Address.wildcard_ints()"""
+        for kwargs, req in [
+            (dict(line=WILD30), [(0x0A000000, 3)]),
+            (dict(line=IOS_ADDGR), []),
+            (dict(line=IOS_ADDGR, items=[WILD32, WILD30]), [(0x0A000001, 0), (0x0A000000, 3)]),
+        ]:
+            obj = Address(platform="ios", **kwargs)
+            result = obj.wildcard_ints()
+            self.assertEqual(result, req, msg=f"{kwargs=}")
+
     def test_valid__wildcards(self):
         """Address.wildcards()"""
         for kwargs, req in [
@@ -673,6 +721,20 @@ class Test(Helpers):
             result = [o.line for o in list(result_)]
             self.assertEqual(result, req, msg=f"{lines=}")
 
+    def test_valid__collapse__random(self):
+        """address.collapse() returns the same as legacy list scanning algorithm"""
+        rand = random.Random(0)
+        for _ in range(200):
+            prefixes = []
+            for _ in range(rand.randrange(1, 20)):
+                prefixlen = rand.randrange(26, 33)
+                prefixes.append(IPv4Network((0x0A000000 | rand.getrandbits(6), prefixlen), False))
+            addresses = [Address(str(o), platform="nxos") for o in prefixes]
+            collapsed = [Address(str(o), platform="nxos") for o in _collapse_legacy(prefixes)]
+            req = [o.line for o in sorted(collapsed)]
+            result = [o.line for o in address.collapse(addresses)]
+            self.assertEqual(result, req, msg=f"{prefixes=}")
+
     def test_invalid__collapse(self):
         """address.collapse()"""
         addr = Address("10.0.0.0/30", platform="nxos")
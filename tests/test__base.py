@@ -1,8 +1,9 @@
 """Unittest base.py"""
 
+import pickle
 import unittest
 
-from cisco_acl import Ace, Remark
+from cisco_acl import Ace, Acl, Address, Remark
 from tests.helpers_test import Helpers, PERMIT_IP, REMARK
 
 
@@ -59,6 +60,67 @@ class Test(Helpers):
         result = obj.uuid
         self.assertEqual(result, "1", msg="uuid")
 
+    def test_valid__uuid__lazy(self):
+        """Base.uuid generated on the first read"""
+        obj = Ace(PERMIT_IP)
+        self.assertEqual(obj._uuid, "", msg="not generated")
+        obj.copy()
+        self.assertEqual(obj._uuid, "", msg="not generated")
+        uuid = obj.uuid
+        self.assertEqual(obj._uuid, uuid, msg="generated")
+        self.assertEqual(obj.uuid, uuid, msg="same uuid")
+        self.assertNotEqual(obj.copy().uuid, uuid, msg="copy")
+
+        obj = Ace(PERMIT_IP)
+        obj_ = pickle.loads(pickle.dumps(obj))
+        self.assertEqual((obj._uuid, obj_._uuid), ("", ""), msg="pickle, not generated")
+        self.assertNotEqual(obj_.uuid, obj.uuid, msg="pickle, generated after unpickling")
+        uuid = obj.uuid
+        self.assertEqual(pickle.loads(pickle.dumps(obj)).uuid, uuid, msg="pickle, same uuid")
+
+        obj = Ace(PERMIT_IP, uuid="1")
+        self.assertEqual(obj.uuid, "1", msg="init")
+
+    def test_valid__copy(self):
+        """Base.copy() structural copy"""
+        line = "ip access-list extended NAME\n" \
+               "10 permit tcp object-group NAME eq 80 443 host 10.0.0.1 log\n" \
+               "20 remark TEXT"
+        for class_, line_, kwargs in [
+            (Remark, REMARK, {}),
+            (Ace, PERMIT_IP, {}),
+            (Ace, "permit tcp 10.0.0.0 0.0.0.3 eq 80 any", dict(platform="nxos", note="a")),
+            (Acl, line, dict(input=["Eth1"], note={"a": 1})),
+        ]:
+            obj = class_(line_, **kwargs)
+            copy_o = obj.copy()
+            self.assertIsInstance(copy_o, class_, msg=f"{line_=}")
+            self.assertEqual(copy_o.data(), obj.data(), msg=f"{line_=}")
+            self.assertNotEqual(copy_o.uuid, obj.uuid, msg=f"{line_=}")
+
+        # children are not shared
+        acl_o = Acl(line)
+        ace_o = acl_o.items[0]
+        ace_o.srcaddr.items = [Address("10.0.0.0/30")]
+        copy_o = acl_o.copy()
+        copy_ace = copy_o.items[0]
+        self.assertIsNot(copy_o.items, acl_o.items)
+        for name in ["protocol", "srcaddr", "srcport", "dstaddr", "dstport", "option"]:
+            self.assertIsNot(getattr(copy_ace, name), getattr(ace_o, name), msg=f"{name=}")
+        self.assertIsNot(copy_ace.srcaddr.items[0], ace_o.srcaddr.items[0])
+
+        copy_ace.srcaddr.items = [Address("10.0.0.4/30")]
+        copy_ace.srcport.line = "eq 22"
+        copy_ace.dstaddr.line = "any"
+        copy_o.items.append(Ace(PERMIT_IP))
+        copy_o.input.append("Eth2")
+        self.assertEqual(acl_o.line,
+                         "ip access-list extended NAME\n"
+                         "  10 permit tcp object-group NAME eq www 443 host 10.0.0.1 log\n"
+                         "  20 remark TEXT")
+        self.assertEqual(ace_o.srcaddr.items[0].line, "10.0.0.0 0.0.0.3")
+        self.assertEqual(acl_o.input, [])
+
     def test_invalid__uuid(self):
         """Base.uuid"""
         for uuid, error in [
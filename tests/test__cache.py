@@ -0,0 +1,160 @@
+"""Unittest cache.py"""
+
+import unittest
+
+from cisco_acl import Ace, Port, Wildcard, cache
+from cisco_acl.cache import LruCache
+
+
+class Test(unittest.TestCase):
+    """cache.py"""
+
+    def tearDown(self):
+        cache.disable_interning()
+        cache.set_ipnets_maxsize()
+        cache.clear_ipnets()
+
+    # ============================= LruCache =============================
+
+    def test_valid__lru_cache(self):
+        """LruCache.get() LruCache.set()"""
+        obj = LruCache(maxsize=2)
+        obj.set("a", 1)
+        obj.set("b", 2)
+        self.assertEqual(obj.get("a"), 1)
+        obj.set("c", 3)  # "b" is the least recently used
+        self.assertEqual(obj.get("b"), None)
+        self.assertEqual(obj.get("c"), 3)
+        self.assertIn("a", obj)
+        self.assertEqual(len(obj), 2)
+        self.assertEqual(obj.stats(), dict(hits=2, misses=1, size=2, maxsize=2))
+
+        obj.maxsize = 1
+        self.assertEqual(len(obj), 1)
+        self.assertIn("c", obj)
+
+        obj.clear()
+        self.assertEqual(obj.stats(), dict(hits=0, misses=0, size=0, maxsize=1))
+
+    def test_invalid__lru_cache(self):
+        """LruCache()"""
+        for maxsize, error in [
+            (0, ValueError),
+            (-1, ValueError),
+            ("1", TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{maxsize=}"):
+                LruCache(maxsize=maxsize)
+
+    # ============================= interning ============================
+
+    def test_valid__intern(self):
+        """cache.intern()"""
+        for enabled, req in [
+            (False, False),
+            (True, True),
+        ]:
+            if enabled:
+                cache.enable_interning()
+            obj1 = cache.intern(Port, "eq 1", protocol="tcp")
+            obj2 = cache.intern(Port, "eq 1", protocol="tcp")
+            obj3 = cache.intern(Port, "eq 1", protocol="udp")
+            self.assertEqual(obj1 is obj2, req, msg=f"{enabled=}")
+            self.assertIsNot(obj1, obj3, msg=f"{enabled=}")
+            self.assertEqual(obj1.line, "eq 1", msg=f"{enabled=}")
+            self.assertEqual(obj3.protocol, "udp", msg=f"{enabled=}")
+
+    def test_valid__interning(self):
+        """cache.interning()"""
+        self.assertFalse(cache.is_interning())
+        with cache.interning(maxsize=10):
+            self.assertTrue(cache.is_interning())
+            ace1 = Ace("permit tcp any any eq 1 log")
+            ace2 = Ace("deny tcp any eq 2 any eq 1 log")
+            stats = cache.interning_stats()
+        self.assertFalse(cache.is_interning())
+        self.assertEqual(cache.interning_stats(), dict(hits=0, misses=0, size=0, maxsize=0))
+        self.assertEqual(stats["maxsize"], 10)
+        self.assertGreater(stats["hits"], 0)
+
+        self.assertIs(ace1.srcaddr, ace2.srcaddr)
+        self.assertIs(ace1.dstport, ace2.dstport)
+        self.assertIs(ace1.option, ace2.option)
+        self.assertIsNot(ace1.srcport, ace2.srcport)
+        self.assertEqual(ace1.line, "permit tcp any any eq 1 log")
+        self.assertEqual(ace2.line, "deny tcp any eq 2 any eq 1 log")
+
+    def test_valid__interning__addrgroup(self):
+        """cache.interning() address group is not interned"""
+        with cache.interning():
+            ace1 = Ace("permit ip object-group A any")
+            ace2 = Ace("permit ip object-group A any")
+        self.assertIsNot(ace1.srcaddr, ace2.srcaddr)
+        self.assertIs(ace1.dstaddr, ace2.dstaddr)
+
+    def test_valid__interning__unshare(self):
+        """Ace methods do not change shared objects"""
+        with cache.interning():
+            line = "permit tcp host 10.0.0.1 eq 1 2 any eq 3 4 log"
+            ace1 = Ace(line)
+            ace2 = Ace(line)
+            aces = ace1.ungroup_ports()
+            self.assertEqual(len(aces), 4)
+            self.assertEqual(ace1.line, line)
+            self.assertEqual(ace2.line, line)
+            self.assertEqual(Ace(line).line, line)
+
+            line = "permit tcp host 10.0.0.1 eq 1 any eq www log"
+            ace1 = Ace(line)
+            ace2 = Ace(line)
+            ace1.platform = "nxos"
+            self.assertEqual(ace1.srcaddr.platform, "nxos")
+            self.assertEqual(ace2.line, line)
+            self.assertEqual(ace2.srcaddr.platform, "ios")
+            self.assertEqual(Ace(line).line, line)
+
+            ace1 = Ace(line)
+            ace1.type = "standard"
+            self.assertEqual(ace1.line, "permit host 10.0.0.1")
+            self.assertEqual(ace2.line, line)
+            self.assertEqual(Ace(line).line, line)
+
+    # ============================== ipnets ==============================
+
+    def test_valid__ipnets(self):
+        """Wildcard.ipnets() cache by value"""
+        cache.clear_ipnets()
+        wildcard1 = Wildcard("10.0.0.0 0.0.1.3")
+        wildcard2 = Wildcard("10.0.0.0 0.0.1.3")
+        ipnets1 = wildcard1.ipnets()
+        ipnets2 = wildcard2.ipnets()
+        self.assertEqual(ipnets1, ipnets2)
+        self.assertIsNot(ipnets1, ipnets2, msg="each call returns a new list")
+        self.assertEqual(cache.ipnets_stats(), dict(hits=1, misses=1, size=1, maxsize=1024))
+
+        ipnets1.clear()
+        self.assertEqual(len(wildcard1.ipnets()), 2, msg="cached value is not changed")
+        keys = list(cache.ipnets_cache()._data)  # pylint: disable=protected-access
+        self.assertEqual(keys, [(0x0A000000, 0x103, 16)], msg="Wildcard is not cached")
+
+        cache.set_ipnets_maxsize(1)
+        Wildcard("10.0.0.0 0.0.0.3").ipnets()
+        self.assertEqual(cache.ipnets_stats(), dict(hits=2, misses=2, size=1, maxsize=1))
+        wildcard1.ipnets()
+        self.assertEqual(cache.ipnets_stats(), dict(hits=2, misses=3, size=1, maxsize=1))
+
+        cache.clear_ipnets()
+        self.assertEqual(cache.ipnets_stats(), dict(hits=0, misses=0, size=0, maxsize=1))
+
+    def test_invalid__set_ipnets_maxsize(self):
+        """cache.set_ipnets_maxsize()"""
+        for maxsize, error in [
+            (0, ValueError),
+            ("1", TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{maxsize=}"):
+                cache.set_ipnets_maxsize(maxsize)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Unittest classifier.py"""
+
+import random
+import unittest
+from ipaddress import IPv4Address
+
+from cisco_acl import Ace, Acl, Address
+from cisco_acl import classifier
+from cisco_acl.classifier import Classifier
+from tests.helpers_test import ACL_NAME_IOS, DENY_IP
+
+
+def _generate_aces(count: int, seed: int) -> list:
+    """Return random ACE lines, overlapping addresses and ports."""
+    rand = random.Random(seed)
+    protocols = ["ip", "tcp", "tcp", "udp", "icmp", "47"]
+    addrs = ["any", "10.0.0.0 0.0.0.255", "10.0.0.0 0.0.0.3", "10.0.1.0 0.0.0.255",
+             "10.0.0.0 0.0.1.254", "10.0.0.0 0.0.2.255", "10.0.0.0 0.255.255.255",
+             "object-group NAME"]
+    ports = ["", "eq 1", "eq 1 2", "range 1 3", "gt 2", "lt 3", "neq 2", "gt 1023"]
+    options = ["", "", "log", "ack", "established", "syn"]
+    lines = []
+    for _ in range(count):
+        protocol = rand.choice(protocols)
+        srcport = dstport = option = ""
+        if protocol in ["tcp", "udp"]:
+            srcport = rand.choice(ports)
+            dstport = rand.choice(ports)
+        if protocol == "tcp":
+            option = rand.choice(options)
+        srcaddr = rand.choice(addrs + [f"host 10.0.0.{rand.randrange(8)}"])
+        dstaddr = rand.choice(addrs + [f"host 10.0.0.{rand.randrange(8)}"])
+        items = [rand.choice(["permit", "deny"]), protocol, srcaddr, srcport, dstaddr, dstport,
+                 option]
+        lines.append(" ".join(s for s in items if s))
+    return lines
+
+
+def _match_linear(aces: list, packet: tuple, flags: frozenset):
+    """Return the first ACE matching the packet, linear search by Address.ipnets()."""
+    src, dst, protocol, sport, dport = packet
+    for ace in aces:
+        if ace.protocol.number not in (0, protocol):
+            continue
+        if not any(IPv4Address(src) in o for o in ace.srcaddr.ipnets()):
+            continue
+        if not any(IPv4Address(dst) in o for o in ace.dstaddr.ipnets()):
+            continue
+        if ace.srcport.ranges and not any(lo <= sport <= hi for lo, hi in ace.srcport.ranges):
+            continue
+        if ace.dstport.ranges and not any(lo <= dport <= hi for lo, hi in ace.dstport.ranges):
+            continue
+        required = set(ace.option.flags)
+        if "established" in required:
+            required.remove("established")
+            if not flags & {"ack", "rst"}:
+                continue
+        if not required.issubset(flags):
+            continue
+        return ace
+    return None
+
+
+class Test(unittest.TestCase):
+    """Classifier"""
+
+    def test_valid__lookup(self):
+        """Classifier.lookup() decision tree and linear search return the same ACE"""
+        for seed in range(4):
+            rand = random.Random(seed)
+            acl_o = Acl(ACL_NAME_IOS, items=_generate_aces(count=200, seed=seed))
+            for ace_o in acl_o.items:
+                for addr_o in [ace_o.srcaddr, ace_o.dstaddr]:
+                    if addr_o.type == "addrgroup":
+                        addr_o.items = [Address("10.0.0.0 0.0.0.1"), Address("host 10.0.0.4")]
+            aces = acl_o.items
+            implicit = Ace(DENY_IP)
+            obj = Classifier(aces=aces, implicit=implicit)
+
+            for _ in range(300):
+                packet = (
+                    0x0A000000 | rand.getrandbits(rand.choice([3, 10, 24])),
+                    0x0A000000 | rand.getrandbits(rand.choice([3, 10, 24])),
+                    rand.choice([1, 6, 17, 47]),
+                    rand.choice([0, 1, 2, 3, 4, 1023, 1024, 65535]),
+                    rand.choice([0, 1, 2, 3, 4, 1023, 1024, 65535]),
+                )
+                flags = classifier.init_flags(rand.choice(["", "ack", "syn", "rst log"]))
+                req = _match_linear(aces, packet, flags) or implicit
+                result = obj.lookup(*packet, flags=flags)
+                self.assertIs(result, req, msg=f"{seed=} {packet=} {flags=}")
+
+    def test_valid__init_flags(self):
+        """classifier.init_flags()"""
+        for flags, req in [
+            (None, frozenset()),
+            ("", frozenset()),
+            ("ack syn", frozenset(["ack", "syn"])),
+            (["ack"], frozenset(["ack"])),
+        ]:
+            result = classifier.init_flags(flags)
+            self.assertEqual(result, req, msg=f"{flags=}")
+
+
+if __name__ == "__main__":
+    unittest.main()
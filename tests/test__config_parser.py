@@ -1,5 +1,6 @@
 """unittest config_parser.py"""
 
+import io
 import unittest
 
 import dictdiffer
@@ -54,6 +55,24 @@ ip access-list ACL_NAME
   50 deny ip 10.0.0.2/32 any
 """
 
+INTF = """
+hostname HOSTNAME
+interface Ethernet1
+  ip address 10.0.0.1 255.255.255.0
+  ip access-group ACL1 in
+  ip access-group ACL2 out
+interface Ethernet2
+  ip access-group ACL1 out
+interface Ethernet3
+  description unused
+ip access-list extended ACL1
+  permit ip any any
+ip access-list extended ACL2
+  permit ip any any
+interface Ethernet2
+  ip access-group ACL1 out
+"""
+
 
 class Test(unittest.TestCase):
     """ConfigParser"""
@@ -110,6 +129,144 @@ class Test(unittest.TestCase):
             diff = list(dictdiffer.diff(first=result, second=req))
             self.assertEqual(diff, [], msg=f"{config=}")
 
+    def test_valid__access_groups(self):
+        """ConfigParser.acl_interfaces ConfigParser.interface_acls"""
+        acl_interfaces = {"ACL1": [("interface Ethernet1", "in"), ("interface Ethernet2", "out")],
+                          "ACL2": [("interface Ethernet1", "out")]}
+        interface_acls = {"interface Ethernet1": [("ACL1", "in"), ("ACL2", "out")],
+                          "interface Ethernet2": [("ACL1", "out")]}
+        for method in ["parse_config", "parse_sections"]:
+            parser = ConfigParser(INTF)
+            getattr(parser, method)()
+            self.assertEqual(parser.acl_interfaces, acl_interfaces, msg=f"{method=}")
+            self.assertEqual(parser.interface_acls, interface_acls, msg=f"{method=}")
+            result = [(d["name"], d["input"], d["output"]) for d in parser.acls()]
+            req = [("ACL1", ["interface Ethernet1"], ["interface Ethernet2"]),
+                   ("ACL2", [], ["interface Ethernet1"])]
+            self.assertEqual(result, req, msg=f"{method=}")
+
+            getattr(parser, method)()
+            self.assertEqual(parser.acl_interfaces, acl_interfaces, msg=f"{method=}")
+
+    def test_invalid__access_groups(self):
+        """ConfigParser.parse_sections() invalid access-group"""
+        for config in [
+            "interface Ethernet1\n  ip access-group ACL1 both\n",
+            "router bgp 1\n  ip access-group ACL1 in\n",
+        ]:
+            parser = ConfigParser(config)
+            with self.assertRaises(ValueError, msg=f"{config=}"):
+                parser.parse_sections()
+
+    def test_valid__mdic(self):
+        """ConfigParser.mdic ConfigParser.mdic_text"""
+        config = "hostname HOSTNAME\n" \
+                 "interface Ethernet1\n" \
+                 "  ip address 10.0.0.1 255.255.255.0\n" \
+                 "  hsrp 1\n" \
+                 "    ip 10.0.0.2\n" \
+                 "    priority 110\n" \
+                 "  no shutdown\n" \
+                 "interface Ethernet2\n" \
+                 "router bgp 1\n" \
+                 "  neighbor 10.0.0.3\n" \
+                 "    address-family ipv4\n" \
+                 "      send-community\n" \
+                 "end\n"
+        req = {"_config_": ["hostname HOSTNAME", "interface Ethernet2", "end"],
+               "interface Ethernet1": {"_config_": ["ip address 10.0.0.1 255.255.255.0",
+                                                    "no shutdown"],
+                                       "hsrp 1": {"_config_": ["ip 10.0.0.2", "priority 110"]}},
+               "router bgp 1": {"_config_": [],
+                                "neighbor 10.0.0.3": {
+                                    "_config_": [],
+                                    "address-family ipv4": {"_config_": ["send-community"]}}},
+               "interface Ethernet2": {"_config_": []}}
+        req_text = {"_config_": "hostname HOSTNAME\ninterface Ethernet2\nend",
+                    "interface Ethernet1": {"_config_": "ip address 10.0.0.1 255.255.255.0\n"
+                                                        "no shutdown",
+                                            "hsrp 1": {"_config_": "ip 10.0.0.2\npriority 110"}},
+                    "router bgp 1": {"_config_": "",
+                                     "neighbor 10.0.0.3": {
+                                         "_config_": "",
+                                         "address-family ipv4": {"_config_": "send-community"}}},
+                    "interface Ethernet2": {"_config_": ""}}
+        parser = ConfigParser(config)
+        self.assertEqual(parser.mdic, {})
+        self.assertEqual(parser.mdic_text, {})
+        parser.parse_config()
+        self.assertEqual(parser.mdic, req)
+        self.assertEqual(list(parser.mdic), list(req))
+        self.assertEqual(parser.mdic_text, req_text)
+
+        parser = ConfigParser("")
+        parser.parse_config()
+        self.assertEqual(parser.mdic, {"_config_": []})
+        self.assertEqual(parser.mdic_text, {"_config_": ""})
+
+        parser = ConfigParser(config)
+        parser.parse_config()
+        parser.mdic = {}
+        self.assertEqual(parser.mdic, {})
+        self.assertEqual(parser.mdic_text, req_text)
+
+    def test_valid__iter_sections(self):
+        """ConfigParser.iter_sections()"""
+        sections1 = [("hostname HOSTNAME", []),
+                     ("interface Ethernet1/54", ["ip access-group ACL_NAME in"]),
+                     ("ip access-list ACL_NAME", ["statistics per-entry",
+                                                  "10 remark === C-1, text",
+                                                  "20 permit tcp 10.0.0.1/32 eq 1 10.0.0.0/8 "
+                                                  "range 3 5 log",
+                                                  "30 remark === C-2",
+                                                  "40 deny ip 10.0.0.2/32 any"]),
+                     ("interface Ethernet1/55", ["description unused"]),
+                     ("ip access-list UNUSED", ["10 remark unused",
+                                                "20 permit ip 10.0.0.253/32 any"])]
+        for config, req in [
+            ("", []),
+            ("  !\n! comment\n", [("!", [])]),
+            (POL1, sections1),
+            (io.StringIO(POL1), sections1),
+            (POL1.splitlines(), sections1),
+            (iter(POL1.splitlines(keepends=True)), sections1),
+        ]:
+            parser = ConfigParser(config, platform="nxos")
+            result = list(parser.iter_sections())
+            self.assertEqual(result, req, msg=f"{config=}")
+
+    def test_valid__iter_lines(self):
+        """ConfigParser.iter_lines()"""
+        for config in ["", POL1, POL2, ADDGR, "  text1\n!\n  text2\n\t!"]:
+            parser = ConfigParser(config)
+            parser.parse_config()
+            req = parser.lines
+
+            parser = ConfigParser(io.StringIO(config))
+            result = list(parser.iter_lines())
+            self.assertEqual(result, req, msg=f"{config=}")
+
+    def test_valid__parse_sections(self):
+        """ConfigParser.parse_sections()"""
+        config_dup = f"{POL2}\n{ADDGR}\ninterface Ethernet1/54\n  ip access-group ACL_NAME out\n" \
+                     f"ip access-list ACL_NAME\n  60 permit ip any any\n"
+        for config in ["", POL1, POL2, ADDGR, config_dup]:
+            parser = ConfigParser(config, platform="nxos")
+            parser.parse_config()
+            req_acls = parser.acls()
+            req_addgrs = parser.addgrs()
+
+            for config_ in [config, io.StringIO(config)]:
+                parser = ConfigParser(config_, platform="nxos")
+                parser.parse_sections()
+                self.assertEqual(parser.mdic, {}, msg="full config is not parsed")
+                result = parser.acls()
+                diff = list(dictdiffer.diff(first=result, second=req_acls))
+                self.assertEqual(diff, [], msg=f"{config=}")
+                result = parser.addgrs()
+                diff = list(dictdiffer.diff(first=result, second=req_addgrs))
+                self.assertEqual(diff, [], msg=f"{config=}")
+
 
 if __name__ == "__main__":
     unittest.main()
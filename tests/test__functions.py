@@ -1,5 +1,7 @@
 """unittest functions.py"""
 
+import io
+import pickle
 import re
 import unittest
 from ipaddress import NetmaskValueError
@@ -70,6 +72,21 @@ class Test(unittest.TestCase):
             else:
                 self.assertEqual(len(acls), 0, msg="1 acl expected")
 
+    def test_valid__acls__stream(self):
+        """functions.acls() functions.addrgroups() functions.aces() text iterator"""
+        for kwargs in [
+            dict(config=CNX_ACL_EXT_CFG, platform="nxos"),
+            dict(config=IOS_ACL_EXT_CFG, platform="ios"),
+            dict(config=IOS_ACL_STD_CFG, platform="ios", group_by="=== "),
+            dict(config=IOS_ADDGR_CFG, platform="ios"),
+        ]:
+            config = kwargs.pop("config")
+            for func in [f.acls, f.addrgroups, f.aces]:
+                req = [o.data() for o in func(config, **kwargs)]
+                result = [o.data() for o in func(io.StringIO(config), **kwargs)]
+                diff = list(dictdiffer.diff(first=result, second=req))
+                self.assertEqual(diff, [], msg=f"{func=} {kwargs=}")
+
     def test_valid__acls_2(self):
         """functions.acls(kwargs)"""
         # max_ncwb, 30 instead of 16
@@ -91,6 +108,23 @@ class Test(unittest.TestCase):
         result = acls[0].items[1].dstport.line
         self.assertEqual(result, "eq 80", msg="port_nr")
 
+    def test_valid__acls__addrgroup_shared(self):
+        """functions.acls() ACE addresses share items of the same address group"""
+        config = IOS_ACL_EXT_CFG.replace("  deny ip object-group AG_NAME any",
+                                         "  deny ip object-group AG_NAME any\n"
+                                         "  deny ip any object-group AG_NAME")
+        acl_o = f.acls(config=config)[0]
+        ace1, ace2 = acl_o.items[3], acl_o.items[4]
+        self.assertIs(ace1.srcaddr.items, ace2.dstaddr.items)
+        self.assertEqual([o.line for o in ace1.srcaddr.items], ["10.0.0.0 0.0.0.255"])
+
+        copy_ = ace1.copy()
+        self.assertIsNot(copy_.srcaddr.items, ace1.srcaddr.items)
+        ace1.platform = "nxos"
+        self.assertEqual([o.line for o in ace1.srcaddr.items], ["10.0.0.0/24"])
+        self.assertEqual([o.line for o in ace2.dstaddr.items], ["10.0.0.0 0.0.0.255"])
+        self.assertEqual([o.platform for o in ace2.dstaddr.items], ["ios"])
+
     def test_invalid__acls(self):
         """functions.acls()"""
         for kwargs, error in [
@@ -99,6 +133,46 @@ class Test(unittest.TestCase):
             with self.assertRaises(error, msg=f"{kwargs=}"):
                 f.acls(**kwargs)
 
+    def test_valid__acls_many(self):
+        """functions.acls_many()"""
+        items = [
+            ("cnx", CNX_ACL_EXT_CFG, dict(platform="nxos")),
+            ("ios", io.StringIO(IOS_ACL_EXT_CFG), None),
+            ("std", IOS_ACL_STD_CFG, dict(names=["typo"])),
+            ("wild", IOS_ACL_WILD_252, {}),  # max_ncwb
+            ("typo", IOS_ACL_STD_CFG, dict(platform="typo")),
+        ]
+        results = list(f.acls_many(items, max_workers=2, max_pending=1))
+        result_d = {o.device_id: o for o in results}
+        self.assertEqual(len(results), len(items))
+
+        for device_id, req_d in [("cnx", CNX_ACE_EXT_D), ("ios", IOS_ACE_EXT_D)]:
+            result = result_d[device_id]
+            self.assertEqual(result.error, "", msg=f"{device_id=}")
+            diff = list(dictdiffer.diff(first=result.acls[0].data(), second=req_d))
+            self.assertEqual(diff, [], msg=f"{device_id=}")
+        self.assertEqual(result_d["std"], f.DeviceAcls("std", [], ""))
+        for device_id, error in [("wild", "NetmaskValueError"), ("typo", "ValueError")]:
+            result = result_d[device_id]
+            self.assertEqual(result.acls, [], msg=f"{device_id=}")
+            self.assertTrue(result.error.startswith(f"{error}: "), msg=f"{device_id=}")
+
+    def test_valid__acls__pickle(self):
+        """Acl pickle"""
+        for kwargs in [
+            dict(config=CNX_ACL_EXT_CFG, platform="nxos", version="9.3"),
+            dict(config=IOS_ACL_EXT_CFG, platform="ios"),
+            dict(config=IOS_ACL_STD_CFG, platform="ios", group_by="=== "),
+        ]:
+            acls = f.acls(**kwargs)
+            reqs = [o.data(uuid=True) for o in acls]  # generated uuids are pickled
+            results = pickle.loads(pickle.dumps(acls))
+            for acl_o, result, req_d in zip(acls, results, reqs):
+                diff = list(dictdiffer.diff(first=result.data(uuid=True), second=req_d))
+                self.assertEqual(diff, [], msg=f"{kwargs=}")
+                self.assertEqual(result.line, acl_o.line, msg=f"{kwargs=}")
+                self.assertEqual(result.version, acl_o.version, msg=f"{kwargs=}")
+
     def test_valid__aces(self):
         """functions.aces()"""
         aces = f"{REMARK}\n{PERMIT_IP}\n{DENY_IP}"
@@ -118,6 +118,7 @@ CNX_ACE_EXT_D = dict(
     input=["interface Ethernet1/1"],
     output=[],
     group_by="",
+    lazy=False,
     note="",
     max_ncwb=16,
     indent="  ",
@@ -387,6 +388,7 @@ CNX_ACEG_EXT_D = dict(
                                   flags=[],
                                   logs=[]))],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
@@ -486,12 +488,14 @@ CNX_ACEG_EXT_D = dict(
                                   flags=[],
                                   logs=[]))],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
              sequence=0),
     ],
     group_by="=== ",
+    lazy=False,
     note="",
     max_ncwb=16,
     indent="  ",
@@ -517,6 +521,7 @@ IOS_ACE_EXT_D = dict(
     port_nr=False,
     name="ACL_NAME",
     group_by="",
+    lazy=False,
     items=[
         dict(line="remark === C-1",
              platform="ios",
@@ -781,6 +786,7 @@ IOS_ACEG_EXT_D = dict(
                       ),
              ],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
@@ -881,12 +887,14 @@ IOS_ACEG_EXT_D = dict(
                                   logs=[])),
              ],
              group_by="=== ",
+             lazy=False,
              note="",
              protocol_nr=False,
              port_nr=False,
              sequence=0),
     ],
     group_by="=== ",
+    lazy=False,
     note="",
     max_ncwb=16,
     indent="  ",
@@ -912,6 +920,7 @@ IOS_ACE_STD_D = dict(
     port_nr=False,
     name="ACL_NAME2",
     group_by="",
+    lazy=False,
     items=[
         dict(line="remark === C-11",
              platform="ios",
@@ -1084,6 +1093,7 @@ IOS_ACEG_STD_D = dict(
     port_nr=False,
     name="ACL_NAME2",
     group_by="=== ",
+    lazy=False,
     items=[
         dict(line="remark === C-11\npermit host 10.0.0.1",
              platform="ios",
@@ -1091,6 +1101,7 @@ IOS_ACEG_STD_D = dict(
              type="standard",
              name="=== C-11",
              group_by="=== ",
+             lazy=False,
              items=[
                  dict(line="remark === C-11",
                       platform="ios",
@@ -1177,6 +1188,7 @@ IOS_ACEG_STD_D = dict(
              type="standard",
              name="=== C-12",
              group_by="=== ",
+             lazy=False,
              items=[
                  dict(line="remark === C-12",
                       platform="ios",
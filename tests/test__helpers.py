@@ -443,6 +443,45 @@ class Test(unittest.TestCase):
             result = h.ports_to_string(items)
             self.assertEqual(result, req, msg=f"{items=}")
 
+    def test_valid__ports_to_ranges(self):
+        """helpers.ports_to_ranges()"""
+        for items, req in [
+            ([], ()),
+            ([1, 2], ((1, 2),)),
+            ([2, 1, 1], ((1, 2),)),
+            ([1, 3, 4, 5], ((1, 1), (3, 5))),
+            ([1, 2, 4, 6, 7], ((1, 2), (4, 4), (6, 7))),
+        ]:
+            result = h.ports_to_ranges(items)
+            self.assertEqual(result, req, msg=f"{items=}")
+
+    def test_valid__ranges_to_string(self):
+        """helpers.ranges_to_string()"""
+        for ranges, req in [
+            ((), ""),
+            (((1, 2),), "1-2"),
+            (((1, 1), (3, 5)), "1,3-5"),
+            (((1, 79), (81, 65535)), "1-79,81-65535"),
+        ]:
+            result = h.ranges_to_string(ranges)
+            self.assertEqual(result, req, msg=f"{ranges=}")
+
+    def test_valid__ranges_subset(self):
+        """helpers.ranges_subset()"""
+        for tops, bottoms, req in [
+            ((), (), True),
+            (((1, 5),), (), True),
+            ((), ((1, 1),), False),
+            (((1, 5),), ((1, 1), (3, 5)), True),
+            (((1, 5),), ((3, 6),), False),
+            (((1, 2), (4, 5)), ((1, 1), (4, 5)), True),
+            (((1, 2), (4, 5)), ((2, 4),), False),
+            (((1, 2), (4, 5)), ((3, 3),), False),
+            (((1, 2), (4, 5)), ((6, 6),), False),
+        ]:
+            result = h.ranges_subset(tops=tops, bottoms=bottoms)
+            self.assertEqual(result, req, msg=f"{tops=} {bottoms=}")
+
     def test_valid__string_to_ports(self):
         """helpers.string_to_ports()"""
         for line, req in [
@@ -0,0 +1,129 @@
+"""Unittest lazy_ace.py"""
+
+import pickle
+import unittest
+
+from cisco_acl import Ace, Acl, LazyAce, acls
+from cisco_acl.parse_cache import dumps
+
+CONFIG = """
+hostname HOSTNAME
+
+object-group network AG1
+  host 10.0.0.1
+  10.0.1.0 255.255.255.0
+
+ip access-list extended ACL1
+  10 remark === C-1
+  20 permit tcp object-group AG1 eq 1 2 any eq www
+  30 permit ip 10.0.0.0 0.0.0.255 host 10.0.0.2
+ip access-list standard ACL2
+  10 permit 10.0.0.0 0.0.0.255
+  20 deny any
+
+interface Ethernet1
+  ip access-group ACL1 in
+"""
+
+
+def _data_wo_lazy(data: dict) -> dict:
+    """Return Acl data without "lazy" in Acl and AceGroup items."""
+    data = {k: v for k, v in data.items() if k != "lazy"}
+    data["items"] = [_data_wo_lazy(d) if "lazy" in d else d for d in data["items"]]
+    return data
+
+
+class Test(unittest.TestCase):
+    """LazyAce"""
+
+    def test_valid__parse(self):
+        """LazyAce fields are parsed on the first access"""
+        for line, kwargs in [
+            ("10 permit tcp host 10.0.0.1 eq 179 10.0.0.0 0.0.0.3 eq 80 443 log", {}),
+            ("permit ip object-group NAME any", {}),
+            ("deny   10.0.0.0   0.0.0.255", {}),
+            ("10 permit tcp 10.0.0.1/32 eq 179 any", dict(platform="nxos")),
+            ("permit tcp any any eq 22", dict(port_nr=True, note="a")),
+        ]:
+            obj = LazyAce(line, **kwargs)
+            req = Ace(line, **kwargs)
+            self.assertFalse(obj.is_parsed, msg=f"{line=}")
+            self.assertEqual(obj.sequence, req.sequence, msg=f"{line=}")
+            self.assertEqual(obj.action, req.action, msg=f"{line=}")
+            self.assertFalse(obj.is_parsed, msg=f"{line=}")
+
+            self.assertEqual(obj.data(), req.data(), msg=f"{line=}")
+            self.assertTrue(obj.is_parsed, msg=f"{line=}")
+            self.assertEqual(obj, req, msg=f"{line=}")
+            self.assertEqual(req, obj, msg=f"{line=}")
+
+    def test_valid__sequence(self):
+        """LazyAce sequence changed before parsing"""
+        obj = LazyAce("10 permit ip any any")
+        obj.sequence = 20
+        self.assertEqual(obj.line, "20 permit ip any any")
+
+    def test_valid__copy(self):
+        """LazyAce.copy() pickle, the line is not parsed"""
+        obj = LazyAce("10 permit ip any host 10.0.0.1")
+        for obj_ in [
+            obj.copy(),
+            pickle.loads(pickle.dumps(obj)),
+            pickle.loads(dumps(obj)),
+        ]:
+            self.assertFalse(obj_.is_parsed)
+            self.assertEqual(obj_.dstaddr.line, "host 10.0.0.1")
+            self.assertFalse(obj.is_parsed)
+
+    def test_valid__has_addrgroup(self):
+        """LazyAce.has_addrgroup"""
+        for platform, line, req in [
+            ("ios", "permit ip object-group NAME any", True),
+            ("nxos", "permit ip any addrgroup NAME", True),
+            ("ios", "permit ip any any", False),
+        ]:
+            obj = LazyAce(line, platform=platform)
+            self.assertEqual(obj.has_addrgroup, req, msg=f"{line=}")
+            self.assertFalse(obj.is_parsed, msg=f"{line=}")
+            obj.line = obj.line
+            self.assertEqual(obj.has_addrgroup, req, msg=f"{line=}")
+
+    def test_invalid__parse(self):
+        """LazyAce invalid line"""
+        with self.assertRaises(ValueError):
+            LazyAce("remark text")
+        obj = LazyAce("permit ip any any eq 1")
+        with self.assertRaises(ValueError):
+            _ = obj.protocol
+        with self.assertRaises(ValueError):
+            _ = obj.line
+
+    def test_valid__acl(self):
+        """Acl(lazy=True) acls(lazy=True)"""
+        line = "ip access-list extended NAME\n  remark TEXT\n  10 permit ip any any"
+        obj = Acl(line, lazy=True)
+        self.assertTrue(obj.lazy)
+        self.assertIsInstance(obj.items[1], LazyAce)
+        obj.platform = "nxos"
+        obj.items = [*obj.items, "20 deny ip any any"]
+        self.assertIsInstance(obj.items[2], LazyAce)
+        self.assertEqual(obj.data()["lazy"], True)
+
+        for kwargs in [dict(), dict(group_by="=== ")]:
+            results = acls(CONFIG, lazy=True, **kwargs)
+            reqs = acls(CONFIG, **kwargs)
+            self.assertEqual(len(results[0].items), len(reqs[0].items), msg=f"{kwargs=}")
+            results_d = [_data_wo_lazy(o.data()) for o in results]
+            reqs_d = [_data_wo_lazy(o.data()) for o in reqs]
+            self.assertEqual(results_d, reqs_d, msg=f"{kwargs=}")
+
+        results = acls(CONFIG, lazy=True)
+        aces = results[0].items
+        self.assertEqual([o.is_parsed for o in aces[1:]], [True, False])
+        self.assertEqual(len(aces[1].srcaddr.items), 2)
+        self.assertEqual([o.is_parsed for o in results[1].items], [False, False])
+        self.assertEqual(results[1].items[0].type, "standard")
+
+
+if __name__ == "__main__":
+    unittest.main()
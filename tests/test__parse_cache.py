@@ -0,0 +1,176 @@
+"""Unittest parse_cache.py"""
+
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from cisco_acl import Acl, AddrGroup, ParseCache, acls, addrgroups
+from cisco_acl import functions, parse_cache
+
+CONFIG = """
+hostname HOSTNAME
+
+object-group network AG1
+  host 10.0.0.1
+  10.0.1.0 255.255.255.0
+
+ip access-list extended ACL1
+  permit ip object-group AG1 any
+ip access-list extended ACL2
+  remark === C-1
+  permit tcp any any eq 22
+  deny ip any any
+
+interface Ethernet1
+  ip access-group ACL1 in
+  ip access-group ACL2 out
+"""
+
+
+class Test(unittest.TestCase):
+    """ParseCache"""
+
+    def setUp(self):
+        """Temporary cache directory."""
+        self._tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = Path(self._tmp.name)
+
+    def tearDown(self):
+        """Delete cache directory."""
+        self._tmp.cleanup()
+
+    def test_valid__create(self):
+        """ParseCache.create()"""
+        with ParseCache(self.path) as cache:
+            acl1 = cache.create(Acl, line="ip access-list extended NAME\n  permit ip any any")
+            acl2 = cache.create(Acl, line="ip access-list extended NAME\n  permit ip any any")
+            self.assertIsNot(acl1, acl2)
+            self.assertEqual(acl1.data(), acl2.data())
+            self.assertNotEqual(acl1.uuid, acl2.uuid)
+            self.assertNotEqual(acl1.items[0].uuid, acl2.items[0].uuid)
+            self.assertEqual(str(acl2.version), "0")
+
+            result = cache.stats()
+            req = dict(hits=1, misses=1, entries=1, bytes=result["bytes"],
+                       max_bytes=parse_cache.DEF_MAX_BYTES)
+            self.assertEqual(result, req)
+
+    def test_valid__acls(self):
+        """acls(cache=) addrgroups(cache=)"""
+        for cache in [self.path, str(self.path), ParseCache(self.path)]:
+            for _ in range(2):
+                results = [o.data() for o in acls(CONFIG, group_by="=== ", cache=cache)]
+                reqs = [o.data() for o in acls(CONFIG, group_by="=== ")]
+                self.assertEqual(results, reqs, msg=f"{cache=}")
+                results = [o.data() for o in addrgroups(CONFIG, cache=cache)]
+                reqs = [o.data() for o in addrgroups(CONFIG)]
+                self.assertEqual(results, reqs, msg=f"{cache=}")
+
+        # interfaces are not the key of the cache
+        cache = ParseCache(self.path)
+        config = CONFIG.replace("ACL2 out", "ACL2 in")
+        results = [(o.name, o.input, o.output) for o in acls(config, cache=cache)]
+        reqs = [(o.name, o.input, o.output) for o in acls(config)]
+        self.assertEqual(results, reqs)
+        self.assertEqual(results[0], ("ACL1", ["interface Ethernet1"], []))
+        self.assertEqual(cache.stats()["misses"], 0)
+
+    def test_valid__init_cache(self):
+        """functions._init_cache() closes only ParseCache created from the path"""
+        for path in [self.path, str(self.path)]:
+            # noinspection PyProtectedMember
+            with functions._init_cache(path) as cache:
+                cache.get("key")
+                self.assertIsNotNone(cache._conn, msg=f"{path=}")
+            self.assertIsNone(cache._conn, msg=f"{path=}")
+
+        with ParseCache(self.path) as cache_:
+            # noinspection PyProtectedMember
+            with functions._init_cache(cache_) as cache:
+                cache.get("key")
+            self.assertIs(cache, cache_)
+            self.assertIsNotNone(cache_._conn)
+            acls(CONFIG, cache=cache_)
+            addrgroups(CONFIG, cache=cache_)
+            self.assertIsNotNone(cache_._conn)
+
+    def test_invalid__acls(self):
+        """acls(cache=)"""
+        with self.assertRaises(TypeError):
+            acls(CONFIG, cache=1)
+
+    def test_valid__version(self):
+        """ParseCache version stamp"""
+        line = "object-group network NAME\n  host 10.0.0.1"
+        with ParseCache(self.path) as cache:
+            cache.create(AddrGroup, line=line)
+        cache_version = parse_cache.CACHE_VERSION
+        try:
+            parse_cache.CACHE_VERSION += 1
+            with ParseCache(self.path) as cache:
+                self.assertEqual(cache.stats()["entries"], 0)
+                cache.create(AddrGroup, line=line)
+                self.assertEqual(cache.stats()["misses"], 1)
+        finally:
+            parse_cache.CACHE_VERSION = cache_version
+
+    def test_valid__evict(self):
+        """ParseCache LRU eviction"""
+        lines = [f"object-group network NAME{i}\n  host 10.0.0.{i}" for i in range(4)]
+        with ParseCache(self.path) as cache:
+            cache.create(AddrGroup, line=lines[0])
+            size = cache.stats()["bytes"]
+        with ParseCache(self.path, max_bytes=int(size * 2.5)) as cache:
+            cache.create(AddrGroup, line=lines[1])
+            cache.create(AddrGroup, line=lines[0])  # hit, NAME1 is the least recently used
+            cache.create(AddrGroup, line=lines[2])
+            self.assertEqual(cache.stats()["entries"], 2)
+            cache.create(AddrGroup, line=lines[0])
+            cache.create(AddrGroup, line=lines[2])
+            cache.create(AddrGroup, line=lines[1])
+            self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+    def test_valid__size(self):
+        """ParseCache running total of the entries size"""
+        lines = [f"object-group network NAME{i}\n  host 10.0.0.{i}" for i in range(3)]
+
+        def sum_size(cache_: ParseCache) -> int:
+            # noinspection PyProtectedMember
+            conn = cache_._connect()
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+        with ParseCache(self.path) as cache:
+            for line in lines:
+                cache.create(AddrGroup, line=line)
+            cache.set("key", "value")
+            cache.set("key", "other value")  # replace
+            self.assertEqual(cache._size(), sum_size(cache))
+            self.assertEqual(cache.stats()["entries"], 4)
+
+            # noinspection PyProtectedMember
+            cache._connect().execute("DELETE FROM meta WHERE name = 'size'")
+        with ParseCache(self.path) as cache:
+            self.assertEqual(cache._size(), sum_size(cache))
+            cache.clear()
+            self.assertEqual(cache._size(), 0)
+
+    def test_invalid__init(self):
+        """ParseCache.__init__()"""
+        with self.assertRaises(ValueError):
+            ParseCache(self.path, max_bytes=0)
+
+    def test_valid__pickle(self):
+        """ParseCache pickle"""
+        cache = ParseCache(self.path, max_bytes=1000)
+        cache.create(AddrGroup, line="object-group network NAME\n  host 10.0.0.1")
+        cache_ = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(repr(cache_), repr(cache))
+        cache_.create(AddrGroup, line="object-group network NAME\n  host 10.0.0.1")
+        self.assertEqual((cache_.hits, cache_.misses), (1, 0))
+        cache.close()
+        cache_.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
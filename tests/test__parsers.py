@@ -84,6 +84,29 @@ class Test(unittest.TestCase):
                 req = req_d[key]
                 self.assertEqual(result, req, msg=f"{line=} {key=}")
 
+    def test_valid__parse_ace_extended__edge(self):
+        """helpers.parse_ace_extended() tokenizer and regex return the same result"""
+        base = dict(sequence="", action="permit", protocol="ip", srcaddr="any",
+                    srcport="", dstaddr="any", dstport="", option="")
+        for line, req_d in [
+            ("permit ip any anyx", {}),
+            ("permit ip any host 1.1.1.1x eq 1", dict(dstaddr="host 1.1.1.1")),
+            ("permit ip 1.1.1.1 0.0.0.255 10.0.0.0/24x log",
+             dict(srcaddr="1.1.1.1 0.0.0.255", dstaddr="10.0.0.0/24")),
+            ("10permit ip any any", dict(sequence="10")),
+            ("deny any any", dict(action="deny", protocol="")),
+            ("permit icmp any any anything", dict(protocol="icmp", srcport="any")),
+            ("permit tcp any eq 1 2 any eq 3 log",
+             dict(protocol="tcp", srcport="eq 1 2", dstport="eq 3", option="log")),
+        ]:
+            req_d = {**base, **req_d}
+            result = parsers.parse_ace_extended(line)
+            diff = list(dictdiffer.diff(first=result, second=req_d))
+            self.assertEqual(diff, [], msg=f"{line=}")
+            regex = parsers._regex_items(parsers.RE_ACE_EXTENDED, line)
+            tokens = parsers._tokenize_ace_extended(line.split())
+            self.assertEqual(tokens, regex, msg=f"{line=}")
+
     def test_invalid__parse_ace_extended(self):
         """helpers.parse_ace_extended()"""
         for line, req in [
@@ -93,6 +116,10 @@ class Test(unittest.TestCase):
             ("10 permit host 10.0.0.1", {}),
             ("10 permit ip", {}),
             ("10 remark permit ip any any", {}),
+            ("permit  ip any any", {}),
+            ("permit\tip any any", {}),
+            ("10 5permit ip any any", {}),
+            ("permitx ip any any", {}),
         ]:
             result = parsers.parse_ace_extended(line)
             self.assertEqual(result, req, msg=f"{line=}")
@@ -106,6 +133,9 @@ class Test(unittest.TestCase):
             (f"permit {ht.WILD30} log", dict(srcaddr=ht.WILD30, option="log")),
             (f"10 permit {ht.HOST}", dict(sequence="10", srcaddr=ht.HOST)),
             (f"10 permit {ht.WILD30} log", dict(sequence="10", srcaddr=ht.WILD30, option="log")),
+            ("permit anyx", dict(srcaddr="any")),
+            ("permit 1.1.1.1x log", dict(srcaddr="1.1.1.1")),
+            ("permit 1.1.1.1 log", dict(srcaddr="1.1.1.1", option="log")),
         ]:
             req_d = {**base, **req_d}
             result = parsers.parse_ace_standard(line)
@@ -119,6 +149,7 @@ class Test(unittest.TestCase):
             ("remark permit ip any any", {}),
             ("10 permit ip", {}),
             ("10 remark permit ip any any", {}),
+            ("permit\tany log", {}),
         ]:
             result = parsers.parse_ace_standard(line)
             self.assertEqual(result, req, msg=f"{line=}")
@@ -56,12 +56,14 @@ EQ_RSH_D = dict(line="eq rsh", operator="eq", items=[514], ports=[514], sport="5
 EQ_SYSL_D = dict(line="eq syslog", operator="eq", items=[514], ports=[514], sport="514")
 
 NEQ1_D = dict(line="neq 1", operator="neq", items=[1], ports=WO_1, sport="2-65535")
-NEQ13_D = dict(line="neq 1 3", operator="neq", items=[1, 3], ports=WO_13, sport="2,4-65535")
+NEQ13_D = dict(line="neq 1 3", operator="neq", items=[1, 3], ports=WO_13,
+               ranges=((2, 2), (4, 65535)), sport="2,4-65535")
 GT_D = dict(line="gt 65532", operator="gt", items=[65532], ports=GT_65532, sport="65533-65535")
 GT1_D = dict(line="gt 1", operator="gt", items=[1], ports=WO_1, sport="2-65535")
 LT1_D = dict(line="lt 1", operator="lt", items=[1], ports=[], sport="")
 LT3_D = dict(line="lt 3", operator="lt", items=[3], ports=[1, 2], sport="1-2")
-R24_D = dict(line="range 2 4", operator="range", items=[2, 4], ports=[2, 3, 4], sport="2-4")
+R24_D = dict(line="range 2 4", operator="range", items=[2, 4], ports=[2, 3, 4], ranges=((2, 4),),
+             sport="2-4")
 R_21_23_D = dict(line=R_21_23, operator="range", items=[21, 23], ports=[21, 22, 23], sport="21-23")
 R_FTP_T_D = dict(line=R_FTP_T, operator="range", items=[21, 23], ports=[21, 22, 23], sport="21-23")
 
@@ -72,6 +74,38 @@ class Test(Helpers):
 
     # ========================== redefined ===========================
 
+    def test_valid__contains__(self):
+        """Port.__contains__()"""
+        for line, other, req in [
+            ("", 1, False),
+            (EQ13, 1, True),
+            (EQ13, 2, False),
+            (NEQ1, 1, False),
+            (NEQ1, 65535, True),
+            (GT, 65532, False),
+            (GT, 65533, True),
+            (LT1, 1, False),
+            (R13, 3, True),
+            (R13, Port(EQ12), True),
+            (R13, Port(EQ2456), False),
+            (R13, Port(""), False),
+            (NEQ2, Port(EQ13), True),
+            (NEQ2, Port(R13), False),
+        ]:
+            obj = Port(line, protocol="tcp")
+            result = other in obj
+            self.assertEqual(result, req, msg=f"{line=} {other=}")
+
+    def test_invalid__contains__(self):
+        """Port.__contains__()"""
+        for other, error in [
+            ("1", TypeError),
+            ([1], TypeError),
+        ]:
+            obj = Port(EQ1)
+            with self.assertRaises(error, msg=f"{other=}"):
+                _ = other in obj
+
     def test_valid__hash__(self):
         """Port.__hash__()"""
         line = "eq 1"
@@ -628,6 +662,24 @@ class Test(Helpers):
             result = obj._items_to_ports(items)
             self.assertEqual(result, req, msg=f"{items=}")
 
+    def test_valid__items_to_ranges(self):
+        """Port._items_to_ranges()"""
+        for line, items, req in [
+            ("eq 1", [1, 3], ((1, 1), (3, 3))),
+            ("eq 1", [1, 2, 3], ((1, 3),)),
+            ("neq 1", [1], ((2, 65535),)),
+            ("neq 1", [1, 3], ((2, 2), (4, 65535))),
+            ("neq 1", [65535], ((1, 65534),)),
+            ("gt 1", [1], ((2, 65535),)),
+            ("gt 1", [65535], ()),
+            ("lt 1", [3], ((1, 2),)),
+            ("lt 1", [1], ()),
+            ("range 1 2", [2, 4], ((2, 4),)),
+        ]:
+            obj = Port(line)
+            result = obj._items_to_ranges(items)
+            self.assertEqual(result, req, msg=f"{items=}")
+
     def test_valid__ports_to_items(self):
         """Port._ports_to_items()"""
         for line, items, req in [
@@ -0,0 +1,70 @@
+"""Unittest prefix_trie.py"""
+
+import random
+import unittest
+
+from cisco_acl import wildcard as wc
+from cisco_acl.prefix_trie import PrefixTrie
+
+
+def _random_wildcard(rand: random.Random) -> tuple:
+    """Return random (prefix, wildcard mask) in 10.0.0.0/22, 1 of 4 is non-contiguous."""
+    wildmask = (1 << rand.randrange(11)) - 1
+    if not rand.randrange(4):
+        wildmask |= 1 << rand.randrange(8, 10)
+    prefix = 0x0A000000 | rand.getrandbits(10)
+    return prefix & ~wildmask, wildmask
+
+
+class Test(unittest.TestCase):
+    """PrefixTrie"""
+
+    def test_valid__covering(self):
+        """PrefixTrie.covering() overlapping() and linear comparison return the same"""
+        rand = random.Random(0)
+        for _ in range(100):
+            wildcards = [_random_wildcard(rand) for _ in range(rand.randrange(30))]
+            trie = PrefixTrie()
+            for idx, wildcard in enumerate(wildcards):
+                trie.insert(wildcard, idx)
+            self.assertEqual(len(trie), len(wildcards))
+
+            for _ in range(20):
+                wildcard = _random_wildcard(rand)
+                req = [i for i, o in enumerate(wildcards) if wc.is_subset(wildcard, o)]
+                result = sorted(trie.covering(wildcard))
+                self.assertEqual(result, req, msg=f"{wildcards=} {wildcard=}")
+
+                req = [i for i, o in enumerate(wildcards) if wc.is_overlap(wildcard, o)]
+                result = sorted(trie.overlapping(wildcard))
+                self.assertEqual(result, req, msg=f"{wildcards=} {wildcard=}")
+
+    def test_valid__order(self):
+        """PrefixTrie.covering() overlapping() order of values"""
+        trie = PrefixTrie()
+        for wildcard, value in [
+            ((0x0A000000, 0x3), "/30"),
+            ((0x0A000000, 0x103), "nc"),
+            ((0x0A000000, 0xFF), "/24"),
+            ((0x0A000004, 0x3), "/30_4"),
+            ((0, 0xFFFFFFFF), "/0"),
+            ((0x0A000000, 0xFF), "/24_2"),
+        ]:
+            trie.insert(wildcard, value)
+        self.assertEqual(repr(trie), "PrefixTrie(count=5, nc=1)")
+
+        for wildcard, req_covering, req_overlapping in [
+            ((0x0A000001, 0), ["/0", "/24", "/24_2", "/30", "nc"],
+             ["/0", "/24", "/24_2", "/30", "nc"]),
+            ((0x0A000000, 0xFF), ["/0", "/24", "/24_2"],
+             ["/0", "/24", "/24_2", "/30", "/30_4", "nc"]),
+            ((0x0B000000, 0xFF), ["/0"], ["/0"]),
+        ]:
+            result = trie.covering(wildcard)
+            self.assertEqual(result, req_covering, msg=f"{wildcard=}")
+            result = trie.overlapping(wildcard)
+            self.assertEqual(result, req_overlapping, msg=f"{wildcard=}")
+
+
+if __name__ == "__main__":
+    unittest.main()
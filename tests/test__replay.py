@@ -0,0 +1,209 @@
+"""Unittest replay.py"""
+
+import io
+import random
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from cisco_acl import Acl, Address
+from cisco_acl import replay
+from cisco_acl.replay import AceHits, Flow, HitCounter
+from tests.helpers_test import ACL_NAME_IOS
+from tests.test__classifier import _generate_aces
+
+ACL1 = f"{ACL_NAME_IOS}\nremark TEXT\n" \
+       "10 permit tcp host 10.0.0.1 any eq 22\n" \
+       "20 permit tcp any any established\n" \
+       "30 permit udp any any eq 53\n" \
+       "40 deny ip 10.0.0.0 0.0.0.255 any fragments\n" \
+       "50 permit icmp any any"
+ACL2 = "ip access-list standard NAME2\n  permit 10.0.0.0 0.0.0.3"
+A1 = 0x0A000001
+A2 = 0x0A000002
+A9 = 0x0A000009
+
+
+def _ipv4(src: int, dst: int, protocol: int, payload: bytes, frag: int = 0) -> bytes:
+    """Return IPv4 packet."""
+    header = struct.pack(">BBHHHBBHII", 0x45, 0, 20 + len(payload), 0, frag, 64, protocol, 0,
+                         src, dst)
+    return header + payload
+
+
+def _tcp(sport: int, dport: int, flags: int) -> bytes:
+    """Return TCP header."""
+    return struct.pack(">HHIIBBHHH", sport, dport, 0, 0, 0x50, flags, 0, 0, 0)
+
+
+def _udp(sport: int, dport: int) -> bytes:
+    """Return UDP header."""
+    return struct.pack(">HHHH", sport, dport, 8, 0)
+
+
+def _pcap(packets: list, linktype: int = 1, endian: str = "<") -> bytes:
+    """Return classic pcap file."""
+    data = struct.pack(f"{endian}IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, linktype)
+    for packet in packets:
+        data += struct.pack(f"{endian}IIII", 0, 0, len(packet), len(packet)) + packet
+    return data
+
+
+class Test(unittest.TestCase):
+    """replay"""
+
+    def test_valid__hit_counter(self):
+        """HitCounter.update() hits() never_hit()"""
+        acl1 = Acl(ACL1, group_by="TEXT")
+        acl2 = Acl(ACL2)
+        counter = HitCounter([acl1, acl2])
+        counter.update([
+            Flow(A1, A2, 6, 1024, 22),
+            Flow(A2, A1, 6, 22, 1024, frozenset(["ack"]), count=3),
+            Flow(A9, A2, 17, 1024, 53),
+            Flow(0x0B000001, A2, 17, 1024, 54),
+        ])
+        result = counter.hits()
+        req = [
+            AceHits("NAME", 0, 10, "10 permit tcp host 10.0.0.1 any eq 22", 1),
+            AceHits("NAME", 1, 20, "20 permit tcp any any established", 3),
+            AceHits("NAME", 2, 30, "30 permit udp any any eq domain", 1),
+            AceHits("NAME", 3, 40, "40 deny ip 10.0.0.0 0.0.0.255 any fragments", 0),
+            AceHits("NAME", 4, 50, "50 permit icmp any any", 0),
+            AceHits("NAME", -1, 0, "deny ip any any", 1),
+            AceHits("NAME2", 0, 0, "permit 10.0.0.0 0.0.0.3", 4),
+            AceHits("NAME2", -1, 0, "deny any", 2),
+        ]
+        self.assertEqual(result, req)
+        self.assertEqual(counter.flows, 4)
+        for acl_o, hits in [(acl1, result[5]), (acl2, result[7])]:
+            self.assertEqual(acl_o.match(0x0B000001, A2, 17).line, hits.line, msg=f"{acl_o.name}")
+        self.assertEqual([o.sequence for o in counter.never_hit()], [40, 50])
+
+        counter.merge(counter.count([Flow(A1, A2, 1)]), flows=1)
+        self.assertEqual([o.sequence for o in counter.never_hit()], [40])
+        self.assertEqual(counter.flows, 5)
+
+    def test_invalid__hit_counter(self):
+        """HitCounter.__init__()"""
+        for acls, error in [
+            ([ACL1], TypeError),
+            ([None], TypeError),
+        ]:
+            with self.assertRaises(error, msg=f"{acls=}"):
+                HitCounter(acls)
+
+    def test_valid__replay(self):
+        """replay() in current process and in worker processes return the same hits"""
+        acl_o = Acl(ACL_NAME_IOS, items=_generate_aces(count=100, seed=0))
+        for ace_o in acl_o.items:
+            for addr_o in [ace_o.srcaddr, ace_o.dstaddr]:
+                if addr_o.type == "addrgroup":
+                    addr_o.items = [Address("10.0.0.0 0.0.0.1")]
+        rand = random.Random(0)
+        flows = [Flow(0x0A000000 | rand.getrandbits(3), 0x0A000000 | rand.getrandbits(3),
+                      rand.choice([1, 6, 17]), rand.randrange(5), rand.randrange(5),
+                      frozenset(rand.choice([[], ["ack"], ["syn"]])))
+                 for _ in range(1000)]
+        chunks = [flows[i:i + 100] for i in range(0, len(flows), 100)]
+
+        req = []
+        for flow in flows:
+            ace_o = acl_o.match(*flow[:5], flags=flow.flags)
+            req.append(next((i for i, o in enumerate(acl_o.items) if o is ace_o), -1))
+        req_hits = [req.count(i) for i in range(len(acl_o.items))]
+
+        for max_workers in [0, 2]:
+            counter = replay.replay([acl_o], chunks, max_workers=max_workers, max_pending=1)
+            result = [o.hits for o in counter.hits()[:-1]]
+            self.assertEqual(result, req_hits, msg=f"{max_workers=}")
+            self.assertEqual(counter.flows, 1000, msg=f"{max_workers=}")
+            self.assertEqual(counter.hits()[-1].hits, req.count(-1), msg=f"{max_workers=}")
+
+    def test_valid__read_csv(self):
+        """replay.read_csv()"""
+        text = "protocol,src,dst,sport,dport,flags,count\n" \
+               "tcp,10.0.0.1,10.0.0.2,1024,22,ack syn,3\n" \
+               "\n" \
+               "17,167772161,10.0.0.2,,,,\n" \
+               "icmp,10.0.0.1,10.0.0.2\n"
+        result = list(replay.read_csv(io.StringIO(text), chunk_size=2))
+        req = [
+            [Flow(A1, A2, 6, 1024, 22, frozenset(["ack", "syn"]), 3), Flow(A1, A2, 17)],
+            [Flow(A1, A2, 1)],
+        ]
+        self.assertEqual(result, req)
+
+        text = "a,b,p\n10.0.0.1,10.0.0.2,www\n"
+        columns = {"src": "a", "dst": "b", "protocol": "p"}
+        with self.assertRaises(ValueError, msg="port name in protocol"):
+            list(replay.read_csv(io.StringIO(text), columns=columns))
+        text = "a,b,p\n10.0.0.1,10.0.0.2,6\n"
+        result = list(replay.read_csv(io.StringIO(text), columns=columns))
+        self.assertEqual(result, [[Flow(A1, A2, 6)]])
+
+        with tempfile.TemporaryDirectory() as path:
+            file = Path(path, "flows.csv")
+            file.write_text(text)
+            result = list(replay.read_csv(file, columns=columns))
+            self.assertEqual(result, [[Flow(A1, A2, 6)]])
+        self.assertEqual(list(replay.read_csv(io.StringIO(""))), [])
+
+    def test_invalid__read_csv(self):
+        """replay.read_csv()"""
+        for text, error in [
+            ("src,dst\n10.0.0.1,10.0.0.2\n", ValueError),
+            ("src,dst,protocol\n10.0.0.1,10.0.0.2,typo\n", ValueError),
+            ("src,dst,protocol\n10.0.0.256,10.0.0.2,tcp\n", ValueError),
+            ("src,dst,protocol,sport\n10.0.0.1,10.0.0.2,tcp,a\n", ValueError),
+            ("src,dst,protocol\n10.0.0.1,10.0.0.2\n", ValueError),
+            ("src,dst,protocol,sport,dport\n99999999999,10.0.0.2,tcp,1,2\n", ValueError),
+            ("src,dst,protocol,sport,dport\n10.0.0.1,4294967296,tcp,1,2\n", ValueError),
+            ("src,dst,protocol,sport,dport\n10.0.0.1,10.0.0.2,tcp,1,70000\n", ValueError),
+            ("src,dst,protocol,sport,dport\n10.0.0.1,10.0.0.2,tcp,-1,2\n", ValueError),
+        ]:
+            with self.assertRaises(error, msg=f"{text=}"):
+                list(replay.read_csv(io.StringIO(text)))
+        with self.assertRaises(TypeError):
+            list(replay.read_csv(1))
+
+    def test_valid__read_pcap(self):
+        """replay.read_pcap()"""
+        tcp_ = _ipv4(A1, A2, 6, _tcp(1024, 22, 0x12))
+        udp_ = _ipv4(A1, A2, 17, _udp(1024, 53))
+        frag_ = _ipv4(A1, A2, 17, b"\x00" * 8, frag=100)
+        icmp_ = _ipv4(A1, A2, 1, b"\x08\x00")
+        eth_ = b"\x00" * 12
+        ipv6_ = eth_ + b"\x86\xdd" + b"\x00" * 40
+        tcp_flow = Flow(A1, A2, 6, 1024, 22, frozenset(["ack", "syn"]))
+        udp_flow = Flow(A1, A2, 17, 1024, 53)
+        frag_flow = Flow(A1, A2, 17, flags=frozenset(["fragments"]))
+        icmp_flow = Flow(A1, A2, 1)
+
+        for data, req in [
+            (_pcap([eth_ + b"\x08\x00" + tcp_, ipv6_, eth_ + b"\x08\x00" + udp_]),
+             [[tcp_flow, udp_flow]]),
+            (_pcap([eth_ + b"\x81\x00\x00\x0a\x08\x00" + frag_], endian=">"), [[frag_flow]]),
+            (_pcap([tcp_, icmp_, udp_], linktype=101), [[tcp_flow, icmp_flow], [udp_flow]]),
+            (_pcap([b"\x00" * 14 + b"\x08\x00" + icmp_], linktype=113), [[icmp_flow]]),
+            (_pcap([tcp_[:22]], linktype=101), [[Flow(A1, A2, 6)]]),
+            (_pcap([]), []),
+            (_pcap([tcp_], linktype=101)[:-3], []),
+        ]:
+            result = list(replay.read_pcap(io.BytesIO(data), chunk_size=2))
+            self.assertEqual(result, req, msg=f"{data=}")
+
+    def test_invalid__read_pcap(self):
+        """replay.read_pcap()"""
+        for data, error in [
+            (b"", ValueError),
+            (b"\x0a\x0d\x0d\x0a" + b"\x00" * 20, ValueError),
+            (_pcap([], linktype=105), ValueError),
+        ]:
+            with self.assertRaises(error, msg=f"{data=}"):
+                list(replay.read_pcap(io.BytesIO(data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
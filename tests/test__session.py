@@ -0,0 +1,81 @@
+"""Unittest session.py"""
+
+import unittest
+
+from cisco_acl import AclSession, acls
+from cisco_acl.session import AclChanges
+
+CONFIG = """
+hostname HOSTNAME
+
+object-group network AG1
+  host 10.0.0.1
+object-group network AG2
+  host 10.0.0.2
+
+ip access-list extended ACL1
+  permit ip object-group AG1 any
+ip access-list extended ACL2
+  permit ip object-group AG2 any
+ip access-list extended ACL3
+  remark === C-1
+  permit tcp any any eq 22
+
+interface Ethernet1
+  ip access-group ACL1 in
+interface Ethernet2
+  ip access-group ACL2 out
+"""
+
+
+class Test(unittest.TestCase):
+    """AclSession"""
+
+    def test_valid__update(self):
+        """AclSession.update()"""
+        session = AclSession(group_by="=== ")
+        result = session.update(CONFIG)
+        self.assertEqual(result, AclChanges(["ACL1", "ACL2", "ACL3"], [], []))
+        self.assertEqual([o.name for o in session.addrgroups], ["AG1", "AG2"])
+
+        for config, req, req_kept in [
+            # not changed
+            (CONFIG, AclChanges([], [], []), ["ACL1", "ACL2", "ACL3"]),
+            # ACL
+            (CONFIG.replace("eq 22", "eq 23"), AclChanges([], ["ACL3"], []), ["ACL1", "ACL2"]),
+            # address group
+            (CONFIG.replace("host 10.0.0.2", "host 10.0.0.3"), AclChanges([], ["ACL2"], []),
+             ["ACL1", "ACL3"]),
+            # interface
+            (CONFIG.replace("ACL2 out", "ACL2 in"), AclChanges([], ["ACL2"], []),
+             ["ACL1", "ACL2", "ACL3"]),
+            # added, removed
+            (CONFIG.replace("ACL3", "ACL4"), AclChanges(["ACL4"], [], ["ACL3"]), ["ACL1", "ACL2"]),
+        ]:
+            session.update(CONFIG)
+            acls_before = {o.name: o for o in session.acls}
+            result = session.update(config)
+            self.assertEqual(result, req, msg=f"{config=}")
+            acls_after = {o.name: o for o in session.acls}
+            result = [s for s, o in acls_after.items() if acls_before.get(s) is o]
+            self.assertEqual(result, req_kept, msg=f"{config=}")
+
+            results = [o.data() for o in session.acls]
+            reqs = [o.data() for o in acls(config, group_by="=== ")]
+            self.assertEqual(results, reqs, msg=f"{config=}")
+
+    def test_valid__update__addrgroup_added(self):
+        """AclSession.update() ACL is parsed again when address group is added"""
+        config = CONFIG.replace("object-group network AG2", "object-group network AG3")
+        session = AclSession()
+        session.update(config)
+        self.assertEqual(session.acls[1].items[0].srcaddr.items, [])
+
+        result = session.update(CONFIG)
+        self.assertEqual(result, AclChanges([], ["ACL2"], []))
+        result = [o.line for o in session.acls[1].items[0].srcaddr.items]
+        self.assertEqual(result, ["host 10.0.0.2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
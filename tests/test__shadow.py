@@ -0,0 +1,116 @@
+"""Unittest shadow.py"""
+
+import random
+import unittest
+
+from cisco_acl import Acl, Ace, Address
+from cisco_acl import shadow
+from tests.helpers_test import ACL_NAME_IOS, PERMIT_IP, WILD_NC3
+
+
+def _generate_aces(count: int, seed: int) -> list:
+    """Return random ACE lines with a lot of overlapping."""
+    rand = random.Random(seed)
+    actions = ["permit", "permit", "deny"]
+    protocols = ["ip", "tcp", "tcp", "udp", "icmp"]
+    addrs = ["any", "10.0.0.0 0.255.255.255", "10.0.0.0 0.0.0.255", "10.0.0.0 0.0.0.3",
+             "10.0.1.0 0.0.0.255", "10.0.0.0 0.0.1.3", "10.0.0.0 0.0.2.255", "object-group NAME"]
+    ports = ["", "eq 1", "eq 1 2", "range 1 3", "gt 2", "lt 3", "neq 2"]
+    options = ["", "", "log", "ack"]
+    lines = []
+    for _ in range(count):
+        protocol = rand.choice(protocols)
+        srcport = dstport = ""
+        if protocol in ["tcp", "udp"]:
+            srcport = rand.choice(ports)
+            dstport = rand.choice(ports)
+        option = rand.choice(options) if protocol == "tcp" else ""
+        if rand.random() < 0.3:
+            srcaddr = f"host 10.0.0.{rand.randrange(8)}"
+        else:
+            srcaddr = rand.choice(addrs)
+        items = [rand.choice(actions), protocol, srcaddr, srcport, rand.choice(addrs), dstport,
+                 option]
+        lines.append(" ".join(s for s in items if s))
+    return lines
+
+
+def _make_acl(lines: list) -> Acl:
+    """Return Acl with address group items."""
+    acl_o = Acl(ACL_NAME_IOS, max_ncwb=16)
+    acl_o.items = lines
+    for ace_o in acl_o.items:
+        for addr_o in [ace_o.srcaddr, ace_o.dstaddr]:
+            if addr_o.type == "addrgroup":
+                addr_o.items = [Address("10.0.0.0 0.0.0.1"), Address("host 10.0.0.4")]
+    return acl_o
+
+
+class Test(unittest.TestCase):
+    """Shadow detection engines."""
+
+    def test_valid__shading(self):
+        """shadow.shading() engines return identical result."""
+        for seed in range(5):
+            lines = _generate_aces(count=40, seed=seed)
+            acl_o = _make_acl(lines)
+            aces = acl_o.items
+            for skip in [None, ["addrgroup"], ["nc_wildcard"]]:
+                req = shadow.shading(aces=aces, skip=skip, engine="pairwise")
+                result = shadow.shading(aces=aces, skip=skip, engine="index")
+                self.assertEqual(list(result.items()), list(req.items()), msg=f"{seed=} {skip=}")
+
+    def test_valid__shading__duplicates(self):
+        """shadow.shading() duplicate lines in the top and in the bottom."""
+        lines = ["permit ip 10.0.0.0/24 any",
+                 "permit ip host 10.0.0.1 any",
+                 "permit ip 10.0.0.0/8 any",
+                 "permit ip host 10.0.0.1 any",
+                 "permit ip 10.0.0.0/24 any",
+                 "permit ip host 10.0.0.1 any"]
+        aces = [Ace(s, platform="nxos") for s in lines]
+        req = shadow.shading_pairwise(aces=aces)
+        result = shadow.shading_index(aces=aces)
+        self.assertEqual(list(result.items()), list(req.items()))
+
+    def test_valid__candidates(self):
+        """ShadowIndex.candidates()"""
+        lines = [PERMIT_IP,
+                 "permit tcp 10.0.0.0/24 any",
+                 "permit udp 10.0.0.0/24 any",
+                 f"permit tcp {WILD_NC3} any",
+                 "deny tcp 10.0.0.0/24 any",
+                 "permit tcp 10.0.1.0/24 any",
+                 "permit tcp host 10.0.0.1 any"]
+        aces = [Ace(s) for s in lines]
+        index = shadow.ShadowIndex(aces)
+        for idx, req in [
+            (0, []),
+            (1, [0]),
+            (6, [0, 1, 3]),
+        ]:
+            result = index.candidates(idx)
+            self.assertEqual(result, req, msg=f"{idx=}")
+
+    def test_valid__candidates__addrgroup(self):
+        """ShadowIndex.candidates() address group in the top."""
+        ace1 = Ace("permit ip addrgroup NAME any", platform="nxos")
+        ace1.srcaddr.items = [Address("10.0.0.0/24", platform="nxos")]
+        ace2 = Ace("permit ip host 10.0.0.1 any", platform="nxos")
+        ace3 = Ace("permit ip host 10.0.1.1 any", platform="nxos")
+        index = shadow.ShadowIndex([ace1, ace2, ace3])
+        self.assertEqual(index.candidates(1), [0])
+        self.assertEqual(index.candidates(2), [])
+
+    def test_invalid__shading(self):
+        """shadow.shading()"""
+        for engine, error in [
+            ("", ValueError),
+            ("typo", ValueError),
+        ]:
+            with self.assertRaises(error, msg=f"{engine=}"):
+                shadow.shading(aces=[], engine=engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unittest stats.py"""
+
+import threading
+import unittest
+
+from cisco_acl import ParseStats, aces, acls, addrgroups
+from cisco_acl import stats as stats_
+
+CONFIG = """
+hostname HOSTNAME
+
+object-group network AG1
+  host 10.0.0.1
+  10.0.1.0 255.255.255.0
+
+ip access-list extended ACL1
+  10 remark === C-1
+  20 permit tcp object-group AG1 eq 1 2 any eq www
+  30 permit ip 10.0.0.0 0.0.0.255 host 10.0.0.2
+ip access-list standard ACL2
+  10 permit 10.0.0.0 0.0.0.255
+  20 deny any
+
+interface Ethernet1
+  ip access-group ACL1 in
+"""
+
+
+class Test(unittest.TestCase):
+    """ParseStats"""
+
+    def test_valid__acls(self):
+        """acls(stats=ParseStats)"""
+        for kwargs, req in [
+            ({}, ["parse_sections", "interface_binding", "acl", "tokenize", "address",
+                  "addrgroup_binding"]),
+            (dict(group_by="=== "), ["parse_sections", "interface_binding", "acl", "tokenize",
+                                     "address", "addrgroup_binding", "group"]),
+        ]:
+            stats = ParseStats()
+            acls(CONFIG, stats=stats, **kwargs)
+            result = stats.data()
+            self.assertEqual(list(result), req, msg=f"{kwargs=}")
+            self.assertEqual(result["acl"]["calls"], 2, msg=f"{kwargs=}")
+            self.assertEqual(result["tokenize"]["calls"], 6, msg=f"{kwargs=}")
+            for phase, data in result.items():
+                self.assertGreaterEqual(data["seconds"], 0, msg=f"{phase=}")
+            self.assertIsNone(stats_._ACTIVE.get(), msg=f"{kwargs=}")
+
+    def test_valid__aces_addrgroups(self):
+        """aces(stats=ParseStats) addrgroups(stats=ParseStats)"""
+        stats = ParseStats()
+        aces(CONFIG, stats=stats)
+        self.assertEqual(stats.data()["tokenize"]["calls"], 6)
+        addrgroups(CONFIG, stats=stats)
+        self.assertEqual(stats.data()["parse_sections"]["calls"], 1)
+        calls = sum(d["calls"] for d in stats.data().values())
+        self.assertEqual(repr(stats), f"ParseStats(calls={calls})")
+
+        stats.clear()
+        self.assertEqual(stats.data(), {})
+
+    def test_valid__collect(self):
+        """ParseStats.collect() nested collectors"""
+        outer = ParseStats()
+        inner = ParseStats()
+        with outer.collect():
+            acls(CONFIG)
+            with inner.collect():
+                acls(CONFIG)
+            acls(CONFIG, stats=inner)
+            self.assertIs(stats_._ACTIVE.get(), outer)
+        self.assertIsNone(stats_._ACTIVE.get())
+        self.assertEqual(outer.data()["acl"]["calls"], 2)
+        self.assertEqual(inner.data()["acl"]["calls"], 4)
+
+        acls(CONFIG)
+        self.assertEqual(outer.data()["acl"]["calls"], 2)
+
+    def test_valid__threads(self):
+        """ParseStats.collect() overlapped in threads, A enters, B enters, A exits, B exits"""
+        stats1 = ParseStats()
+        stats2 = ParseStats()
+        b_entered = threading.Event()
+        a_exited = threading.Event()
+        actives = {}
+
+        def thread_a():
+            with stats1.collect():
+                b_entered.wait()
+            actives["a_exited"] = stats_._ACTIVE.get()
+            a_exited.set()
+
+        def thread_b():
+            with stats2.collect():
+                b_entered.set()
+                a_exited.wait()
+                actives["b_inside"] = stats_._ACTIVE.get()
+            actives["b_exited"] = stats_._ACTIVE.get()
+
+        threads = [threading.Thread(target=thread_a), threading.Thread(target=thread_b)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertEqual(actives, dict(a_exited=None, b_inside=stats2, b_exited=None))
+        self.assertIsNone(stats_._ACTIVE.get())
+
+        acls(CONFIG)
+        self.assertEqual(stats1.data(), {})
+        self.assertEqual(stats2.data(), {})
+
+    def test_invalid__stats(self):
+        """acls(stats=invalid)"""
+        for stats in ["stats", {}]:
+            with self.assertRaises(TypeError, msg=f"{stats=}"):
+                acls(CONFIG, stats=stats)
+        self.assertIsNone(stats_._ACTIVE.get())
+
+
+if __name__ == "__main__":
+    unittest.main()
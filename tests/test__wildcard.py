@@ -1,9 +1,14 @@
 """Unittest wildcard.py"""
 
+import pickle
+import random
 import unittest
+from ipaddress import IPv4Address
+from typing import Iterator
 
 import dictdiffer
 
+from cisco_acl import helpers as h
 from cisco_acl import wildcard
 from cisco_acl.wildcard import Wildcard
 from tests.helpers_test import (
@@ -225,6 +230,20 @@ class Test(Helpers):
             diff = list(dictdiffer.diff(first=result, second=req_d))
             self.assertEqual(diff, req_uuid, msg=f"{kwargs=}")
 
+    def test_valid__pickle(self):
+        """Wildcard.__getstate__() Wildcard.__setstate__()"""
+        for kwargs in [
+            dict(line=WILD30, platform="nxos", version="9.3"),
+            dict(line=WILD_NC3),
+        ]:
+            obj = Wildcard(**kwargs)
+            _ = obj.uuid  # generated uuid is pickled
+            result = pickle.loads(pickle.dumps(obj))
+            for attr in ["line", "ipnet", "prefix", "wildmask", "version", "uuid", "platform"]:
+                self.assertEqual(getattr(result, attr), getattr(obj, attr),
+                                 msg=f"{kwargs=} {attr=}")
+            self.assertEqual(result.ipnets(), obj.ipnets(), msg=f"{kwargs=}")
+
     def test_valid__ipnets(self):
         """Wildcard.ipnets()"""
         wild0 = "0.0.0.0 0.0.0.0"
@@ -243,6 +262,51 @@ class Test(Helpers):
             result = [str(o) for o in ipnets]
             self.assertEqual(result, req, msg=f"{line=}")
 
+    def test_valid__iter_ipnets(self):
+        """Wildcard.iter_ipnets()"""
+        for line in ["10.0.0.0 0.0.0.0", "0.0.0.0 1.1.1.3", "0.0.0.0 1.1.3.255"]:
+            obj = Wildcard(line)
+            result = obj.iter_ipnets()
+            self.assertIsInstance(result, Iterator, msg=f"{line=}")
+            self.assertEqual(list(result), obj.ipnets(), msg=f"{line=}")
+
+        obj = Wildcard("0.0.0.0 127.255.255.254", max_ncwb=30)
+        result = next(obj.iter_ipnets())
+        self.assertEqual(str(result), "0.0.0.0/32", msg="2^30 networks are not created")
+
+    def test_valid__ints(self):
+        """Wildcard.ints()"""
+        for line, req, in [
+            ("0.0.0.0 255.255.255.255", (0, 0xFFFFFFFF)),
+            ("10.0.0.1 0.0.0.0", (0x0A000001, 0)),
+            ("10.0.0.1 0.0.1.254", (0x0A000001, 0x1FE)),
+            ("10.0.0.255 0.0.0.3", (0x0A0000FC, 3)),
+        ]:
+            result = Wildcard(line).ints()
+            self.assertEqual(result, req, msg=f"{line=}")
+
+    def test_valid__subnet_of(self):
+        """Wildcard.subnet_of() Wildcard.overlaps() Wildcard.intersection()"""
+        for line1, line2, req_subnet, req_overlap, req_intersection in [
+            ("10.0.0.0 0.0.1.0", "10.0.0.0 0.0.1.3", True, True, "10.0.0.0 0.0.1.0"),
+            ("10.0.0.0 0.0.1.0", "10.0.0.0 0.0.0.3", False, True, "10.0.0.0 0.0.0.0"),
+            ("10.0.0.0 0.0.1.0", "10.0.1.0 0.0.0.255", False, True, "10.0.1.0 0.0.0.0"),
+            ("10.0.0.0 0.0.1.0", "10.0.2.0 0.0.0.255", False, False, ""),
+            ("10.0.0.0 0.0.1.255", "10.0.0.0 0.255.0.3", False, True, "10.0.0.0 0.0.0.3"),
+            ("10.0.0.0 0.255.255.254", "0.0.0.0 255.255.255.255", True, True,
+             "10.0.0.0 0.255.255.254"),
+            ("10.0.0.1 0.255.255.254", "10.0.0.0 0.255.255.254", False, False, ""),
+        ]:
+            obj1 = Wildcard(line1, max_ncwb=30)
+            obj2 = Wildcard(line2, max_ncwb=30)
+            result = obj1.subnet_of(obj2)
+            self.assertEqual(result, req_subnet, msg=f"{line1=} {line2=}")
+            result = obj1.overlaps(obj2)
+            self.assertEqual(result, req_overlap, msg=f"{line1=} {line2=}")
+            result = obj1.intersection(obj2)
+            self.assertEqual(result.line if result else "", req_intersection,
+                             msg=f"{line1=} {line2=}")
+
     # =========================== functions ============================
 
     def test_valid__init_max_ncwb(self):
@@ -331,6 +395,52 @@ class Test(Helpers):
             result = wildcard.is_mask(line)
             self.assertEqual(result, req, msg=f"{line=}")
 
+    def test_valid__subnet_of__ipnets(self):
+        """wildcard.subnet_of() wildcard.is_overlap() wildcard.intersection(), random
+        wildcards are compared with the result of expanded ipnets()"""
+        rand = random.Random(0)
+
+        def random_wildcard() -> Wildcard:
+            wildmask = 0
+            for _ in range(rand.randrange(6)):
+                wildmask |= 1 << rand.choice([0, 1, 2, 3, 8, 9, 16])
+            prefix = 0x0A000000 | rand.getrandbits(18)
+            return Wildcard(f"{IPv4Address(prefix)} {IPv4Address(wildmask)}")
+
+        for _ in range(3000):
+            tops = [random_wildcard() for _ in range(rand.randrange(4))]
+            bottoms = [random_wildcard() for _ in range(rand.randrange(1, 3))]
+            tops_ipnets = [i for o in tops for i in o.ipnets()]
+            bottoms_ipnets = [i for o in bottoms for i in o.ipnets()]
+            req = h.subnet_of(tops=tops_ipnets, bottoms=bottoms_ipnets)
+            result = wildcard.subnet_of(tops=[o.ints() for o in tops],
+                                        bottoms=[o.ints() for o in bottoms])
+            self.assertEqual(result, req, msg=f"{tops=} {bottoms=}")
+
+            obj1, obj2 = bottoms[0], random_wildcard()
+            addrs1 = {int(i) for o in obj1.ipnets() for i in o}
+            addrs2 = {int(i) for o in obj2.ipnets() for i in o}
+            result = wildcard.is_overlap(obj1.ints(), obj2.ints())
+            self.assertEqual(result, bool(addrs1 & addrs2), msg=f"{obj1=} {obj2=}")
+            intersection = wildcard.intersection(obj1.ints(), obj2.ints())
+            result_ = set()
+            if intersection:
+                line = f"{IPv4Address(intersection[0])} {IPv4Address(intersection[1])}"
+                result_ = {int(i) for o in Wildcard(line).ipnets() for i in o}
+            self.assertEqual(result_, addrs1 & addrs2, msg=f"{obj1=} {obj2=}")
+
+    def test_valid__subnet_of__large_ncwb(self):
+        """wildcard.subnet_of() non-contiguous wildcard with 30 bits is not expanded"""
+        top = Wildcard("0.0.0.0 127.255.255.254", max_ncwb=30).ints()
+        bottom = Wildcard("0.0.0.0 126.255.255.254", max_ncwb=30).ints()
+        self.assertTrue(wildcard.subnet_of(tops=[top], bottoms=[bottom]))
+        self.assertFalse(wildcard.subnet_of(tops=[bottom], bottoms=[top]))
+        tops = [(0, 0x7EFFFFFE), (0x01000000, 0x7EFFFFFE)]  # split by the bit 24
+        self.assertTrue(wildcard.subnet_of(tops=tops, bottoms=[top]))
+        self.assertFalse(wildcard.subnet_of(tops=tops[:1], bottoms=[top]))
+        self.assertFalse(wildcard.subnet_of(tops=[], bottoms=[top]))
+        self.assertFalse(wildcard.subnet_of(tops=[top], bottoms=[]))
+
 
 if __name__ == "__main__":
     unittest.main()